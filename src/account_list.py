@@ -0,0 +1,203 @@
+"""
+Account list model and view.
+AccountIndex keeps account names sorted and indexed (lowercase prefix list
+plus a trigram map) so filtering tens of thousands of names by prefix or
+substring takes a few milliseconds. AccountListView syncs a Treeview to the
+filtered names by diff, only inserting and deleting rows that changed, and
+only materializes rows a page at a time as the list is scrolled, with each
+account's recent launch success rate in its own column.
+"""
+
+import bisect
+from typing import Dict, Iterable, List, Set
+
+PAGE_SIZE = 500  # Rows inserted up front; more are added when scrolling near the end
+LOAD_MORE_AT = 0.9  # Scroll fraction that loads the next page
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class AccountIndex:
+    """Sorted account names with case-insensitive prefix and substring lookup."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._names: List[str] = []  # Sorted as displayed
+        self._lower: List[tuple] = []  # Sorted (lowercase name, name) for prefix bisection
+        self._trigrams: Dict[str, Set[str]] = {}
+        self.update(names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        index = bisect.bisect_left(self._names, name)
+        return index < len(self._names) and self._names[index] == name
+
+    @property
+    def names(self) -> List[str]:
+        return self._names
+
+    def add(self, name: str) -> None:
+        if name in self:
+            return
+        bisect.insort(self._names, name)
+        lower = name.lower()
+        bisect.insort(self._lower, (lower, name))
+        for gram in _trigrams(lower):
+            self._trigrams.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        index = bisect.bisect_left(self._names, name)
+        if index >= len(self._names) or self._names[index] != name:
+            return
+        del self._names[index]
+        lower = name.lower()
+        del self._lower[bisect.bisect_left(self._lower, (lower, name))]
+        for gram in _trigrams(lower):
+            bucket = self._trigrams.get(gram)
+            if bucket:
+                bucket.discard(name)
+                if not bucket:
+                    del self._trigrams[gram]
+
+    def update(self, names: Iterable[str]) -> None:
+        """
+        Make the index hold exactly these names, touching only the difference.
+        A bulk load (empty index) is sorted once instead of insorted name by name.
+        """
+        wanted = set(names)
+        if not self._names:
+            self._names = sorted(wanted)
+            self._lower = sorted((name.lower(), name) for name in wanted)
+            for lower, name in self._lower:
+                for gram in _trigrams(lower):
+                    self._trigrams.setdefault(gram, set()).add(name)
+            return
+        current = set(self._names)
+        for name in current - wanted:
+            self.remove(name)
+        for name in wanted - current:
+            self.add(name)
+
+    def search(self, query: str) -> List[str]:
+        """
+        Names matching query, case-insensitively.
+        Returns:
+            Prefix matches first, then other substring matches, each in display order
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self._names)
+        start = bisect.bisect_left(self._lower, (query,))
+        end = bisect.bisect_left(self._lower, (query + '\uffff',))
+        prefix = sorted(name for _, name in self._lower[start:end])
+        prefixed = set(prefix)
+        if len(query) >= 3:
+            candidates = None
+            for gram in sorted(_trigrams(query), key=lambda g: len(self._trigrams.get(g, ()))):
+                bucket = self._trigrams.get(gram)
+                if not bucket:
+                    return prefix
+                candidates = set(bucket) if candidates is None else candidates & bucket
+                if len(candidates) < 64:
+                    break
+            if len(candidates) < len(self._names) // 4:
+                others = sorted(name for name in candidates if name not in prefixed and query in name.lower())
+                return prefix + others
+        others = [name for name in self._names if name not in prefixed and query in name.lower()]
+        return prefix + others
+
+
+class AccountListView:
+    """
+    Treeview of accounts driven by an AccountIndex.
+    Rows use the account name as their item id, so a sync only deletes and
+    inserts the rows that differ from what is on screen; unchanged rows keep
+    their selection.
+    """
+
+    def __init__(self, tree, page_size: int = PAGE_SIZE):
+        self.tree = tree
+        self.page_size = page_size
+        self.index = AccountIndex()
+        self.query = ""
+        self._matches: List[str] = []
+        self._limit = page_size
+        self._shown: List[str] = []  # Row ids currently in the tree, in order
+        self._success: Dict[str, str] = {}  # {name: success column text}
+        self._scroll_set = None
+
+    def attach_scrollbar(self, scrollbar) -> None:
+        """Route the tree's yscrollcommand through the view so scrolling near the end loads more rows."""
+        self._scroll_set = scrollbar.set
+        self.tree.configure(yscrollcommand=self._on_scroll)
+
+    def _on_scroll(self, first, last) -> None:
+        if self._scroll_set:
+            self._scroll_set(first, last)
+        if float(last) >= LOAD_MORE_AT and len(self._shown) < len(self._matches):
+            self._limit += self.page_size
+            # Defer so the tree is not modified from inside its own scroll callback
+            self.tree.after_idle(self._render)
+
+    def set_accounts(self, names: Iterable[str]) -> None:
+        """Sync the index (and the visible rows) to the current account names."""
+        self.index.update(names)
+        self._refilter()
+
+    def set_query(self, query: str) -> None:
+        if query == self.query:
+            return
+        self.query = query
+        self._limit = self.page_size
+        self._refilter()
+        self.tree.yview_moveto(0)
+
+    def show_all_matches(self) -> List[str]:
+        """Materialize every row matching the filter (used before selecting all)."""
+        self._limit = max(self._limit, len(self._matches))
+        self._render()
+        return list(self._shown)
+
+    @property
+    def match_count(self) -> int:
+        return len(self._matches)
+
+    def has_success_label(self, name: str) -> bool:
+        return name in self._success
+
+    def set_success(self, labels: Dict[str, str]) -> None:
+        """Update the success column for these accounts; rows not on screen pick it up when inserted."""
+        shown = set(self._shown)
+        for name, label in labels.items():
+            if self._success.get(name) == label:
+                continue
+            self._success[name] = label
+            if name in shown:
+                self.tree.set(name, 'success', label)
+
+    def _refilter(self) -> None:
+        self._matches = self.index.search(self.query)
+        self._render()
+
+    def _render(self) -> None:
+        target = self._matches[:self._limit]
+        if target == self._shown:
+            return
+        wanted = set(target)
+        stale = [name for name in self._shown if name not in wanted]
+        kept_in_order = [name for name in self._shown if name in wanted]
+        kept = set(kept_in_order)
+        if kept_in_order != [name for name in target if name in kept]:
+            # Relative order changed (prefix matches are ranked first); rebuild rather than shuffle
+            stale, kept = self._shown, set()
+        if stale:
+            self.tree.delete(*stale)
+        # Kept rows are already in target order, so inserting the rest at their target positions is enough
+        for position, name in enumerate(target):
+            if name not in kept:
+                self.tree.insert('', position, iid=name, text=name,
+                                 values=("****", self._success.get(name, "-")))  # Masked cookie
+        self._shown = target
@@ -0,0 +1,194 @@
+"""
+asyncio front end for RobloxLauncher.
+Only queueing is async: waiting for a launch slot and for the Roblox
+process limit (the tasklist subprocess on Windows, asyncio.sleep between
+polls) happens on the event loop, so a queued launch costs a coroutine
+instead of an OS thread.
+
+The launch itself runs the launcher's own instrumented path,
+RobloxLauncher._timed_launch around launch_account_improved, on a small
+thread pool, so it produces the same spans, events, metrics and history
+rows as a sync launch. That thread is held for the whole launch: the auth
+ticket HTTP calls or browser automation, process verification, and the
+10 s wait for Roblox to initialize before the isolation is removed. The
+threaded path skips its own process-limit wait, which already happened on
+the loop.
+
+LocalStorage isolation swaps a single machine-wide directory, so launches
+are serialized on the isolation window, and the process limit is checked
+just before each launch enters it.
+
+Example:
+    launcher = AsyncRobloxLauncher()
+    results = asyncio.run(launcher.launch_batch(accounts, server_link))
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from launcher import RobloxLauncher
+
+DEFAULT_MAX_PENDING = 500
+DEFAULT_BLOCKING_WORKERS = 4
+
+
+class AsyncRobloxLauncher:
+    """
+    Async variant of the RobloxLauncher public API: launch_account,
+    launch_batch, stop_all_instances and get_status.
+    """
+
+    def __init__(self, launcher: Optional[RobloxLauncher] = None, callback=None,
+                 max_pending: int = DEFAULT_MAX_PENDING, blocking_workers: int = DEFAULT_BLOCKING_WORKERS):
+        """
+        Args:
+            launcher: RobloxLauncher to drive; a new one is created when omitted
+            callback: Optional callback function for status updates
+            max_pending: Launches allowed in flight at once; the rest wait their turn
+            blocking_workers: Threads for launches (each holds one for its whole run) and other blocking calls
+        """
+        self.launcher = launcher or RobloxLauncher(callback=callback)
+        self.max_pending = max_pending
+        self._blocking = ThreadPoolExecutor(max_workers=blocking_workers, thread_name_prefix="async-launch")
+        self._semaphore = None
+        self._isolation_lock = None
+        self._tasks = set()
+        self._results = {}  # {account_name: bool} for launches finished in the current batch
+        self._current = None  # Account inside the isolation window
+
+    def _log_status(self, message: str) -> None:
+        self.launcher._log_status(message)
+
+    def _ensure_primitives(self) -> None:
+        """Create loop-bound primitives lazily, inside the running loop."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_pending)
+            self._isolation_lock = asyncio.Lock()
+
+    async def _run_blocking(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._blocking, fn, *args)
+
+    async def count_roblox_processes(self) -> int:
+        """Count running Roblox processes without blocking the loop."""
+        if os.name != 'nt':
+            # No tasklist here; the launcher's own counter (or its override) decides
+            return await self._run_blocking(self.launcher._count_roblox_processes)
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'tasklist', '/FI', 'IMAGENAME eq RobloxPlayerBeta.exe',
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await proc.communicate()
+            if proc.returncode != 0:
+                return 0
+            return sum(1 for line in stdout.decode(errors='ignore').splitlines() if 'RobloxPlayerBeta.exe' in line)
+        except Exception as e:
+            self._log_status(f"Failed to count Roblox processes: {str(e)}")
+            return 0
+
+    async def _wait_for_process_limit(self) -> None:
+        while True:
+            current_count = await self.count_roblox_processes()
+            if current_count < self.launcher.max_roblox_processes:
+                return
+            self._log_status(f"⚠ Too many Roblox processes ({current_count}), waiting 5 seconds...")
+            await asyncio.sleep(5)
+
+    async def launch_account(self, account_name: str, cookie: str, server_link: str) -> bool:
+        """
+        Launch one account (browserless first, browser automation as fallback).
+        Returns:
+            True if Roblox was launched for the account
+        """
+        self._ensure_primitives()
+        async with self._semaphore:
+            async with self._isolation_lock:
+                await self._wait_for_process_limit()
+                self._current = account_name
+                try:
+                    success = await self._launch_isolated(account_name, cookie, server_link)
+                finally:
+                    self._current = None
+        self._results[account_name] = success
+        return success
+
+    async def _launch_isolated(self, account_name: str, cookie: str, server_link: str) -> bool:
+        """
+        Run the launcher's instrumented improved launch on the thread pool; the process
+        limit was already waited for on the loop.
+        If this coroutine is cancelled the launch still runs to the end (it owns the
+        LocalStorage isolation), and the isolation lock is held until it has.
+        """
+        launcher = self.launcher
+        launch = asyncio.get_running_loop().run_in_executor(
+            self._blocking, launcher._timed_launch, 'improved', account_name,
+            lambda: launcher.launch_account_improved(account_name, cookie, server_link, wait_for_limit=False))
+        try:
+            return bool(await asyncio.shield(launch))
+        except asyncio.CancelledError:
+            await asyncio.wait({launch})
+            raise
+        except Exception as e:
+            self._log_status(f"Async launch failed for {account_name}: {str(e)}")
+            return False
+
+    async def launch_batch(self, accounts_data: List[Tuple[str, str]], server_link: str) -> Dict[str, bool]:
+        """
+        Launch many accounts; dead cookies are dropped before anything starts.
+        Args:
+            accounts_data: List of (account_name, cookie)
+            server_link: Game or private-server link
+        Returns:
+            Dictionary {account_name: launched}
+        """
+        self._ensure_primitives()
+        self._results = {}
+        started = time.monotonic()
+        self._log_status(f"Starting async batch launch for {len(accounts_data)} accounts...")
+        valid_accounts = await self._run_blocking(self.launcher.filter_valid_accounts, accounts_data)
+        valid_accounts = await self._run_blocking(self.launcher.order_by_history, valid_accounts, 'improved')
+        if valid_accounts and self.launcher._extract_place_id(server_link) == "PRIVATE_SERVER":
+            await self._run_blocking(self.launcher._extract_place_and_link_code, server_link, valid_accounts[0][1])
+        tasks = {}
+        for account_name, cookie in valid_accounts:
+            task = asyncio.create_task(self.launch_account(account_name, cookie, server_link),
+                                       name=f"launch-{account_name}")
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            tasks[account_name] = task
+        results = {account_name: False for account_name, _ in accounts_data}
+        for account_name, task in tasks.items():
+            try:
+                results[account_name] = await task
+            except asyncio.CancelledError:
+                results[account_name] = False
+        success_count = sum(1 for launched in results.values() if launched)
+        self._log_status(f"Async batch completed: {success_count}/{len(accounts_data)} successful "
+                         f"in {time.monotonic() - started:.1f}s")
+        return results
+
+    async def stop_all_instances(self) -> int:
+        """Cancel pending launches, then stop every browser the launcher owns."""
+        pending = [task for task in self._tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        return await self._run_blocking(self.launcher.stop_all_instances)
+
+    def get_status(self) -> dict:
+        """Pending launches, the current batch's finished counts, and the wrapped launcher's status."""
+        finished = list(self._results.values())
+        return {
+            'pending_launches': sum(1 for task in self._tasks if not task.done()),
+            'launching': self._current,
+            'launched': sum(1 for launched in finished if launched),
+            'failed': sum(1 for launched in finished if not launched),
+            'launcher': self.launcher.get_status(),
+        }
+
+    def close(self) -> None:
+        self._blocking.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,166 @@
+"""
+Browserless launch support.
+Exchanges a .ROBLOSECURITY cookie for a one-time authentication ticket over
+HTTP and builds the roblox-player: URI that the client protocol handler
+expects, so no browser has to be started for a launch.
+"""
+
+import hashlib
+import os
+import random
+import threading
+import time
+import uuid
+from typing import Optional
+from urllib.parse import quote, urlencode
+
+from http_client import get_session
+
+DEFAULT_ENDPOINTS = {
+    'auth_ticket': "https://auth.roblox.com/v1/authentication-ticket",
+    'place_launcher': "https://www.roblox.com/Game/PlaceLauncher.ashx",
+    'resolve_share_link': "https://apis.roblox.com/sharelinks/v1/resolve-link",
+    'authenticated_user': "https://users.roblox.com/v1/users/authenticated",
+    'referer': "https://www.roblox.com/",
+}
+
+
+def load_endpoints(overrides: Optional[dict] = None) -> dict:
+    """
+    Build the endpoint table.
+    Each entry can be overridden with an RMAM_<NAME>_URL environment variable
+    (e.g. RMAM_AUTH_TICKET_URL) or through the overrides dict, which wins.
+    Args:
+        overrides: Optional {name: url} replacements
+    Returns:
+        Dictionary of endpoint URLs
+    """
+    endpoints = dict(DEFAULT_ENDPOINTS)
+    for name in DEFAULT_ENDPOINTS:
+        env_value = os.environ.get(f"RMAM_{name.upper()}_URL")
+        if env_value:
+            endpoints[name] = env_value
+    if overrides:
+        endpoints.update(overrides)
+    return endpoints
+
+
+class AuthTicketError(Exception):
+    """Raised when an authentication ticket can't be obtained."""
+
+
+class AuthTicketClient:
+    """
+    Fetches CSRF tokens and authentication tickets for .ROBLOSECURITY cookies.
+    CSRF tokens are cached per cookie and refreshed whenever the server
+    rejects them.
+    """
+
+    def __init__(self, session=None, endpoints: Optional[dict] = None):
+        self.session = session or get_session()
+        self.endpoints = load_endpoints(endpoints)
+        self._csrf_tokens = {}  # {cookie_digest: token}
+        self._lock = threading.Lock()
+
+    def _cookie_key(self, cookie: str) -> str:
+        return hashlib.sha256(cookie.encode()).hexdigest()[:16]
+
+    def _ticket_headers(self, csrf_token: Optional[str]) -> dict:
+        headers = {
+            'Referer': self.endpoints['referer'],
+            'Content-Type': 'application/json',
+            'RBXAuthenticationNegotiation': '1',
+        }
+        if csrf_token:
+            headers['X-CSRF-TOKEN'] = csrf_token
+        return headers
+
+    def fetch_csrf_token(self, cookie: str) -> str:
+        """
+        Get a CSRF token for the cookie; the ticket endpoint hands one out
+        in the x-csrf-token header of its 403 response.
+        Args:
+            cookie: Clean .ROBLOSECURITY value
+        Returns:
+            CSRF token string
+        """
+        response = self.session.post(self.endpoints['auth_ticket'], cookie=cookie,
+                                     headers=self._ticket_headers(None))
+        token = response.headers.get('x-csrf-token')
+        if not token:
+            if response.status_code == 401:
+                raise AuthTicketError("Cookie rejected (401 Unauthorized)")
+            raise AuthTicketError(f"No CSRF token returned (HTTP {response.status_code})")
+        with self._lock:
+            self._csrf_tokens[self._cookie_key(cookie)] = token
+        return token
+
+    def fetch_auth_ticket(self, cookie: str) -> str:
+        """
+        Exchange the cookie for a one-time authentication ticket.
+        Args:
+            cookie: Clean .ROBLOSECURITY value
+        Returns:
+            Authentication ticket string
+        """
+        with self._lock:
+            token = self._csrf_tokens.get(self._cookie_key(cookie))
+        if not token:
+            token = self.fetch_csrf_token(cookie)
+        for _ in range(2):
+            response = self.session.post(self.endpoints['auth_ticket'], cookie=cookie,
+                                         headers=self._ticket_headers(token))
+            ticket = response.headers.get('rbx-authentication-ticket')
+            if response.status_code == 200 and ticket:
+                return ticket
+            if response.status_code == 403 and response.headers.get('x-csrf-token'):
+                # Token expired; take the fresh one and retry once
+                token = response.headers['x-csrf-token']
+                with self._lock:
+                    self._csrf_tokens[self._cookie_key(cookie)] = token
+                continue
+            if response.status_code == 401:
+                raise AuthTicketError("Cookie rejected (401 Unauthorized)")
+            break
+        raise AuthTicketError(f"Authentication ticket request failed (HTTP {response.status_code})")
+
+
+def build_launch_uri(ticket: str, place_id: str, link_code: Optional[str] = None,
+                     job_id: Optional[str] = None, endpoints: Optional[dict] = None,
+                     browser_tracker_id: Optional[int] = None) -> str:
+    """
+    Build a roblox-player: launch URI.
+    Args:
+        ticket: Authentication ticket from AuthTicketClient
+        place_id: Place to join
+        link_code: Private server link code, if joining a private server
+        job_id: Specific server instance to join, if any
+        endpoints: Endpoint table (see load_endpoints)
+        browser_tracker_id: Tracker id; random when omitted
+    Returns:
+        roblox-player: URI string
+    """
+    endpoints = endpoints or load_endpoints()
+    tracker_id = browser_tracker_id or random.randint(100000000000, 999999999999)
+    if link_code:
+        params = {'request': 'RequestPrivateGame', 'placeId': place_id, 'linkCode': link_code}
+    elif job_id:
+        params = {'request': 'RequestGameJob', 'placeId': place_id, 'gameId': job_id}
+    else:
+        params = {'request': 'RequestGame', 'placeId': place_id, 'isPlayTogetherGame': 'false'}
+    params['browserTrackerId'] = tracker_id
+    params['joinAttemptId'] = str(uuid.uuid4())
+    params['joinAttemptOrigin'] = 'PlayButton'
+    place_launcher_url = f"{endpoints['place_launcher']}?{urlencode(params)}"
+    parts = [
+        "roblox-player:1",
+        "launchmode:play",
+        f"gameinfo:{ticket}",
+        f"launchtime:{int(time.time() * 1000)}",
+        f"placelauncherurl:{quote(place_launcher_url, safe='')}",
+        f"browsertrackerid:{tracker_id}",
+        "robloxLocale:en_us",
+        "gameLocale:en_us",
+        "channel:",
+    ]
+    return "+".join(parts)
@@ -0,0 +1,358 @@
+"""
+End-to-end launch benchmark with fakes.
+Runs a batch through the real launcher code on any OS by swapping in:
+- a fake WebDriver (fixed start-up and navigation latency, fires the
+  roblox-player protocol when the game page loads or Play is clicked)
+- a stub roblox-player protocol handler that spawns a dummy process after a
+  delay, plus a fake process table counting those processes
+- the stand-in Roblox web server for cookie checks and auth tickets
+- a temporary LOCALAPPDATA, instance directory, launch queue, launch
+  history, process-reaper state, browser cache and span file
+
+The launcher is built through runtime.get_launcher(), the entry point the
+GUI uses, so a startup hang there also hangs the benchmark.
+
+Reports accounts per minute and per-phase latency (p50/p95/p99).
+
+The launcher's fixed waits (Roblox init waits, poll intervals) are real
+sleeps; --time-scale shrinks every sleep in the launcher and the Tk launch
+loop for quick runs, so rates at a scale below 1 are not real-world numbers.
+
+Usage:
+    python benchmark.py [--accounts N] [--path improved|manager-browser|manager-direct|all]
+                        [--browser] [--time-scale S] [--profile]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from profiling import profile_batch
+
+GAME_LINK = "https://www.roblox.com/games/1818/Classic-Crossroads"
+SHARE_LINK = "https://www.roblox.com/share?code=benchmark&type=Server"
+
+
+class ScaledTime:
+    """Stand-in for the time module whose sleep() is scaled; everything else is the real module."""
+
+    def __init__(self, scale: float):
+        self.scale = scale
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(max(0.0, seconds * self.scale))
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class StubProtocolHandler:
+    """
+    Fake roblox-player handler: every opened URI starts a dummy long-lived
+    process after launch_delay seconds, standing in for RobloxPlayerBeta.
+    """
+
+    def __init__(self, clock, launch_delay: float = 2.0, lifetime: float = 600.0):
+        self.clock = clock
+        self.launch_delay = launch_delay
+        self.lifetime = lifetime
+        self.uris = []
+        self.processes = []
+        self._lock = threading.Lock()
+
+    def _spawn(self) -> None:
+        sleep_binary = shutil.which('sleep')
+        command = [sleep_binary, str(int(self.lifetime))] if sleep_binary else \
+            [sys.executable, '-c', f"import time; time.sleep({self.lifetime})"]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        with self._lock:
+            self.processes.append(process)
+
+    def open(self, uri: str) -> None:
+        with self._lock:
+            self.uris.append(uri)
+        timer = threading.Timer(self.launch_delay * self.clock.scale, self._spawn)
+        timer.daemon = True
+        timer.start()
+
+    def count(self) -> int:
+        """Fake process table: dummy clients that are still running."""
+        with self._lock:
+            return sum(1 for process in self.processes if process.poll() is None)
+
+    def close(self) -> None:
+        with self._lock:
+            for process in self.processes:
+                process.kill()
+            for process in self.processes:
+                process.wait()
+
+
+class FakeElement:
+    """Play button on the fake game page."""
+
+    def __init__(self, driver: "FakeWebDriver"):
+        self.driver = driver
+
+    def is_displayed(self) -> bool:
+        return True
+
+    def is_enabled(self) -> bool:
+        return True
+
+    def click(self) -> None:
+        self.driver._trigger_protocol()
+
+
+class FakeWebDriver:
+    """Just enough of a Selenium WebDriver for the launcher's browser paths."""
+
+    def __init__(self, handler: StubProtocolHandler, clock, navigation_seconds: float):
+        self.handler = handler
+        self.clock = clock
+        self.navigation_seconds = navigation_seconds
+        self.current_url = None
+        self.service = None  # No real driver process for the reaper to track
+        self._cookies = {}
+        self._triggered = False
+
+    def _trigger_protocol(self) -> None:
+        if not self._triggered and '.ROBLOSECURITY' in self._cookies:
+            self._triggered = True
+            self.handler.open(f"roblox-player:1+launchmode:play+gameinfo:{self.current_url}")
+
+    def get(self, url: str) -> None:
+        self.clock.sleep(self.navigation_seconds)
+        self.current_url = url
+        if '/games/' in url or '/share' in url:
+            self._trigger_protocol()
+
+    def add_cookie(self, cookie: dict) -> None:
+        self._cookies[cookie['name']] = cookie['value']
+
+    def get_cookies(self) -> List[dict]:
+        return [{'name': name, 'value': value} for name, value in self._cookies.items()]
+
+    def delete_all_cookies(self) -> None:
+        self._cookies.clear()
+
+    def execute_cdp_cmd(self, cmd: str, params: dict) -> dict:
+        return {}
+
+    def set_page_load_timeout(self, seconds: float) -> None:
+        pass
+
+    def find_element(self, by, value) -> FakeElement:
+        return FakeElement(self)
+
+    def quit(self) -> None:
+        pass
+
+
+class BenchmarkEnvironment:
+    """Temporary directories, stand-in services and a RobloxLauncher wired to the fakes."""
+
+    def __init__(self, accounts: int, time_scale: float = 1.0, browser: bool = False,
+                 driver_start_seconds: float = 1.5, navigation_seconds: float = 1.0,
+                 client_start_seconds: float = 2.0, http_limit: Optional[tuple] = None):
+        self.accounts = [(f"bench{i:04d}", f"cookie{i:04d}") for i in range(accounts)]
+        self.clock = ScaledTime(time_scale)
+        self.browser = browser
+        self.driver_start_seconds = driver_start_seconds
+        self.navigation_seconds = navigation_seconds
+        self.client_start_seconds = client_start_seconds
+        self.http_limit = http_limit
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix="rmam_bench_"))
+        self._saved = {}
+
+    def __enter__(self):
+        import http_client
+        import launch_history
+        import launch_queue
+        import telemetry
+        from standin_server import StandInRobloxServer
+        self._saved['LOCALAPPDATA'] = os.environ.get('LOCALAPPDATA')
+        os.environ['LOCALAPPDATA'] = str(self.tmp_dir / "LocalAppData")
+        self._saved['queue'] = launch_queue._queue
+        launch_queue._queue = launch_queue.LaunchQueue(str(self.tmp_dir / "launch_queue.db"))
+        self._saved['history'] = launch_history._history
+        launch_history._history = launch_history.LaunchHistory(str(self.tmp_dir / "launch_history.db"))
+        self._saved['spans_path'] = telemetry.get_recorder().path
+        self.spans_path = str(self.tmp_dir / "launch_spans.jsonl")
+        telemetry.get_recorder().path = self.spans_path
+
+        share_code = SHARE_LINK.split('code=')[1].split('&')[0]
+        self.server = StandInRobloxServer(valid_cookies=[cookie for _, cookie in self.accounts],
+                                          share_links={share_code: ('1818', 'benchlink')}).start()
+        # Pace the stand-in like the strictest real Roblox host unless told otherwise
+        host = self.server.base_url.split('://', 1)[1]
+        limit = self.http_limit or http_client.HOST_LIMITS['auth.roblox.com']
+        http_client.get_session().rate_limiter.host_limits[host] = limit
+        self.handler = StubProtocolHandler(self.clock, launch_delay=self.client_start_seconds)
+        self.launcher = self._build_launcher()
+        return self
+
+    def _build_launcher(self):
+        import launcher as launcher_module
+        import process_reaper
+        import runtime
+        import storage as storage_module
+        launcher_module.time = self.clock
+        storage_module.time = self.clock
+        # Everything RobloxLauncher.__init__ touches on disk points at tmp_dir before it runs
+        self._saved['instances_dir'] = storage_module.INSTANCES_DIR
+        storage_module.INSTANCES_DIR = self.tmp_dir / "roblox_instances"
+        self._saved['reaper'] = process_reaper._reaper
+        process_reaper._reaper = process_reaper.ProcessReaper(str(self.tmp_dir / "spawned_processes.json"))
+        process_reaper._reaper.start()
+        browser_cache = self.tmp_dir / "browser_cache.json"
+        browser_cache.write_text(json.dumps({'browser': 'chrome', 'detected_at': time.time()}), encoding='utf-8')
+        self._saved['detector'] = runtime._detector
+        runtime._detector = runtime.BrowserDetector(cache_file=str(browser_cache))
+        # Built through the same entry point AccountManager uses
+        self._saved['launcher'] = runtime._launcher
+        runtime._launcher = None
+        launcher = runtime.get_launcher(callback=lambda message: None)
+        launcher.endpoints = self.server.endpoints
+        launcher.browserless_launch = not self.browser
+        launcher._count_roblox_processes = self.handler.count
+        launcher._open_protocol_uri = self.handler.open
+        launcher.link_resolver.cache_file = str(self.tmp_dir / "link_cache.json")
+
+        def setup_fake_driver(browser_type=None, cookie=None, account_name=None):
+            self.clock.sleep(self.driver_start_seconds)
+            driver = FakeWebDriver(self.handler, self.clock, self.navigation_seconds)
+            launcher.active_drivers.append(driver)
+            if cookie:
+                driver.add_cookie({'name': '.ROBLOSECURITY', 'value': cookie})
+                launcher.cookie_seeded_drivers.add(driver)
+            return driver
+        launcher._setup_browser_driver = setup_fake_driver
+        return launcher
+
+    def __exit__(self, exc_type, exc, tb):
+        import launch_history
+        import launch_queue
+        import launcher as launcher_module
+        import process_reaper
+        import runtime
+        import storage as storage_module
+        import telemetry
+        launcher_module.time = time
+        storage_module.time = time
+        storage_module.INSTANCES_DIR = self._saved['instances_dir']
+        process_reaper._reaper.stop()
+        process_reaper._reaper = self._saved['reaper']
+        runtime._detector = self._saved['detector']
+        runtime._launcher = self._saved['launcher']
+        self.handler.close()
+        self.server.stop()
+        launch_queue._queue.close()
+        launch_queue._queue = self._saved['queue']
+        launch_history._history.close()
+        launch_history._history = self._saved['history']
+        telemetry.get_recorder().path = self._saved['spans_path']
+        if self._saved['LOCALAPPDATA'] is None:
+            os.environ.pop('LOCALAPPDATA', None)
+        else:
+            os.environ['LOCALAPPDATA'] = self._saved['LOCALAPPDATA']
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def report(self, path: str, elapsed: float, launched: int) -> dict:
+        import telemetry
+        return {
+            'path': path,
+            'accounts': len(self.accounts),
+            'launched': launched,
+            'elapsed_seconds': round(elapsed, 2),
+            'accounts_per_minute': round(launched / elapsed * 60, 2) if elapsed else None,
+            'time_scale': self.clock.scale,
+            'phases': telemetry.summarize(telemetry.load_spans(self.spans_path)),
+        }
+
+
+def run_improved(env: BenchmarkEnvironment, server_link: str = GAME_LINK) -> dict:
+    """Benchmark RobloxLauncher.launch_multiple_accounts_improved."""
+    started = time.perf_counter()
+    launched = env.launcher.launch_multiple_accounts_improved(env.accounts, server_link).result()
+    return env.report('improved', time.perf_counter() - started, launched)
+
+
+def run_manager(env: BenchmarkEnvironment, launch_method: str) -> dict:
+    """
+    Benchmark the AccountManager launch loop without building the Tk window.
+    The manager gets its launcher from runtime.get_launcher(), as AccountManager.__init__ does.
+    """
+    import main as main_module
+    main_module.time = env.clock
+    try:
+        manager = main_module.AccountManager.__new__(main_module.AccountManager)
+        manager.roblox_launcher = main_module.get_launcher()
+        manager.update_status = lambda message: None
+        manager.active_account_launches = set()
+        server_link = SHARE_LINK if launch_method == "Direct Join" else GAME_LINK
+        started = time.perf_counter()
+        manager.run_launch_sequence(list(env.accounts), server_link, launch_method)
+        elapsed = time.perf_counter() - started
+    finally:
+        main_module.time = time
+    launched = len(env.handler.uris)
+    path = 'manager-direct' if launch_method == "Direct Join" else 'manager-browser'
+    return env.report(path, elapsed, launched)
+
+
+def format_report(report: dict) -> str:
+    import telemetry
+    lines = [
+        f"{report['path']}: {report['launched']}/{report['accounts']} launched in {report['elapsed_seconds']}s "
+        f"-> {report['accounts_per_minute']} accounts/min (time scale {report['time_scale']})",
+        telemetry.format_summary(report['phases']),
+    ]
+    if 'profile' in report:
+        lines.append(f"profile: {report['profile']['report']} ({report['profile']['stats']})")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batch launches against fakes")
+    parser.add_argument('--accounts', type=int, default=10)
+    parser.add_argument('--path', choices=['improved', 'manager-browser', 'manager-direct', 'all'], default='improved')
+    parser.add_argument('--browser', action='store_true', help='force the browser path instead of auth tickets')
+    parser.add_argument('--time-scale', type=float, default=1.0, help='multiply every launcher sleep by this')
+    parser.add_argument('--driver-start', type=float, default=1.5, help='fake browser start-up seconds')
+    parser.add_argument('--navigation', type=float, default=1.0, help='fake page-load seconds')
+    parser.add_argument('--client-start', type=float, default=2.0, help='seconds until the dummy client appears')
+    parser.add_argument('--profile', action='store_true', help='save a cProfile/tracemalloc capture per path')
+    parser.add_argument('--json', action='store_true', help='print the reports as JSON')
+    args = parser.parse_args(argv)
+
+    paths = ['improved', 'manager-browser', 'manager-direct'] if args.path == 'all' else [args.path]
+    reports = []
+    for path in paths:
+        with BenchmarkEnvironment(args.accounts, time_scale=args.time_scale, browser=args.browser,
+                                  driver_start_seconds=args.driver_start, navigation_seconds=args.navigation,
+                                  client_start_seconds=args.client_start) as env:
+            with profile_batch(args.profile, f"benchmark-{path}") as profiler:
+                if path == 'improved':
+                    reports.append(run_improved(env))
+                else:
+                    reports.append(run_manager(env, "Direct Join" if path == 'manager-direct' else "Browser + Play Button"))
+            if profiler:
+                reports[-1]['profile'] = {'stats': profiler.stats_path, 'report': profiler.report_path}
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print("\n\n".join(format_report(report) for report in reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""
+Pre-navigation .ROBLOSECURITY seeding.
+Puts the auth cookie into the browser before the first page load so the
+first and only navigation can go straight to the game or share link:
+- Chrome/Edge: CDP Network.setCookie on the fresh session
+- Firefox: a prebuilt profile whose cookies.sqlite already holds the cookie
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from typing import Optional
+
+COOKIE_DOMAIN = '.roblox.com'
+COOKIE_LIFETIME = 30 * 24 * 3600
+
+# Schema version 12 of Firefox's cookie store; newer Firefox versions migrate it on open
+_FIREFOX_COOKIE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS moz_cookies (
+    id INTEGER PRIMARY KEY,
+    originAttributes TEXT NOT NULL DEFAULT '',
+    name TEXT,
+    value TEXT,
+    host TEXT,
+    path TEXT,
+    expiry INTEGER,
+    lastAccessed INTEGER,
+    creationTime INTEGER,
+    isSecure INTEGER,
+    isHttpOnly INTEGER,
+    inBrowserElement INTEGER DEFAULT 0,
+    sameSite INTEGER DEFAULT 0,
+    rawSameSite INTEGER DEFAULT 0,
+    schemeMap INTEGER DEFAULT 0,
+    CONSTRAINT moz_uniqueid UNIQUE (name, host, path, originAttributes)
+)
+"""
+_FIREFOX_COOKIE_SCHEMA_VERSION = 12
+
+
+def seed_cookie_cdp(driver, cookie: str) -> bool:
+    """
+    Set .ROBLOSECURITY through the DevTools protocol before any navigation.
+    Args:
+        driver: Chrome or Edge WebDriver
+        cookie: Clean .ROBLOSECURITY value
+    Returns:
+        True if the browser accepted the cookie
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        result = driver.execute_cdp_cmd('Network.setCookie', {
+            'name': '.ROBLOSECURITY',
+            'value': cookie,
+            'domain': COOKIE_DOMAIN,
+            'path': '/',
+            'secure': True,
+            'httpOnly': True,
+            'expires': int(time.time()) + COOKIE_LIFETIME,
+        })
+        # Older Chromium returns {'success': bool}; newer returns {}
+        return result.get('success', True) if isinstance(result, dict) else True
+    except Exception as e:
+        print(f"CDP cookie seeding failed: {e}")
+        return False
+
+
+def write_firefox_cookie_store(profile_dir: str, cookie: str) -> None:
+    """
+    Write (or update) .ROBLOSECURITY in a Firefox profile's cookies.sqlite.
+    Args:
+        profile_dir: Firefox profile directory
+        cookie: Clean .ROBLOSECURITY value
+    """
+    now_us = int(time.time() * 1_000_000)
+    conn = sqlite3.connect(os.path.join(profile_dir, 'cookies.sqlite'))
+    try:
+        conn.execute(_FIREFOX_COOKIE_SCHEMA)
+        if conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            conn.execute(f"PRAGMA user_version = {_FIREFOX_COOKIE_SCHEMA_VERSION}")
+        conn.execute(
+            "INSERT OR REPLACE INTO moz_cookies "
+            "(originAttributes, name, value, host, path, expiry, lastAccessed, creationTime, isSecure, isHttpOnly, sameSite, rawSameSite, schemeMap) "
+            "VALUES ('', '.ROBLOSECURITY', ?, ?, '/', ?, ?, ?, 1, 1, 0, 0, 2)",
+            (cookie, COOKIE_DOMAIN, int(time.time()) + COOKIE_LIFETIME, now_us, now_us),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def build_firefox_cookie_profile(cookie: str, profile_dir: Optional[str] = None) -> str:
+    """
+    Create a Firefox profile directory whose cookie store already holds the cookie.
+    Args:
+        cookie: Clean .ROBLOSECURITY value
+        profile_dir: Existing directory to use; a temporary one is created when omitted
+    Returns:
+        Path to the profile directory
+    """
+    created = profile_dir is None
+    profile_dir = profile_dir or tempfile.mkdtemp(prefix="rmam_ff_")
+    try:
+        os.makedirs(profile_dir, exist_ok=True)
+        write_firefox_cookie_store(profile_dir, cookie)
+        return profile_dir
+    except Exception:
+        if created:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        raise
@@ -0,0 +1,106 @@
+"""
+Pre-flight .ROBLOSECURITY validation.
+Checks every account's cookie concurrently against the authenticated-user
+endpoint before a batch starts, and caches the verdict per account so dead
+accounts are dropped without ever starting a browser.
+"""
+
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+from auth_ticket import load_endpoints
+from http_client import get_session
+
+VALIDATION_TTL = 10 * 60
+MAX_WORKERS = 8
+
+
+class CookieValidator:
+    """
+    Validates cookies over the shared HTTP session with a small thread pool.
+    Results are cached per (account, cookie) for ttl_seconds; a changed
+    cookie for the same account is always re-checked.
+    """
+
+    def __init__(self, session=None, endpoints: Optional[dict] = None,
+                 ttl_seconds: int = VALIDATION_TTL, max_workers: int = MAX_WORKERS):
+        self.session = session or get_session()
+        self.endpoints = load_endpoints(endpoints)
+        self.ttl_seconds = ttl_seconds
+        self.max_workers = max_workers
+        self._cache = {}  # {account_name: (cookie_digest, valid, checked_at, user)}
+        self._lock = threading.Lock()
+
+    def _digest(self, cookie: str) -> str:
+        return hashlib.sha256(cookie.encode()).hexdigest()
+
+    def cached_result(self, account_name: str, cookie: str) -> Optional[bool]:
+        """Return the cached verdict if it is still fresh, else None."""
+        with self._lock:
+            entry = self._cache.get(account_name)
+        if not entry:
+            return None
+        digest, valid, checked_at, _ = entry
+        if digest != self._digest(cookie) or time.time() - checked_at >= self.ttl_seconds:
+            return None
+        return valid
+
+    def check(self, account_name: str, cookie: str) -> Optional[bool]:
+        """
+        Check a single cookie, using the cache when possible.
+        Args:
+            account_name: Account the cookie belongs to
+            cookie: Clean .ROBLOSECURITY value
+        Returns:
+            True if valid, False if rejected, None if the check itself failed
+        """
+        cached = self.cached_result(account_name, cookie)
+        if cached is not None:
+            return cached
+        try:
+            response = self.session.get(self.endpoints['authenticated_user'], cookie=cookie)
+        except Exception as e:
+            print(f"Cookie check failed for {account_name}: {e}")
+            return None
+        if response.status_code == 200:
+            valid, user = True, response.json()
+        elif response.status_code == 401:
+            valid, user = False, None
+        else:
+            # Server trouble tells us nothing about the cookie; don't cache it
+            return None
+        with self._lock:
+            self._cache[account_name] = (self._digest(cookie), valid, time.time(), user)
+        return valid
+
+    def check_many(self, accounts: List[Tuple[str, str]]) -> dict:
+        """
+        Check many cookies concurrently.
+        Args:
+            accounts: List of (account_name, clean_cookie)
+        Returns:
+            Dictionary {account_name: True/False/None}
+        """
+        results = {}
+        pending = []
+        for account_name, cookie in accounts:
+            cached = self.cached_result(account_name, cookie)
+            if cached is None:
+                pending.append((account_name, cookie))
+            else:
+                results[account_name] = cached
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending)),
+                                    thread_name_prefix="cookie-check") as executor:
+                futures = {name: executor.submit(self.check, name, cookie) for name, cookie in pending}
+                for name, future in futures.items():
+                    results[name] = future.result()
+        return results
+
+    def invalidate(self, account_name: str) -> None:
+        """Forget the cached verdict for an account."""
+        with self._lock:
+            self._cache.pop(account_name, None)
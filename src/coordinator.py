@@ -0,0 +1,540 @@
+"""
+Multi-node launch coordinator.
+The coordinator holds a batch of accounts and serves a small HTTP API; worker
+nodes heartbeat their capacity (free RAM, live Roblox clients) and claim
+shards sized by that capacity, launch them locally and report back. Accounts
+held by a worker that stops heartbeating go back to the queue, and results
+from every worker are aggregated per batch.
+
+Cookies travel from the coordinator to the workers in claim responses. The
+coordinator therefore only binds a non-loopback address when TLS is configured
+(--tls-cert/--tls-key) and the shared token is set explicitly via
+RMAM_COORDINATOR_TOKEN, and workers refuse plain http:// to anything but
+loopback.
+
+Usage:
+    python coordinator.py run <link> <account> [account ...] [--host H] [--port N] [--tls-cert F --tls-key F]
+    python coordinator.py worker <coordinator_url> --token T [--ca-file F] [--max-clients N] [--simulate]
+    python coordinator.py demo [--workers 3] [--accounts 20] [--kill-one]
+"""
+
+import argparse
+import hmac
+import ipaddress
+import itertools
+import json
+import os
+import random
+import secrets
+import ssl
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+HEARTBEAT_INTERVAL = 2.0
+HEARTBEAT_TIMEOUT = 6.0  # A worker silent for this long is considered lost
+RAM_PER_CLIENT_MB = 700  # Rough working set of one Roblox client
+TOKEN_ENV = "RMAM_COORDINATOR_TOKEN"
+
+
+def is_loopback(host: str) -> bool:
+    """True for localhost and loopback IP addresses."""
+    if host.lower() == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host.strip('[]')).is_loopback
+    except ValueError:
+        return False
+
+
+def worker_capacity(report: dict, in_flight: int = 0) -> int:
+    """
+    Launch slots a worker can take right now.
+    Args:
+        report: Heartbeat with free_ram_mb, live_clients and max_clients
+        in_flight: Accounts already assigned to it and not yet reported
+    """
+    by_ram = int(report.get('free_ram_mb', 0) // RAM_PER_CLIENT_MB)
+    by_slots = report.get('max_clients', 0) - report.get('live_clients', 0)
+    return max(0, min(by_ram, by_slots) - in_flight)
+
+
+def plan_shards(pending: int, capacities: Dict[str, int]) -> Dict[str, int]:
+    """
+    Split pending accounts across workers in proportion to capacity.
+    Uses largest remainders so the shares add up, and never exceeds a
+    worker's capacity.
+    """
+    total = sum(capacities.values())
+    if pending <= 0 or total <= 0:
+        return {worker_id: 0 for worker_id in capacities}
+    to_assign = min(pending, total)
+    exact = {worker_id: to_assign * capacity / total for worker_id, capacity in capacities.items()}
+    shares = {worker_id: int(value) for worker_id, value in exact.items()}
+    leftover = to_assign - sum(shares.values())
+    for worker_id in sorted(exact, key=lambda w: exact[w] - shares[w], reverse=True)[:leftover]:
+        shares[worker_id] += 1
+    return {worker_id: min(share, capacities[worker_id]) for worker_id, share in shares.items()}
+
+
+class LaunchCoordinator:
+    """
+    Batch state, worker registry and the worker-facing HTTP API.
+    Account states: pending -> assigned -> launched / failed.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, token: Optional[str] = None,
+                 heartbeat_timeout: float = HEARTBEAT_TIMEOUT, certfile: Optional[str] = None,
+                 keyfile: Optional[str] = None):
+        """
+        Args:
+            host: Bind address; anything but loopback requires certfile and an explicit token
+            port: Port to listen on (0 picks a free one)
+            token: Shared secret workers must send; generated when omitted (loopback only)
+            heartbeat_timeout: Seconds of silence before a worker's accounts are re-queued
+            certfile: TLS certificate (PEM) to serve HTTPS with
+            keyfile: Private key for certfile, if not in the same file
+        """
+        if not is_loopback(host) and not (certfile and token):
+            raise ValueError(f"Refusing to serve cookies on {host}: a non-loopback coordinator needs "
+                             f"TLS (certfile) and a shared token ({TOKEN_ENV})")
+        self.token = token or secrets.token_urlsafe(24)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.workers = {}  # {worker_id: {'report': {...}, 'last_seen': float, 'lost': bool}}
+        self.batches = {}  # {batch_id: {'server_link': str, 'accounts': {name: entry}}}
+        self._pending = []  # [(batch_id, account_name)] in launch order
+        self._batch_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._stop = threading.Event()
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._tls = certfile is not None
+        if self._tls:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.minimum_version = ssl.TLSVersion.TLSv1_2
+            context.load_cert_chain(certfile, keyfile)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"{'https' if self._tls else 'http'}://{host}:{port}"
+
+    def log(self, message: str) -> None:
+        print(f"[Coordinator] {message}")
+
+    def submit_batch(self, accounts_data: List[Tuple[str, str]], server_link: str) -> int:
+        """
+        Queue accounts for launch across the workers.
+        Args:
+            accounts_data: List of (account_name, cookie)
+            server_link: Game or private-server link
+        Returns:
+            Batch id
+        """
+        with self._lock:
+            batch_id = next(self._batch_ids)
+            self.batches[batch_id] = {'server_link': server_link, 'accounts': {
+                name: {'cookie': cookie, 'state': 'pending', 'worker': None, 'attempts': 0, 'error': None}
+                for name, cookie in accounts_data
+            }}
+            self._pending.extend((batch_id, name) for name, _ in accounts_data)
+        self.log(f"Batch {batch_id}: {len(accounts_data)} accounts queued")
+        return batch_id
+
+    def heartbeat(self, worker_id: str, report: dict) -> None:
+        with self._lock:
+            worker = self.workers.setdefault(worker_id, {'report': {}, 'last_seen': 0.0, 'lost': False})
+            if worker['lost']:
+                self.log(f"Worker {worker_id} is back")
+            worker.update(report=report, last_seen=time.monotonic(), lost=False)
+
+    def _in_flight(self, worker_id: str) -> int:
+        return sum(1 for batch in self.batches.values() for entry in batch['accounts'].values()
+                   if entry['state'] == 'assigned' and entry['worker'] == worker_id)
+
+    def claim(self, worker_id: str) -> List[dict]:
+        """
+        Hand a worker its capacity-proportional share of the pending accounts.
+        Returns:
+            List of {'batch_id', 'account_name', 'cookie', 'server_link'}
+        """
+        with self._lock:
+            worker = self.workers.get(worker_id)
+            if not worker or worker['lost'] or not self._pending:
+                return []
+            capacities = {
+                wid: worker_capacity(info['report'], self._in_flight(wid))
+                for wid, info in self.workers.items() if not info['lost']
+            }
+            share = plan_shards(len(self._pending), capacities).get(worker_id, 0)
+            if share <= 0 and capacities.get(worker_id, 0) > 0:
+                share = 1  # Rounding must not starve a worker that has room
+            claimed, self._pending = self._pending[:share], self._pending[share:]
+            assignments = []
+            for batch_id, name in claimed:
+                batch = self.batches[batch_id]
+                entry = batch['accounts'][name]
+                entry.update(state='assigned', worker=worker_id, attempts=entry['attempts'] + 1)
+                assignments.append({'batch_id': batch_id, 'account_name': name,
+                                    'cookie': entry['cookie'], 'server_link': batch['server_link']})
+        if assignments:
+            self.log(f"Worker {worker_id} claimed {len(assignments)} account(s)")
+        return assignments
+
+    def report_result(self, worker_id: str, batch_id: int, account_name: str,
+                      success: bool, error: Optional[str] = None) -> bool:
+        """Record a launch outcome; late reports for re-queued accounts are ignored."""
+        with self._lock:
+            entry = self.batches.get(batch_id, {}).get('accounts', {}).get(account_name)
+            if not entry or entry['state'] != 'assigned' or entry['worker'] != worker_id:
+                return False
+            entry.update(state='launched' if success else 'failed', error=error)
+            self._done.notify_all()
+        return True
+
+    def _requeue_lost_workers(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            for worker_id, info in self.workers.items():
+                if info['lost'] or now - info['last_seen'] < self.heartbeat_timeout:
+                    continue
+                info['lost'] = True
+                requeued = []
+                for batch_id, batch in self.batches.items():
+                    for name, entry in batch['accounts'].items():
+                        if entry['state'] == 'assigned' and entry['worker'] == worker_id:
+                            entry.update(state='pending', worker=None)
+                            requeued.append((batch_id, name))
+                self._pending[:0] = requeued
+                self.log(f"Worker {worker_id} stopped heartbeating; re-queued {len(requeued)} account(s)")
+
+    def _monitor(self) -> None:
+        while not self._stop.wait(self.heartbeat_timeout / 3):
+            self._requeue_lost_workers()
+
+    def batch_results(self, batch_id: int) -> dict:
+        """Aggregate state of a batch across all workers."""
+        with self._lock:
+            accounts = self.batches[batch_id]['accounts']
+            summary = {'launched': [], 'failed': {}, 'pending': [], 'assigned': {}}
+            for name, entry in accounts.items():
+                if entry['state'] == 'launched':
+                    summary['launched'].append(name)
+                elif entry['state'] == 'failed':
+                    summary['failed'][name] = entry['error']
+                elif entry['state'] == 'assigned':
+                    summary['assigned'][name] = entry['worker']
+                else:
+                    summary['pending'].append(name)
+            summary['by_worker'] = {}
+            for entry in accounts.values():
+                if entry['state'] in ('launched', 'failed'):
+                    summary['by_worker'][entry['worker']] = summary['by_worker'].get(entry['worker'], 0) + 1
+        return summary
+
+    def wait_for_batch(self, batch_id: int, timeout: Optional[float] = None) -> dict:
+        """Block until every account in the batch has launched or failed."""
+        deadline = time.monotonic() + timeout if timeout else None
+        with self._lock:
+            while any(entry['state'] in ('pending', 'assigned')
+                      for entry in self.batches[batch_id]['accounts'].values()):
+                remaining = deadline - time.monotonic() if deadline else 1.0
+                if remaining <= 0:
+                    break
+                self._done.wait(min(remaining, 1.0))
+        return self.batch_results(batch_id)
+
+    def _make_handler(self):
+        coordinator = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body=None) -> None:
+                payload = json.dumps(body if body is not None else {}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Worker went away mid-request; the heartbeat monitor deals with it
+
+            def do_POST(self):
+                header = self.headers.get('Authorization') or ''
+                if not hmac.compare_digest(header, f"Bearer {coordinator.token}"):
+                    self._send(401, {'error': 'Missing or invalid token'})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                    worker_id = body['worker_id']
+                    path = self.path.split('?')[0]
+                    if path == '/heartbeat':
+                        coordinator.heartbeat(worker_id, body.get('report') or {})
+                        self._send(200, {'ok': True})
+                    elif path == '/claim':
+                        self._send(200, {'assignments': coordinator.claim(worker_id)})
+                    elif path == '/result':
+                        accepted = coordinator.report_result(worker_id, body['batch_id'], body['account_name'],
+                                                             bool(body.get('success')), body.get('error'))
+                        self._send(200, {'accepted': accepted})
+                    else:
+                        self._send(404, {'error': 'Not found'})
+                except (KeyError, ValueError) as e:
+                    self._send(400, {'error': f"Bad request: {e}"})
+
+        return Handler
+
+    def start(self) -> "LaunchCoordinator":
+        threading.Thread(target=self._server.serve_forever, daemon=True, name="coordinator-http").start()
+        threading.Thread(target=self._monitor, daemon=True, name="coordinator-monitor").start()
+        self.log(f"Listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def local_capacity_report(max_clients: int) -> dict:
+    """Free RAM and live Roblox client count on this machine."""
+    import psutil
+    live = 0
+    for proc in psutil.process_iter(['name']):
+        try:
+            if (proc.info['name'] or '').lower().startswith('robloxplayerbeta'):
+                live += 1
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return {
+        'free_ram_mb': psutil.virtual_memory().available / (1024 * 1024),
+        'live_clients': live,
+        'max_clients': max_clients,
+    }
+
+
+def _instrumented_launch_fn() -> Callable[[str, str, str], bool]:
+    """Improved launch on a local RobloxLauncher, wrapped in its launch span, events and history."""
+    from launcher import RobloxLauncher
+    launcher = RobloxLauncher()
+
+    def launch(account_name: str, cookie: str, server_link: str) -> bool:
+        return launcher._timed_launch('improved', account_name,
+                                      lambda: launcher.launch_account_improved(account_name, cookie, server_link))
+    return launch
+
+
+class LaunchWorker:
+    """
+    Worker node: heartbeats capacity, claims shards and launches them in order.
+    launch_fn(account_name, cookie, server_link) -> bool does the actual launch;
+    by default it is RobloxLauncher.launch_account_improved run through
+    _timed_launch, so remote launches show up in spans, metrics and history.
+    """
+
+    def __init__(self, coordinator_url: str, token: str, worker_id: Optional[str] = None,
+                 max_clients: int = 10, launch_fn: Optional[Callable[[str, str, str], bool]] = None,
+                 report_fn: Optional[Callable[[], dict]] = None, interval: float = HEARTBEAT_INTERVAL,
+                 ca_file: Optional[str] = None):
+        url = urlparse(coordinator_url)
+        if url.scheme != 'https' and not is_loopback(url.hostname or ''):
+            raise ValueError(f"Refusing to receive cookies over plain HTTP from {url.hostname}; use https://")
+        self.coordinator_url = coordinator_url.rstrip('/')
+        self._ssl_context = ssl.create_default_context(cafile=ca_file) if url.scheme == 'https' else None
+        self.token = token
+        self.worker_id = worker_id or f"{os.uname().nodename if hasattr(os, 'uname') else 'node'}-{os.getpid()}"
+        self.max_clients = max_clients
+        self.interval = interval
+        self.report_fn = report_fn or (lambda: local_capacity_report(self.max_clients))
+        self.launch_fn = launch_fn or _instrumented_launch_fn()
+        self._stop = threading.Event()
+
+    def _post(self, path: str, body: dict) -> dict:
+        body = {'worker_id': self.worker_id, **body}
+        request = urllib.request.Request(f"{self.coordinator_url}{path}", data=json.dumps(body).encode(),
+                                         method='POST', headers={
+                                             'Authorization': f"Bearer {self.token}",
+                                             'Content-Type': 'application/json',
+                                         })
+        with urllib.request.urlopen(request, timeout=10, context=self._ssl_context) as response:
+            return json.loads(response.read())
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._post('/heartbeat', {'report': self.report_fn()})
+            except Exception as e:
+                print(f"[Worker {self.worker_id}] Heartbeat failed: {e}")
+            self._stop.wait(self.interval)
+
+    def run(self) -> None:
+        """Heartbeat in the background and process claims until stopped."""
+        threading.Thread(target=self._heartbeat_loop, daemon=True, name="worker-heartbeat").start()
+        while not self._stop.is_set():
+            try:
+                assignments = self._post('/claim', {}).get('assignments', [])
+            except Exception as e:
+                print(f"[Worker {self.worker_id}] Claim failed: {e}")
+                assignments = []
+            if not assignments:
+                self._stop.wait(self.interval)
+                continue
+            for assignment in assignments:
+                try:
+                    success, error = bool(self.launch_fn(assignment['account_name'], assignment['cookie'],
+                                                         assignment['server_link'])), None
+                except Exception as e:
+                    success, error = False, str(e)
+                try:
+                    self._post('/result', {'batch_id': assignment['batch_id'],
+                                           'account_name': assignment['account_name'],
+                                           'success': success, 'error': error})
+                except Exception as e:
+                    print(f"[Worker {self.worker_id}] Reporting {assignment['account_name']} failed: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class SimulatedNode:
+    """Stand-in launch box for local testing: fake RAM, fake clients, fake launch time."""
+
+    def __init__(self, max_clients: int, free_ram_mb: float, launch_seconds: float = 0.5, failure_rate: float = 0.0):
+        self.max_clients = max_clients
+        self.free_ram_mb = free_ram_mb
+        self.launch_seconds = launch_seconds
+        self.failure_rate = failure_rate
+        self.live_clients = 0
+
+    def report(self) -> dict:
+        return {'free_ram_mb': self.free_ram_mb - self.live_clients * RAM_PER_CLIENT_MB,
+                'live_clients': self.live_clients, 'max_clients': self.max_clients}
+
+    def launch(self, account_name: str, cookie: str, server_link: str) -> bool:
+        time.sleep(self.launch_seconds * random.uniform(0.5, 1.5))
+        if random.random() < self.failure_rate:
+            return False
+        self.live_clients += 1
+        return True
+
+
+def _run_demo(workers: int, accounts: int, kill_one: bool) -> int:
+    """Coordinator plus several simulated worker processes on this machine."""
+    coordinator = LaunchCoordinator().start()
+    batch_id = coordinator.submit_batch([(f"account{i}", f"cookie{i}") for i in range(accounts)],
+                                        "https://www.roblox.com/games/1/demo")
+    processes = []
+    for index in range(workers):
+        max_clients = 4 + 4 * index  # Uneven nodes so the shards differ
+        processes.append(subprocess.Popen([
+            sys.executable, os.path.abspath(__file__), 'worker', coordinator.base_url,
+            '--token', coordinator.token, '--worker-id', f"node{index}",
+            '--max-clients', str(max_clients), '--simulate', '--ram-mb', str(max_clients * RAM_PER_CLIENT_MB * 2),
+        ]))
+    try:
+        if kill_one:
+            time.sleep(HEARTBEAT_INTERVAL * 2)
+            coordinator.log("Killing node0 to simulate a lost worker")
+            processes[0].kill()
+        results = coordinator.wait_for_batch(batch_id, timeout=120)
+    finally:
+        for process in processes:
+            process.kill()
+        coordinator.stop()
+    print(json.dumps({
+        'launched': len(results['launched']), 'failed': len(results['failed']),
+        'pending': len(results['pending']) + len(results['assigned']), 'by_worker': results['by_worker'],
+    }, indent=2))
+    return 0 if not results['pending'] and not results['assigned'] else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Multi-node Roblox launch coordinator")
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='serve a batch from the local vault to workers')
+    run.add_argument('server_link')
+    run.add_argument('accounts', nargs='+')
+    run.add_argument('--host', default='127.0.0.1',
+                     help=f'bind address; non-loopback needs --tls-cert and {TOKEN_ENV}')
+    run.add_argument('--port', type=int, default=0)
+    run.add_argument('--tls-cert', help='PEM certificate to serve HTTPS with')
+    run.add_argument('--tls-key', help='private key for --tls-cert')
+    worker = commands.add_parser('worker', help='run a worker node')
+    worker.add_argument('coordinator_url')
+    worker.add_argument('--token', default=os.environ.get(TOKEN_ENV))
+    worker.add_argument('--ca-file', help="CA bundle to verify an https:// coordinator's certificate")
+    worker.add_argument('--worker-id')
+    worker.add_argument('--max-clients', type=int, default=10)
+    worker.add_argument('--simulate', action='store_true', help='fake launches for local testing')
+    worker.add_argument('--ram-mb', type=float, default=16000, help='free RAM reported with --simulate')
+    demo = commands.add_parser('demo', help='coordinator plus simulated local workers')
+    demo.add_argument('--workers', type=int, default=3)
+    demo.add_argument('--accounts', type=int, default=20)
+    demo.add_argument('--kill-one', action='store_true', help='kill one worker mid-batch')
+    args = parser.parse_args(argv)
+
+    if args.command == 'demo':
+        return _run_demo(args.workers, args.accounts, args.kill_one)
+    if args.command == 'worker':
+        if not args.token:
+            print(f"A token is required (--token or {TOKEN_ENV})")
+            return 1
+        try:
+            if args.simulate:
+                node = SimulatedNode(args.max_clients, args.ram_mb)
+                node_worker = LaunchWorker(args.coordinator_url, args.token, args.worker_id, args.max_clients,
+                                           launch_fn=node.launch, report_fn=node.report, ca_file=args.ca_file)
+            else:
+                node_worker = LaunchWorker(args.coordinator_url, args.token, args.worker_id, args.max_clients,
+                                           ca_file=args.ca_file)
+        except ValueError as e:
+            print(e)
+            return 1
+        try:
+            node_worker.run()
+        except KeyboardInterrupt:
+            node_worker.stop()
+        return 0
+
+    if not is_loopback(args.host) and not (args.tls_cert and os.environ.get(TOKEN_ENV)):
+        print(f"Refusing to serve cookies on {args.host}: set --tls-cert (and --tls-key) and {TOKEN_ENV}, "
+              f"or bind to 127.0.0.1 and tunnel")
+        return 1
+    from daemon import _vault_password
+    from encryption import EncryptionManager
+    accounts_data = EncryptionManager().decrypt_data(_vault_password())
+    if accounts_data is None:
+        print("Could not unlock the account vault (wrong password?)")
+        return 1
+    missing = [name for name in args.accounts if name not in accounts_data]
+    if missing:
+        print(f"Unknown accounts: {', '.join(missing)}")
+        return 1
+    coordinator = LaunchCoordinator(host=args.host, port=args.port, token=os.environ.get(TOKEN_ENV),
+                                    certfile=args.tls_cert, keyfile=args.tls_key).start()
+    print(f"Workers: python coordinator.py worker {coordinator.base_url} --token {coordinator.token}")
+    batch_id = coordinator.submit_batch([(name, accounts_data[name]) for name in args.accounts], args.server_link)
+    try:
+        results = coordinator.wait_for_batch(batch_id)
+    except KeyboardInterrupt:
+        results = coordinator.batch_results(batch_id)
+    coordinator.stop()
+    print(json.dumps(results, indent=2))
+    return 0 if not results['failed'] and not results['pending'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
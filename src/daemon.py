@@ -0,0 +1,446 @@
+"""
+Headless launcher daemon.
+Unlocks the account vault, owns a RobloxLauncher and serves a loopback-only
+HTTP job API so launches can be scripted or driven from another process
+(the Tk window included) without a display.
+
+API (every request needs "Authorization: Bearer <token>"):
+    POST /jobs            {"type": "launch", "accounts": [...], "server_link": "..."}
+                          {"type": "stop"}
+    GET  /jobs            all jobs
+    GET  /jobs/<id>       one job
+    GET  /status          launcher and queue status
+    GET  /events?since=N  progress events as NDJSON, streamed until the client disconnects
+
+The port and token are written to .data/daemon.json for local clients.
+
+Usage:
+    python daemon.py serve [--port N] [--metrics-port N]   (vault password from RMAM_VAULT_PASSWORD or a prompt)
+    python daemon.py launch <link> <account> [account ...]
+    python daemon.py stop
+    python daemon.py status
+    python daemon.py events
+"""
+
+import argparse
+import getpass
+import hmac
+import itertools
+import json
+import os
+import queue
+import secrets
+import sys
+import threading
+import time
+import urllib.request
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List, Optional
+
+from runtime import DATA_DIR
+from metrics import start_metrics_server
+from events import EVENT_KINDS, STATUS, attach_jsonl_sink
+
+DAEMON_STATE_FILE = os.path.join(DATA_DIR, "daemon.json")
+PASSWORD_ENV = "RMAM_VAULT_PASSWORD"
+EVENT_BUFFER_SIZE = 2000
+STREAM_KEEPALIVE = 15
+
+
+class LauncherDaemon:
+    """
+    Job queue and event log around a RobloxLauncher.
+    Launch jobs run one at a time (LocalStorage isolation is machine-wide);
+    stop jobs run immediately and cancel whatever is still queued.
+    """
+
+    def __init__(self, password: str, port: int = 0, state_file: str = DAEMON_STATE_FILE, launcher=None):
+        from encryption import EncryptionManager
+        self.security_manager = EncryptionManager()
+        self.password = password
+        if self._load_accounts() is None:
+            raise ValueError("Could not unlock the account vault (wrong password?)")
+        if launcher is None:
+            from launcher import RobloxLauncher
+            launcher = RobloxLauncher()
+        self.launcher = launcher
+        self.launcher.callback = self._on_launcher_status
+        # Typed launcher events (launch started/finished, phases, errors, ...) go to the stream as well
+        self._bus_subscription = self.launcher.events.subscribe(
+            self._on_launcher_event, kinds=[kind for kind in EVENT_KINDS if kind != STATUS], name=f"daemon-{id(self)}")
+        attach_jsonl_sink(self.launcher.events)
+        self.state_file = state_file
+        self.token = secrets.token_urlsafe(24)
+        self.jobs = {}  # {job_id: job dict}
+        self._job_ids = itertools.count(1)
+        self._queue = queue.Queue()
+        self._current_job = None
+        self._events = deque(maxlen=EVENT_BUFFER_SIZE)
+        self._event_seq = itertools.count(1)
+        self._event_cond = threading.Condition()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._server.daemon_threads = True
+        self._threads = []
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _load_accounts(self) -> Optional[dict]:
+        return self.security_manager.decrypt_data(self.password)
+
+    def publish(self, event_type: str, **fields) -> dict:
+        """Append an event to the log and wake streaming clients."""
+        with self._event_cond:
+            event = {'seq': next(self._event_seq), 'time': time.time(), 'type': event_type, **fields}
+            self._events.append(event)
+            self._event_cond.notify_all()
+        return event
+
+    def _on_launcher_status(self, message: str) -> None:
+        job = self._current_job
+        self.publish('status', message=message, job_id=job['id'] if job else None)
+
+    def _on_launcher_event(self, event) -> None:
+        job = self._current_job
+        self.publish(event.kind, account=event.account, message=event.message,
+                     job_id=job['id'] if job else None, **event.data)
+
+    def events_since(self, seq: int, timeout: Optional[float] = None) -> List[dict]:
+        """Events newer than seq, waiting up to timeout for the first one."""
+        with self._event_cond:
+            if timeout and not (self._events and self._events[-1]['seq'] > seq):
+                self._event_cond.wait(timeout)
+            return [event for event in self._events if event['seq'] > seq]
+
+    def _job_view(self, job: dict) -> dict:
+        return {key: value for key, value in job.items() if not key.startswith('_')}
+
+    def submit(self, request: dict) -> dict:
+        """
+        Validate and queue a job.
+        Args:
+            request: {"type": "launch", "accounts": [...], "server_link": "..."} or {"type": "stop"}
+        Returns:
+            The job as a dictionary
+        """
+        job_type = request.get('type')
+        if job_type not in ('launch', 'stop'):
+            raise ValueError(f"Unknown job type: {job_type!r}")
+        job = {
+            'id': next(self._job_ids),
+            'type': job_type,
+            'state': 'queued',
+            'created_at': time.time(),
+            'finished_at': None,
+            'result': None,
+            'error': None,
+        }
+        if job_type == 'launch':
+            accounts = request.get('accounts') or []
+            server_link = (request.get('server_link') or '').strip()
+            if not accounts or not server_link:
+                raise ValueError("A launch job needs accounts and a server_link")
+            job.update(accounts=list(accounts), server_link=server_link)
+        with self._lock:
+            self.jobs[job['id']] = job
+        self.publish('job_queued', job_id=job['id'], job_type=job_type)
+        if job_type == 'stop':
+            self._run_stop(job)
+        else:
+            self._queue.put(job)
+        return self._job_view(job)
+
+    def _finish(self, job: dict, state: str, result=None, error: Optional[str] = None) -> None:
+        job.update(state=state, result=result, error=error, finished_at=time.time())
+        self.publish('job_finished', job_id=job['id'], state=state, result=result, error=error)
+
+    def _run_stop(self, job: dict) -> None:
+        cancelled = 0
+        while True:
+            try:
+                queued = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            self._finish(queued, 'cancelled')
+            cancelled += 1
+        job['state'] = 'running'
+        try:
+            stopped = self.launcher.stop_all_instances()
+            self._finish(job, 'done', {'stopped': stopped, 'cancelled_jobs': cancelled})
+        except Exception as e:
+            self._finish(job, 'failed', error=str(e))
+
+    def _run_launch(self, job: dict) -> None:
+        accounts_data = self._load_accounts() or {}  # Re-read so accounts added elsewhere are seen
+        missing = [name for name in job['accounts'] if name not in accounts_data]
+        if missing:
+            self._finish(job, 'failed', error=f"Unknown accounts: {', '.join(missing)}")
+            return
+        selected = [(name, accounts_data[name]) for name in job['accounts']]
+        future = self.launcher.launch_multiple_accounts_improved(selected, job['server_link'])
+        launched = future.result()
+        self._finish(job, 'done', {'launched': launched, 'requested': len(selected)})
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if job['state'] != 'queued':
+                continue
+            self._current_job = job
+            job['state'] = 'running'
+            self.publish('job_started', job_id=job['id'])
+            try:
+                self._run_launch(job)
+            except Exception as e:
+                self._finish(job, 'failed', error=str(e))
+            finally:
+                self._current_job = None
+
+    def status(self) -> dict:
+        with self._lock:
+            queued = sum(1 for job in self.jobs.values() if job['state'] == 'queued')
+        current = self._current_job
+        return {
+            'queued_jobs': queued,
+            'current_job': current['id'] if current else None,
+            'launcher': self.launcher.get_isolation_status(),
+        }
+
+    def _authorized(self, header: Optional[str]) -> bool:
+        expected = f"Bearer {self.token}"
+        return bool(header) and hmac.compare_digest(header, expected)
+
+    def _make_handler(self):
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body=None) -> None:
+                payload = json.dumps(body if body is not None else {}, default=str).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _check_auth(self) -> bool:
+                if daemon._authorized(self.headers.get('Authorization')):
+                    return True
+                self._send(401, {'error': 'Missing or invalid token'})
+                return False
+
+            def do_POST(self):
+                if not self._check_auth():
+                    return
+                if self.path.split('?')[0] != '/jobs':
+                    self._send(404, {'error': 'Not found'})
+                    return
+                try:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    request = json.loads(self.rfile.read(length) or b'{}')
+                    self._send(202, daemon.submit(request))
+                except ValueError as e:
+                    self._send(400, {'error': str(e)})
+
+            def do_GET(self):
+                if not self._check_auth():
+                    return
+                path, _, query = self.path.partition('?')
+                if path == '/status':
+                    self._send(200, daemon.status())
+                elif path == '/jobs':
+                    with daemon._lock:
+                        jobs = [daemon._job_view(job) for job in daemon.jobs.values()]
+                    self._send(200, jobs)
+                elif path.startswith('/jobs/'):
+                    job = daemon.jobs.get(int(path.rsplit('/', 1)[1])) if path.rsplit('/', 1)[1].isdigit() else None
+                    if job:
+                        self._send(200, daemon._job_view(job))
+                    else:
+                        self._send(404, {'error': 'No such job'})
+                elif path == '/events':
+                    params = dict(part.partition('=')[::2] for part in query.split('&') if part)
+                    self._stream_events(int(params.get('since') or 0))
+                else:
+                    self._send(404, {'error': 'Not found'})
+
+            def _stream_events(self, since: int) -> None:
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/x-ndjson')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+                try:
+                    while True:
+                        events = daemon.events_since(since, timeout=STREAM_KEEPALIVE)
+                        if not events:
+                            self.wfile.write(b'{"type": "keepalive"}\n')
+                        for event in events:
+                            self.wfile.write(json.dumps(event, default=str).encode() + b'\n')
+                            since = event['seq']
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError, OSError):
+                    pass
+
+        return Handler
+
+    def _write_state(self) -> None:
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump({'url': self.base_url, 'token': self.token, 'pid': os.getpid()}, f)
+        try:
+            os.chmod(self.state_file, 0o600)
+        except OSError:
+            pass
+
+    def start(self) -> "LauncherDaemon":
+        for target, name in ((self._worker, "daemon-jobs"), (self._server.serve_forever, "daemon-http")):
+            thread = threading.Thread(target=target, daemon=True, name=name)
+            thread.start()
+            self._threads.append(thread)
+        self._write_state()
+        self.publish('daemon_started', url=self.base_url)
+        return self
+
+    def stop(self) -> None:
+        self._bus_subscription.close(timeout=1)
+        self._queue.put(None)
+        self._server.shutdown()
+        self._server.server_close()
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                if json.load(f).get('token') == self.token:
+                    os.remove(self.state_file)
+        except (OSError, ValueError):
+            pass
+
+
+class DaemonClient:
+    """Minimal client for a running LauncherDaemon."""
+
+    def __init__(self, base_url: str, token: str, timeout: float = 10):
+        self.base_url = base_url.rstrip('/')
+        self.token = token
+        self.timeout = timeout
+
+    @classmethod
+    def discover(cls, state_file: str = DAEMON_STATE_FILE) -> Optional["DaemonClient"]:
+        """Client for the daemon described in the state file, or None if none is reachable."""
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            client = cls(state['url'], state['token'], timeout=2)
+            client.status()
+            client.timeout = 10
+            return client
+        except Exception:
+            return None
+
+    def _request(self, method: str, path: str, body: Optional[dict] = None, timeout: Optional[float] = None):
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(f"{self.base_url}{path}", data=data, method=method, headers={
+            'Authorization': f"Bearer {self.token}",
+            'Content-Type': 'application/json',
+        })
+        return urllib.request.urlopen(request, timeout=timeout or self.timeout)
+
+    def _json(self, method: str, path: str, body: Optional[dict] = None):
+        with self._request(method, path, body) as response:
+            return json.loads(response.read())
+
+    def launch(self, accounts: List[str], server_link: str) -> dict:
+        return self._json('POST', '/jobs', {'type': 'launch', 'accounts': accounts, 'server_link': server_link})
+
+    def stop(self) -> dict:
+        return self._json('POST', '/jobs', {'type': 'stop'})
+
+    def status(self) -> dict:
+        return self._json('GET', '/status')
+
+    def job(self, job_id: int) -> dict:
+        return self._json('GET', f'/jobs/{job_id}')
+
+    def events(self, since: int = 0) -> Iterator[dict]:
+        """Yield progress events as they arrive (keepalives are skipped)."""
+        with self._request('GET', f'/events?since={since}', timeout=STREAM_KEEPALIVE * 2) as response:
+            for line in response:
+                event = json.loads(line)
+                if event.get('type') != 'keepalive':
+                    yield event
+
+
+def _vault_password() -> str:
+    password = os.environ.get(PASSWORD_ENV)
+    if password:
+        return password
+    return getpass.getpass("Master password: ")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless Roblox launcher daemon")
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='run the daemon')
+    serve.add_argument('--port', type=int, default=0)
+    serve.add_argument('--metrics-port', type=int, help='also serve Prometheus metrics on this loopback port')
+    launch = commands.add_parser('launch', help='queue a launch job')
+    launch.add_argument('server_link')
+    launch.add_argument('accounts', nargs='+')
+    commands.add_parser('stop', help='stop all instances and cancel queued jobs')
+    commands.add_parser('status', help='show daemon status')
+    commands.add_parser('events', help='follow progress events')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        try:
+            daemon = LauncherDaemon(_vault_password(), port=args.port).start()
+        except ValueError as e:
+            print(e)
+            return 1
+        print(f"Launcher daemon listening on {daemon.base_url}")
+        metrics_server = start_metrics_server(args.metrics_port)
+        if metrics_server:
+            print(f"Metrics at {metrics_server.url}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            daemon.stop()
+        return 0
+
+    client = DaemonClient.discover()
+    if not client:
+        print("No launcher daemon is running (start one with: python daemon.py serve)")
+        return 1
+    if args.command == 'launch':
+        job = client.launch(args.accounts, args.server_link)
+        print(f"Queued job {job['id']}")
+        for event in client.events():
+            if event.get('job_id') != job['id']:
+                continue
+            print(event.get('message') or f"{event['type']}: {event.get('state', '')}")
+            if event['type'] == 'job_finished':
+                return 0 if event['state'] == 'done' else 1
+    elif args.command == 'stop':
+        print(json.dumps(client.stop(), indent=2))
+    elif args.command == 'status':
+        print(json.dumps(client.status(), indent=2, default=str))
+    elif args.command == 'events':
+        try:
+            for event in client.events():
+                print(json.dumps(event))
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,16 +2,21 @@ import base64
 import hashlib
 import json
 import os
+import time
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from metrics import get_registry
 class EncryptionManager:
     """Handles encryption/decryption of account data using PBKDF2 and Fernet."""
-    def __init__(self):
+    def __init__(self, metrics=None):
         self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".data")
         os.makedirs(self.data_dir, exist_ok=True)
         self.salt_file = os.path.join(self.data_dir, "security.salt")
         self.data_file = os.path.join(self.data_dir, "accounts.json")
+        metrics = metrics or get_registry()
+        self._save_seconds = metrics.histogram('rmam_vault_save_seconds', 'Time to derive the key, encrypt and write the vault')
+        self._save_failures = metrics.counter('rmam_vault_save_failures_total', 'Vault saves that failed')
     def _get_or_create_salt(self):
         """Get existing salt or create a new one."""
         if os.path.exists(self.salt_file):
@@ -35,6 +40,7 @@ class EncryptionManager:
         return key
     def encrypt_data(self, data: dict, password: str) -> bool:
         """Encrypt and save account data."""
+        started = time.perf_counter()
         try:
             key = self._derive_key(password)
             fernet = Fernet(key)
@@ -45,7 +51,10 @@ class EncryptionManager:
             return True
         except Exception as e:
             print(f"Encryption error: {e}")
+            self._save_failures.inc()
             return False
+        finally:
+            self._save_seconds.observe(time.perf_counter() - started)
     def decrypt_data(self, password: str) -> dict:
         """Decrypt and load account data."""
         try:
@@ -0,0 +1,124 @@
+"""
+Per-engine browser startup statistics.
+Records how long each automation engine takes to become ready (and how often
+it fails), persists the numbers in .data/engine_stats.json, and uses them to
+order engines and size the hedging budget for the next launch.
+"""
+
+import json
+import os
+import threading
+from typing import List, Optional
+
+from runtime import DATA_DIR
+
+ENGINE_STATS_FILE = os.path.join(DATA_DIR, "engine_stats.json")
+MAX_SAMPLES = 50
+DEFAULT_HEDGE_BUDGET = 8.0
+MIN_HEDGE_BUDGET = 3.0
+MAX_HEDGE_BUDGET = 20.0
+FAILURE_PENALTY_SECONDS = 30.0  # Expected cost charged for each failed start
+
+
+def _percentile(samples: List[float], fraction: float) -> Optional[float]:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class EngineStats:
+    """
+    Startup latency samples and failure counts per engine.
+    Only the last MAX_SAMPLES successful startups are kept per engine.
+    """
+
+    def __init__(self, stats_file: str = ENGINE_STATS_FILE):
+        self.stats_file = stats_file
+        self._stats = {}  # {engine: {'samples': [...], 'successes': int, 'failures': int}}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    self._stats = json.load(f)
+        except Exception as e:
+            print(f"Failed to load engine stats: {e}")
+            self._stats = {}
+
+    def _save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
+            with self._lock:
+                snapshot = json.dumps(self._stats, indent=2)
+            tmp_path = f"{self.stats_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(snapshot)
+            os.replace(tmp_path, self.stats_file)
+        except Exception as e:
+            print(f"Failed to save engine stats: {e}")
+
+    def record(self, engine: str, seconds: float, success: bool) -> None:
+        """
+        Record one startup attempt.
+        Args:
+            engine: Engine name (chrome, edge, firefox)
+            seconds: Time from start request until ready or failure
+            success: Whether the driver came up
+        """
+        with self._lock:
+            entry = self._stats.setdefault(engine, {'samples': [], 'successes': 0, 'failures': 0})
+            if success:
+                entry['successes'] += 1
+                entry['samples'].append(round(seconds, 3))
+                del entry['samples'][:-MAX_SAMPLES]
+            else:
+                entry['failures'] += 1
+        self._save()
+
+    def summary(self, engine: str) -> dict:
+        """p50/p95 startup latency and failure rate for an engine."""
+        with self._lock:
+            entry = self._stats.get(engine, {})
+            samples = list(entry.get('samples', []))
+            successes = entry.get('successes', 0)
+            failures = entry.get('failures', 0)
+        attempts = successes + failures
+        return {
+            'p50': _percentile(samples, 0.5),
+            'p95': _percentile(samples, 0.95),
+            'attempts': attempts,
+            'failure_rate': failures / attempts if attempts else 0.0,
+        }
+
+    def expected_cost(self, engine: str) -> Optional[float]:
+        """Median startup time plus a penalty proportional to the failure rate."""
+        summary = self.summary(engine)
+        if summary['attempts'] == 0:
+            return None
+        p50 = summary['p50'] if summary['p50'] is not None else FAILURE_PENALTY_SECONDS
+        return p50 + summary['failure_rate'] * FAILURE_PENALTY_SECONDS
+
+    def ordered(self, engines: List[str], preferred: Optional[str] = None) -> List[str]:
+        """
+        Order engines by expected startup cost.
+        Engines without data keep their relative order but go after the
+        preferred engine, so new engines still get tried.
+        """
+        def sort_key(item):
+            index, engine = item
+            cost = self.expected_cost(engine)
+            if cost is None:
+                cost = 0.0 if engine == preferred else FAILURE_PENALTY_SECONDS
+            return (cost, index)
+        return [engine for _, engine in sorted(enumerate(engines), key=sort_key)]
+
+    def hedge_budget(self, engine: str) -> float:
+        """How long to wait for engine before starting the next one in parallel."""
+        p95 = self.summary(engine)['p95']
+        if p95 is None:
+            return DEFAULT_HEDGE_BUDGET
+        return max(MIN_HEDGE_BUDGET, min(MAX_HEDGE_BUDGET, p95 * 1.5))
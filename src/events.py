@@ -0,0 +1,213 @@
+"""
+Typed launch event stream.
+The launcher, storage and span telemetry publish events (launch started/
+finished, phase completed, PID bound, isolation swapped, error, plain status
+text) to an EventBus. The bus keeps the most recent ones in a ring buffer and
+fans them out to any number of subscribers: the Tk status log, the metrics
+registry and a JSONL sink in .data/launch_events.jsonl.
+
+Publishing never blocks: each subscriber has its own bounded queue drained
+by its own thread, and when a slow subscriber's queue is full new events are
+dropped for it (and counted) instead of stalling the launch thread.
+"""
+
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Iterable, List, Optional
+
+from runtime import DATA_DIR
+
+EVENTS_FILE = os.path.join(DATA_DIR, "launch_events.jsonl")
+MAX_EVENTS_FILE_BYTES = 20 * 1024 * 1024  # Rotated to .1 above this size
+DEFAULT_HISTORY_SIZE = 1000
+DEFAULT_QUEUE_SIZE = 1000
+
+LAUNCH_STARTED = 'launch_started'        # data: method
+LAUNCH_FINISHED = 'launch_finished'      # data: method, outcome (success/failure/error), ok, duration_ms
+PHASE_COMPLETED = 'phase_completed'      # data: phase, ok, duration_ms, batch (+ span attributes)
+PID_BOUND = 'pid_bound'                  # a new client process appeared for the account
+ISOLATION_SWAPPED = 'isolation_swapped'  # data: action (setup/teardown), ok
+ERROR = 'error'                          # message; data: error (exception text), when there is one
+STATUS = 'status'                        # message only: free-form progress text for people
+
+EVENT_KINDS = (LAUNCH_STARTED, LAUNCH_FINISHED, PHASE_COMPLETED, PID_BOUND, ISOLATION_SWAPPED, ERROR, STATUS)
+
+
+class Event:
+    """One published event."""
+
+    __slots__ = ('seq', 'kind', 'time', 'account', 'message', 'data')
+
+    def __init__(self, seq: int, kind: str, account: Optional[str], message: Optional[str], data: dict):
+        self.seq = seq
+        self.kind = kind
+        self.time = time.time()
+        self.account = account
+        self.message = message
+        self.data = data
+
+    def to_dict(self) -> dict:
+        return {
+            'seq': self.seq,
+            'kind': self.kind,
+            'time': round(self.time, 3),
+            'account': self.account,
+            'message': self.message,
+            **self.data,
+        }
+
+
+class Subscription:
+    """A subscriber's bounded queue and the thread delivering it."""
+
+    def __init__(self, bus: "EventBus", callback: Callable[[Event], None], kinds: Optional[Iterable[str]],
+                 maxsize: int, name: str):
+        self.bus = bus
+        self.callback = callback
+        self.kinds = frozenset(kinds) if kinds else None
+        self.name = name
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"events-{name}")
+        self._thread.start()
+
+    def wants(self, kind: str) -> bool:
+        return self.kinds is None or kind in self.kinds
+
+    def offer(self, event: Event) -> None:
+        """Queue an event without waiting; drop it if this subscriber is behind."""
+        if not self.wants(event.kind):
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            try:
+                self.callback(event)
+            except Exception as e:
+                print(f"Event subscriber {self.name} failed: {e}")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Unsubscribe, deliver what is already queued, and stop the thread."""
+        self.bus.unsubscribe(self)
+        while True:
+            try:
+                self._queue.put(None, timeout=0.1)
+                break
+            except queue.Full:
+                if not self._thread.is_alive():
+                    break
+        self._thread.join(timeout)
+
+
+class EventBus:
+    """Ring buffer of recent events plus non-blocking fan-out to subscribers."""
+
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self._history = deque(maxlen=history_size)
+        self._subscriptions = []
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def publish(self, kind: str, account: Optional[str] = None, message: Optional[str] = None, **data) -> Event:
+        """
+        Publish an event.
+        Args:
+            kind: One of the event kind constants
+            account: Account the event belongs to, if any
+            message: Human-readable text, if any
+            **data: Kind-specific fields (see the constants)
+        Returns:
+            The published Event
+        """
+        with self._lock:
+            event = Event(next(self._seq), kind, account, message, data)
+            self._history.append(event)
+            subscriptions = self._subscriptions
+        for subscription in subscriptions:
+            subscription.offer(event)
+        return event
+
+    def subscribe(self, callback: Callable[[Event], None], kinds: Optional[Iterable[str]] = None,
+                  maxsize: int = DEFAULT_QUEUE_SIZE, name: Optional[str] = None) -> Subscription:
+        """
+        Deliver events to callback on a dedicated thread.
+        Args:
+            callback: Called with each Event, in publish order
+            kinds: Only these event kinds (all when None)
+            maxsize: Events buffered for this subscriber before new ones are dropped
+            name: Subscribing again under an existing name returns that subscription
+        Returns:
+            Subscription (close() it to unsubscribe)
+        """
+        with self._lock:
+            if name is not None:
+                for subscription in self._subscriptions:
+                    if subscription.name == name:
+                        return subscription
+            subscription = Subscription(self, callback, kinds, maxsize, name or getattr(callback, '__name__', 'subscriber'))
+            # Copy on write so publish() can iterate without holding the lock
+            self._subscriptions = self._subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions = [s for s in self._subscriptions if s is not subscription]
+
+    def has_subscribers(self, kind: str) -> bool:
+        return any(subscription.wants(kind) for subscription in self._subscriptions)
+
+    def recent(self, limit: Optional[int] = None, kinds: Optional[Iterable[str]] = None,
+               account: Optional[str] = None, since: int = 0) -> List[Event]:
+        """Events still in the ring buffer, oldest first, optionally filtered."""
+        kinds = frozenset(kinds) if kinds else None
+        with self._lock:
+            events = list(self._history)
+        events = [event for event in events if event.seq > since
+                  and (kinds is None or event.kind in kinds)
+                  and (account is None or event.account == account)]
+        return events[-limit:] if limit else events
+
+
+class JsonlSink:
+    """Subscriber appending events as JSON lines, rotated to .1 above max_bytes."""
+
+    def __init__(self, path: str = EVENTS_FILE, max_bytes: int = MAX_EVENTS_FILE_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+
+    def __call__(self, event: Event) -> None:
+        line = json.dumps(event.to_dict(), default=str) + "\n"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except Exception as e:
+            print(f"Failed to write launch event: {e}")
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    return _bus
+
+
+def attach_jsonl_sink(bus: Optional[EventBus] = None, path: str = EVENTS_FILE) -> Subscription:
+    """Log every typed event (status text excluded) to a JSONL file, once per bus."""
+    bus = bus or _bus
+    kinds = [kind for kind in EVENT_KINDS if kind != STATUS]
+    return bus.subscribe(JsonlSink(path), kinds=kinds, name=f"jsonl:{path}")
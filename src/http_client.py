@@ -0,0 +1,213 @@
+"""
+Pooled HTTP session shared by every web call the launcher makes.
+Connections are kept alive per host, and the session never stores cookies so
+one account's .ROBLOSECURITY can't leak into another account's request.
+Requests are paced by a per-host token bucket, and 429/503 answers back the
+whole host off for the Retry-After period instead of sleeping blind.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
+from typing import Optional
+from urllib.parse import urlparse
+
+DEFAULT_TIMEOUT = 10
+DEFAULT_POOL_SIZE = 20
+DEFAULT_MAX_RETRIES = 3
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# (requests per second, burst) per host; unknown hosts use DEFAULT_HOST_LIMIT
+DEFAULT_HOST_LIMIT = (5.0, 10)
+HOST_LIMITS = {
+    'auth.roblox.com': (2.0, 4),
+    'apis.roblox.com': (5.0, 10),
+    'users.roblox.com': (5.0, 10),
+    'www.roblox.com': (3.0, 6),
+}
+RETRYABLE_STATUS = (429, 503)
+MAX_RETRY_AFTER = 60.0  # Longer Retry-After answers are returned to the caller instead of waited out
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    Tokens refill continuously at rate per second up to capacity; acquire()
+    blocks until enough tokens are available. pause() empties the bucket
+    until a deadline, which is how Retry-After is honoured.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting as long as needed.
+        Args:
+            tokens: Number of tokens to take
+            timeout: Maximum seconds to wait; None waits indefinitely
+        Returns:
+            True if the tokens were taken, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now >= self._paused_until:
+                    self._refill(now)
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return True
+                    wait = (tokens - self._tokens) / self.rate if self.rate > 0 else 1.0
+                else:
+                    wait = self._paused_until - now
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next seconds (extends any existing pause)."""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0
+            self._updated = self._paused_until
+
+
+class HostRateLimiter:
+    """Keeps one TokenBucket per host."""
+
+    def __init__(self, host_limits: Optional[dict] = None, default_limit: tuple = DEFAULT_HOST_LIMIT):
+        self.host_limits = dict(HOST_LIMITS if host_limits is None else host_limits)
+        self.default_limit = default_limit
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, self.default_limit)
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        self.bucket_for(url).acquire()
+
+    def back_off(self, url: str, seconds: float) -> None:
+        self.bucket_for(url).pause(seconds)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpSession:
+    """
+    Thin wrapper around a keep-alive requests.Session.
+    Every request carries its own cookie header; the underlying cookie jar is
+    disabled so a shared session is safe across accounts.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT,
+                 rate_limiter: Optional[HostRateLimiter] = None, max_retries: int = DEFAULT_MAX_RETRIES):
+        import requests
+        from requests.adapters import HTTPAdapter
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.max_retries = max_retries
+        self._session = requests.Session()
+        self._session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self._session.headers.update({'User-Agent': USER_AGENT})
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def request(self, method: str, url: str, cookie: Optional[str] = None,
+                headers: Optional[dict] = None, json_body=None, timeout: Optional[float] = None):
+        """
+        Send a request over the pooled session, paced by the host's token bucket.
+        429/503 responses are retried after Retry-After (or an exponential
+        backoff when the header is missing); the last response is returned.
+        A Retry-After above MAX_RETRY_AFTER is not waited out: that response
+        is returned right away.
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            cookie: Optional .ROBLOSECURITY value to send with this request only
+            headers: Extra request headers
+            json_body: Optional JSON payload
+            timeout: Per-request timeout in seconds
+        Returns:
+            requests.Response
+        """
+        request_headers = dict(headers or {})
+        if cookie:
+            request_headers['Cookie'] = f".ROBLOSECURITY={cookie}"
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(url)
+            response = self._session.request(
+                method, url,
+                headers=request_headers,
+                json=json_body,
+                timeout=timeout or self.timeout,
+                allow_redirects=False,
+            )
+            if response.status_code not in RETRYABLE_STATUS or attempt == self.max_retries:
+                return response
+            delay = _retry_after_seconds(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = (2 ** attempt) + random.uniform(0, 0.5)
+            elif delay > MAX_RETRY_AFTER:
+                return response
+            # Pause the whole host so other threads don't keep hammering it
+            self.rate_limiter.back_off(url, delay)
+        return response
+
+    def get(self, url: str, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> HttpSession:
+    """Return the process-wide pooled HTTP session."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = HttpSession()
+        return _session
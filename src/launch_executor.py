@@ -0,0 +1,164 @@
+"""
+Bounded executor for launch work.
+Runs launches on a fixed-size thread pool, hands back futures, supports
+cancelling queued work, and compacts every finished launch into a small
+slotted record kept in a bounded history, so memory stays flat no matter
+how long the manager runs.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, List, Optional
+
+from profiling import profile_in_worker
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_HISTORY_SIZE = 500
+
+# Cancel flag of the submission running in this worker (see LaunchExecutor.cancel_requested)
+_cancel_event = contextvars.ContextVar('launch_cancel', default=None)
+
+
+def _run_cancellable(cancel_event: threading.Event, fn: Callable, *args, **kwargs):
+    _cancel_event.set(cancel_event)
+    return fn(*args, **kwargs)
+
+
+class LaunchRecord:
+    """Compact summary of one finished launch."""
+
+    __slots__ = ('account_name', 'method', 'submitted_at', 'finished_at', 'outcome', 'error')
+
+    def __init__(self, account_name: str, method: str, submitted_at: float):
+        self.account_name = account_name
+        self.method = method
+        self.submitted_at = submitted_at
+        self.finished_at = None
+        self.outcome = 'pending'  # pending, launched, failed, cancelled, error
+        self.error = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.submitted_at
+
+    def to_dict(self) -> dict:
+        return {
+            'account_name': self.account_name,
+            'method': self.method,
+            'submitted_at': self.submitted_at,
+            'finished_at': self.finished_at,
+            'outcome': self.outcome,
+            'error': self.error,
+        }
+
+
+class LaunchExecutor:
+    """
+    Thread pool for launches with future-based results and a bounded history.
+    Queued launches can be cancelled outright; running ones are asked to stop
+    through cancel_requested, which long-running work checks between steps.
+    Each submission has its own cancel flag, so cancel_all() only reaches work
+    submitted before it, never launches queued afterwards.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS, history_size: int = DEFAULT_HISTORY_SIZE):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="launch")
+        self._pending = {}  # {future: LaunchRecord}
+        self._cancel_events = {}  # {future: threading.Event}
+        self._history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+
+    def submit(self, account_name: str, method: str, fn: Callable, *args, **kwargs):
+        """
+        Queue a launch.
+        Args:
+            account_name: Account (or batch label) the work belongs to
+            method: Launch method name, kept in the history
+            fn: Callable doing the work; a truthy return means launched
+        Returns:
+            concurrent.futures.Future with fn's return value; its cancel_event is set
+            when cancel_all() asks this submission to stop
+        """
+        record = LaunchRecord(account_name, method, time.time())
+        cancel_event = threading.Event()
+        # Run in a copy of the caller's context so context variables (batch tags, an active
+        # batch profile) carry over
+        future = self._executor.submit(contextvars.copy_context().run, _run_cancellable, cancel_event,
+                                       profile_in_worker(fn), *args, **kwargs)
+        future.cancel_event = cancel_event
+        with self._lock:
+            self._pending[future] = record
+            self._cancel_events[future] = cancel_event
+        future.add_done_callback(self._compact)
+        return future
+
+    def _compact(self, future) -> None:
+        """Move a finished future's record into the history and drop the future."""
+        with self._lock:
+            record = self._pending.pop(future, None)
+            self._cancel_events.pop(future, None)
+        if record is None:
+            return
+        record.finished_at = time.time()
+        if future.cancelled():
+            record.outcome = 'cancelled'
+        elif future.exception() is not None:
+            record.outcome = 'error'
+            record.error = str(future.exception())
+        else:
+            record.outcome = 'launched' if future.result() else 'failed'
+        with self._lock:
+            self._history.append(record)
+
+    @property
+    def cancel_requested(self) -> bool:
+        """Whether the submission running on the calling worker thread was asked to stop."""
+        cancel_event = _cancel_event.get()
+        return cancel_event is not None and cancel_event.is_set()
+
+    def cancel_all(self, timeout: Optional[float] = None) -> int:
+        """
+        Cancel queued launches and ask running ones to stop.
+        Work submitted after this call is unaffected.
+        Args:
+            timeout: Seconds to wait for running launches to finish
+        Returns:
+            Number of queued launches that were cancelled
+        """
+        with self._lock:
+            futures = list(self._pending)
+            cancel_events = list(self._cancel_events.values())
+        for cancel_event in cancel_events:
+            cancel_event.set()
+        cancelled = sum(1 for future in futures if future.cancel())
+        running = [future for future in futures if not future.done()]
+        if running and timeout:
+            wait(running, timeout=timeout)
+        return cancelled
+
+    @property
+    def active_count(self) -> int:
+        """Launches queued or running."""
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def running_count(self) -> int:
+        with self._lock:
+            return sum(1 for future in self._pending if future.running())
+
+    def history(self, limit: Optional[int] = None) -> List[LaunchRecord]:
+        """Finished launches, oldest first."""
+        with self._lock:
+            records = list(self._history)
+        return records[-limit:] if limit else records
+
+    def shutdown(self, wait_for_running: bool = False) -> None:
+        self.cancel_all()
+        self._executor.shutdown(wait=wait_for_running, cancel_futures=True)
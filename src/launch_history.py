@@ -0,0 +1,244 @@
+"""
+Per-account launch history.
+Every launch that goes through RobloxLauncher._timed_launch is recorded in
+.data/launch_history.db: when it started, the method, how long it took,
+the outcome and failure reason, and the duration of each phase (driver
+setup, navigation, PID detection, ...).
+
+The recent launches of each account give its success rate and typical
+latency. rank() uses them to order a batch so accounts that usually
+launch, and launch quickly, go first, while accounts that keep failing go
+to the end instead of holding up the rest.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from runtime import DATA_DIR
+
+LAUNCH_HISTORY_DB = os.path.join(DATA_DIR, "launch_history.db")
+RECENT_LAUNCHES = 20  # Launches per account that count toward its stats
+KEEP_PER_ACCOUNT = 100
+MAX_AGE_DAYS = 90
+PRIOR_WEIGHT = 2  # Launches' worth of the overall success rate blended into each account's rate
+MAX_QUERY_NAMES = 500  # Above this, stats are read for every account and filtered in Python
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    account TEXT NOT NULL,
+    method TEXT NOT NULL,
+    batch INTEGER,
+    started_at REAL NOT NULL,
+    duration_ms REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    ok INTEGER NOT NULL,
+    reason TEXT
+);
+CREATE INDEX IF NOT EXISTS launches_account ON launches(account, started_at DESC);
+CREATE TABLE IF NOT EXISTS launch_phases (
+    launch_id INTEGER NOT NULL REFERENCES launches(id) ON DELETE CASCADE,
+    phase TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    ok INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS launch_phases_launch ON launch_phases(launch_id);
+"""
+
+
+def success_label(stats: Optional[dict]) -> str:
+    """Treeview text for an account's stats, e.g. '80% of 5'."""
+    if not stats or not stats['launches']:
+        return "-"
+    return f"{round(stats['success_rate'] * 100)}% of {stats['launches']}"
+
+
+class LaunchHistory:
+    """sqlite-backed launch records, safe to share between threads."""
+
+    def __init__(self, db_path: str = LAUNCH_HISTORY_DB):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def record(self, account: str, method: str, started_at: float, duration_ms: float, outcome: str,
+               reason: Optional[str] = None, phases: Iterable[tuple] = (), batch: Optional[int] = None) -> int:
+        """
+        Store one finished launch.
+        Args:
+            account: Account name
+            method: Launch method (improved, direct_protocol, browser_automation)
+            started_at: Wall-clock start time
+            duration_ms: End-to-end duration
+            outcome: success, failure or error
+            reason: Why it failed, when known
+            phases: (phase, duration_ms, ok) for each phase of the launch
+            batch: Launch-queue batch, if any
+        Returns:
+            Launch id
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "INSERT INTO launches (account, method, batch, started_at, duration_ms, outcome, ok, reason) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (account, method, batch, started_at, duration_ms, outcome, int(outcome == 'success'), reason))
+                launch_id = cursor.lastrowid
+                self._conn.executemany(
+                    "INSERT INTO launch_phases (launch_id, phase, duration_ms, ok) VALUES (?, ?, ?, ?)",
+                    [(launch_id, phase, duration, int(bool(ok))) for phase, duration, ok in phases])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return launch_id
+
+    def recent(self, account: str, limit: int = 10) -> List[dict]:
+        """Latest launches of an account, newest first, each with its phases."""
+        rows = self._execute(
+            "SELECT id, method, batch, started_at, duration_ms, outcome, reason FROM launches "
+            "WHERE account = ? ORDER BY started_at DESC LIMIT ?", (account, limit)).fetchall()
+        launches = []
+        for launch_id, method, batch, started_at, duration_ms, outcome, reason in rows:
+            phases = self._execute("SELECT phase, duration_ms, ok FROM launch_phases WHERE launch_id = ?",
+                                   (launch_id,)).fetchall()
+            launches.append({'method': method, 'batch': batch, 'started_at': started_at,
+                             'duration_ms': duration_ms, 'outcome': outcome, 'reason': reason,
+                             'phases': [{'phase': p, 'duration_ms': d, 'ok': bool(ok)} for p, d, ok in phases]})
+        return launches
+
+    def account_stats(self, names: Optional[Iterable[str]] = None, method: Optional[str] = None,
+                      window: int = RECENT_LAUNCHES) -> Dict[str, dict]:
+        """
+        Stats over each account's most recent launches.
+        Args:
+            names: Accounts to include (all when None)
+            method: Only count launches made with this method
+            window: Recent launches per account that count
+        Returns:
+            {account: {'launches', 'successes', 'success_rate', 'avg_success_ms',
+                       'last_at', 'last_outcome', 'last_reason'}}; accounts without launches are absent
+        """
+        names = None if names is None else list(names)
+        where, params = [], []
+        if method:
+            where.append("method = ?")
+            params.append(method)
+        if names is not None and len(names) <= MAX_QUERY_NAMES:
+            if not names:
+                return {}
+            where.append(f"account IN ({','.join('?' * len(names))})")
+            params.extend(names)
+        sql = f"""
+            WITH ranked AS (
+                SELECT account, started_at, duration_ms, outcome, ok, reason,
+                       ROW_NUMBER() OVER (PARTITION BY account ORDER BY started_at DESC) AS rn
+                FROM launches {'WHERE ' + ' AND '.join(where) if where else ''}
+            )
+            SELECT account, COUNT(*), SUM(ok), AVG(CASE WHEN ok THEN duration_ms END), MAX(started_at),
+                   MAX(CASE WHEN rn = 1 THEN outcome END), MAX(CASE WHEN rn = 1 THEN reason END)
+            FROM ranked WHERE rn <= ? GROUP BY account
+        """
+        rows = self._execute(sql, tuple(params) + (window,)).fetchall()
+        wanted = set(names) if names is not None else None
+        stats = {}
+        for account, launches, successes, avg_ms, last_at, last_outcome, last_reason in rows:
+            if wanted is not None and account not in wanted:
+                continue
+            stats[account] = {
+                'launches': launches,
+                'successes': successes,
+                'success_rate': successes / launches,
+                'avg_success_ms': avg_ms,
+                'last_at': last_at,
+                'last_outcome': last_outcome,
+                'last_reason': last_reason,
+            }
+        return stats
+
+    def rank(self, names: List[str], method: Optional[str] = None) -> List[str]:
+        """
+        Order accounts by expected success, then expected latency.
+        Each account's success rate is blended with the overall rate
+        (PRIOR_WEIGHT launches' worth), so an account with one failure is not
+        ranked below every account never launched. Rates are compared to the
+        nearest 10% so latency decides between similarly reliable accounts;
+        remaining ties keep the given order.
+        Args:
+            names: Accounts in their current order
+            method: Only use launches made with this method
+        Returns:
+            The same names, reordered
+        """
+        stats = self.account_stats(names, method=method)
+        if not stats:
+            return list(names)
+        launches = sum(s['launches'] for s in stats.values())
+        prior_rate = sum(s['successes'] for s in stats.values()) / launches
+        latencies = sorted(s['avg_success_ms'] for s in stats.values() if s['avg_success_ms'] is not None)
+        typical_ms = latencies[len(latencies) // 2] if latencies else 0.0
+
+        def key(name):
+            s = stats.get(name)
+            if not s:
+                return -round(prior_rate, 1), typical_ms
+            rate = (s['successes'] + PRIOR_WEIGHT * prior_rate) / (s['launches'] + PRIOR_WEIGHT)
+            latency = s['avg_success_ms'] if s['avg_success_ms'] is not None else typical_ms
+            return -round(rate, 1), latency
+
+        return sorted(names, key=key)
+
+    def rename_account(self, old_name: str, new_name: str) -> None:
+        self._execute("UPDATE launches SET account = ? WHERE account = ?", (new_name, old_name))
+
+    def prune(self, keep_per_account: int = KEEP_PER_ACCOUNT, max_age_days: int = MAX_AGE_DAYS) -> int:
+        """
+        Drop launches older than max_age_days and all but the newest keep_per_account per account.
+        Returns:
+            Number of launches removed
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                removed = self._conn.execute("DELETE FROM launches WHERE started_at < ?", (cutoff,)).rowcount
+                removed += self._conn.execute(
+                    "DELETE FROM launches WHERE id IN (SELECT id FROM (SELECT id, ROW_NUMBER() OVER "
+                    "(PARTITION BY account ORDER BY started_at DESC) AS rn FROM launches) WHERE rn > ?)",
+                    (keep_per_account,)).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_launch_history() -> LaunchHistory:
+    """Return the process-wide launch history, pruning old launches on first use."""
+    global _history
+    with _history_lock:
+        if _history is None:
+            _history = LaunchHistory()
+            _history.prune()
+        return _history
@@ -0,0 +1,298 @@
+"""
+Durable launch queue.
+Every batch and the state of each account in it (pending, in_progress,
+launched, failed) is kept in .data/launch_queue.db, so a batch interrupted by
+a crash can be resumed with only the accounts that never started.
+
+An account only launches after its entry moves pending -> in_progress in a
+single UPDATE, so a resumed batch cannot launch the same account twice. An
+entry still in_progress when the app starts again may or may not have
+launched; recover() marks it failed ("interrupted") instead of retrying it.
+
+The GUI and the daemon share the database, so claims and batches record
+their owning process (pid plus start time), and claimed entries carry a
+heartbeat. recover() only touches entries whose owner is gone, never the
+in-flight launches of another live process.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from runtime import DATA_DIR
+from events import get_event_bus, STATUS
+
+LAUNCH_QUEUE_DB = os.path.join(DATA_DIR, "launch_queue.db")
+HEARTBEAT_INTERVAL = 30  # Seconds between heartbeats of this process's in_progress entries
+HEARTBEAT_STALE = 120  # An entry whose heartbeat is older than this may belong to a dead process
+
+PENDING = 'pending'
+IN_PROGRESS = 'in_progress'
+LAUNCHED = 'launched'
+FAILED = 'failed'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    server_link TEXT NOT NULL,
+    method TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    finished_at REAL,
+    owner TEXT
+);
+CREATE TABLE IF NOT EXISTS entries (
+    batch_id INTEGER NOT NULL REFERENCES batches(id) ON DELETE CASCADE,
+    account_name TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    error TEXT,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    heartbeat_at REAL,
+    PRIMARY KEY (batch_id, account_name)
+);
+"""
+# Columns added after the first release: (table, column, type)
+_MIGRATIONS = [
+    ('batches', 'owner', 'TEXT'),
+    ('entries', 'owner', 'TEXT'),
+    ('entries', 'heartbeat_at', 'REAL'),
+]
+
+
+def _owner_token() -> str:
+    """This process as 'pid:create_time', so a reused PID is not mistaken for it."""
+    try:
+        import psutil
+        created = psutil.Process().create_time()
+    except Exception:
+        created = 0.0
+    return f"{os.getpid()}:{created:.2f}"
+
+
+def _owner_alive(owner: Optional[str]) -> bool:
+    """Whether the process behind an owner token is still running."""
+    if not owner:
+        return False
+    try:
+        pid, created = owner.split(':')
+        pid, created = int(pid), float(created)
+    except ValueError:
+        return False
+    try:
+        import psutil
+    except ImportError:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass
+        return True
+    try:
+        return not created or abs(psutil.Process(pid).create_time() - created) < 1.0
+    except psutil.NoSuchProcess:
+        return False
+    except psutil.AccessDenied:
+        return True
+
+
+class LaunchQueue:
+    """
+    sqlite-backed batch/entry store, safe to share between threads.
+    Only account names are stored; cookies stay in the encrypted vault.
+    """
+
+    def __init__(self, db_path: str = LAUNCH_QUEUE_DB):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        for table, column, column_type in _MIGRATIONS:
+            columns = [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+        self.owner = _owner_token()
+        self._heartbeat_thread = None
+        self._closed = threading.Event()
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def create_batch(self, account_names: List[str], server_link: str, method: str) -> int:
+        """
+        Record a new batch with every account pending.
+        Args:
+            account_names: Accounts in launch order (duplicates are ignored)
+            server_link: Game or private-server link
+            method: Launch path that owns the batch, used when resuming
+        Returns:
+            Batch id
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                batch_id = self._conn.execute(
+                    "INSERT INTO batches (server_link, method, created_at, owner) VALUES (?, ?, ?, ?)",
+                    (server_link, method, now, self.owner)).lastrowid
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entries (batch_id, account_name, position, updated_at) VALUES (?, ?, ?, ?)",
+                    [(batch_id, name, position, now) for position, name in enumerate(account_names)])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return batch_id
+
+    def claim(self, batch_id: int, account_name: str) -> bool:
+        """
+        Move an entry from pending to in_progress, owned by this process.
+        Returns:
+            True if the caller now owns the launch; False if it already started or finished
+        """
+        now = time.time()
+        cursor = self._execute(
+            "UPDATE entries SET state = ?, updated_at = ?, owner = ?, heartbeat_at = ? "
+            "WHERE batch_id = ? AND account_name = ? AND state = ?",
+            (IN_PROGRESS, now, self.owner, now, batch_id, account_name, PENDING))
+        if cursor.rowcount == 1:
+            self._start_heartbeat()
+            return True
+        return False
+
+    def _start_heartbeat(self) -> None:
+        if self._heartbeat_thread is None:
+            self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True,
+                                                      name="launch-queue-heartbeat")
+            self._heartbeat_thread.start()
+
+    def _heartbeat_loop(self) -> None:
+        while not self._closed.wait(HEARTBEAT_INTERVAL):
+            try:
+                self.heartbeat()
+            except sqlite3.Error as e:
+                get_event_bus().publish(STATUS, message=f"Launch queue heartbeat failed: {e}")
+
+    def heartbeat(self) -> None:
+        """Refresh the heartbeat of every in_progress entry this process owns."""
+        self._execute("UPDATE entries SET heartbeat_at = ? WHERE owner = ? AND state = ?",
+                      (time.time(), self.owner, IN_PROGRESS))
+
+    def mark(self, batch_id: int, account_name: str, state: str, error: Optional[str] = None) -> None:
+        """Record the outcome (launched/failed) of an entry."""
+        self._execute(
+            "UPDATE entries SET state = ?, error = ?, updated_at = ? WHERE batch_id = ? AND account_name = ?",
+            (state, error, time.time(), batch_id, account_name))
+
+    def finish_batch(self, batch_id: int) -> None:
+        self._execute("UPDATE batches SET finished_at = ? WHERE id = ?", (time.time(), batch_id))
+
+    def discard_batch(self, batch_id: int) -> None:
+        """Close a batch without launching what is left of it."""
+        self._execute("UPDATE entries SET state = ?, error = ?, updated_at = ? WHERE batch_id = ? AND state = ?",
+                      (FAILED, 'discarded', time.time(), batch_id, PENDING))
+        self.finish_batch(batch_id)
+
+    def recover(self) -> int:
+        """
+        Mark entries left in_progress by a crashed run as failed.
+        Entries owned by this process, with a recent heartbeat, or whose owning
+        process is still running (e.g. the daemon while the GUI starts) are left alone.
+        Returns:
+            Number of entries marked
+        """
+        now = time.time()
+        rows = self._execute(
+            "SELECT batch_id, account_name, owner, heartbeat_at FROM entries WHERE state = ? AND batch_id IN "
+            "(SELECT id FROM batches WHERE finished_at IS NULL)", (IN_PROGRESS,)).fetchall()
+        orphaned = [(batch_id, name, owner) for batch_id, name, owner, heartbeat_at in rows
+                    if owner != self.owner
+                    and not (heartbeat_at and now - heartbeat_at < HEARTBEAT_STALE)
+                    and not _owner_alive(owner)]
+        if not orphaned:
+            return 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # The owner check keeps an entry another process re-claimed meanwhile untouched
+                marked = sum(self._conn.execute(
+                    "UPDATE entries SET state = ?, error = ?, updated_at = ? "
+                    "WHERE batch_id = ? AND account_name = ? AND state = ? AND owner IS ?",
+                    (FAILED, 'interrupted', now, batch_id, name, IN_PROGRESS, owner)).rowcount
+                    for batch_id, name, owner in orphaned)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return marked
+
+    def remaining(self, batch_id: int) -> List[str]:
+        """Pending accounts of a batch, in launch order."""
+        rows = self._execute("SELECT account_name FROM entries WHERE batch_id = ? AND state = ? ORDER BY position",
+                             (batch_id, PENDING)).fetchall()
+        return [row[0] for row in rows]
+
+    def entries(self, batch_id: int) -> dict:
+        """State and error of every entry: {account_name: (state, error)}."""
+        rows = self._execute("SELECT account_name, state, error FROM entries WHERE batch_id = ? ORDER BY position",
+                             (batch_id,)).fetchall()
+        return {name: (state, error) for name, state, error in rows}
+
+    def unfinished_batches(self) -> List[dict]:
+        """
+        Batches that were never finished and still have pending accounts.
+        Batches another running process (the GUI or the daemon) is still working
+        through are not included.
+        Returns:
+            List of {'id', 'server_link', 'method', 'created_at', 'remaining'}
+        """
+        rows = self._execute(
+            "SELECT id, server_link, method, created_at, owner FROM batches WHERE finished_at IS NULL ORDER BY id"
+        ).fetchall()
+        batches = []
+        for batch_id, server_link, method, created_at, owner in rows:
+            if owner and owner != self.owner and _owner_alive(owner):
+                continue
+            remaining = self.remaining(batch_id)
+            if remaining:
+                batches.append({'id': batch_id, 'server_link': server_link, 'method': method,
+                                'created_at': created_at, 'remaining': remaining})
+            else:
+                self.finish_batch(batch_id)
+        return batches
+
+    def prune(self, max_age_days: int = 30) -> int:
+        """Delete finished batches older than max_age_days."""
+        cutoff = time.time() - max_age_days * 86400
+        cursor = self._execute("DELETE FROM batches WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,))
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            self._conn.close()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_launch_queue() -> LaunchQueue:
+    """Return the process-wide launch queue, recovering interrupted entries on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = LaunchQueue()
+            recovered = _queue.recover()
+            if recovered:
+                get_event_bus().publish(STATUS, message=f"Marked {recovered} interrupted launch(es) as failed")
+            _queue.prune()
+        return _queue
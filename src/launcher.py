@@ -6,28 +6,31 @@ Combines functionality from isolated_launcher, improved_launcher, and roblox_lau
 import os
 import time
 import threading
+import queue
 import subprocess
 import webbrowser
 import tempfile
 import random
+import shutil
+import contextvars
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from storage import StorageManager
-from encryption import EncryptionManager
+from runtime import get_browser_detector
+from launch_executor import LaunchExecutor
+from launch_queue import get_launch_queue, LAUNCHED, FAILED
+from telemetry import start_span, set_batch, collect_phases
+from metrics import get_registry, subscribe_launch_metrics
+from events import get_event_bus, LAUNCH_STARTED, LAUNCH_FINISHED, PID_BOUND, ERROR, STATUS
+from launch_history import get_launch_history
+
+
+# Set while a launch runs (see RobloxLauncher._timed_launch); the process reaper treats
+# drivers started by the launch as orphaned once it is set
+_launch_done = contextvars.ContextVar('launch_done', default=None)
+# Error texts reported during the current launch, newest last (its failure reason for the history)
+_launch_errors = contextvars.ContextVar('launch_errors', default=None)
 
 
 def _clean_roblosecurity_cookie(cookie: str) -> str:
@@ -57,36 +60,94 @@ class RobloxLauncher:
     - Multiple launch methods for different server types
     """
     
-    def __init__(self, callback=None, preferred_browser=None):
+    def __init__(self, callback=None, preferred_browser=None, metrics=None, events=None):
         """
         Initialize the unified launcher.
         Args:
-            callback: Optional callback function for status updates
+            callback: Optional callback function for status text (subscribing to events is preferred)
             preferred_browser: Preferred browser for automation
+            metrics: MetricsRegistry to record into (defaults to the process-wide one)
+            events: EventBus to publish launch events to (defaults to the process-wide one)
         """
         self.callback = callback
-        self.storage_manager = StorageManager()
+        self.metrics = metrics or get_registry()
+        self.events = events or get_event_bus()
+        self.storage_manager = StorageManager(metrics=self.metrics, events=self.events)
         
         # Browser setup
         self.active_drivers = []
-        self.launch_threads = []
-        self.preferred_browser = preferred_browser or self._detect_default_browser()
+        self.cookie_seeded_drivers = set()  # Drivers that got the auth cookie before navigation
+        self._driver_profiles = {}  # {driver: temporary profile dir to delete on release}
+        self._driver_accounts = {}  # {driver: account using a persistent profile}
+        self.lean_mode = False  # Eager page loads, no images/media/trackers, small window; unmeasured (see page_load.py)
+        self.persistent_profiles = False  # Reuse roblox_instances/<account>/browser between launches
+        self.profile_size_cap_mb = 200  # Caches are pruned (then the profile reset) above this size
+        self.hedged_startup = False  # Race the next engine if the first one is slow to start
+        self.hedge_budget_seconds = None  # None derives the budget from recorded startup latency
+        self.hedge_timeout_seconds = 90  # Give up on hedged startup entirely after this long
+        self._engine_stats = None
+        
+        # Orphaned driver/browser process cleanup (also clears leftovers of a crashed run)
+        from process_reaper import get_reaper
+        self.process_reaper = get_reaper()
+        self._preferred_browser = preferred_browser
+        if not preferred_browser:
+            get_browser_detector()  # Start background detection without blocking
         self.supported_browsers = ['chrome', 'edge', 'firefox', 'brave', 'opera']
         
         # Launch tracking
         self.active_sessions = []  # Track browser sessions
         self.active_launches = {}  # Track active Roblox launches {account_name: launch_info}
+        self.launch_retention_seconds = 6 * 3600  # Older entries are dropped from active_launches
+        self.launch_executor = LaunchExecutor(max_workers=4)
+        self.history_ordering = True  # Batches launch accounts that usually succeed (quickly) first
         
         # Process limits
         self.max_concurrent_launches = 2  # Limit concurrent launches
         self.max_roblox_processes = 999   # Unlimited Roblox processes
+        # Launches that skip the HTTP session (browser automation, protocol handler starts) are
+        # not paced by its rate limiter, so they start at least this many seconds apart
+        self.unpaced_launch_spacing = 8.0
+        self._last_unpaced_launch = 0.0
+        self._spacing_lock = threading.Lock()
+        
+        # Browserless launch (authentication ticket over HTTP)
+        self.browserless_launch = True  # Fall back to the browser only when this fails
+        self.endpoints = None  # Optional endpoint overrides, see auth_ticket.load_endpoints
+        self._ticket_client = None
+        self._link_resolver = None
+        self._cookie_validator = None
+        
+        # Dashboard metrics (see metrics.py); launch counters are fed from the event stream
+        subscribe_launch_metrics(self.events, self.metrics)
+        self.metrics.gauge('rmam_roblox_clients', 'Running Roblox client processes').set_function(
+            lambda: self._count_roblox_processes())
         
     def _log_status(self, message: str) -> None:
-        """Log status with callback or print."""
+        """Publish status text; also hand it to the callback, or print it when nobody is listening."""
+        self.events.publish(STATUS, message=message)
         if self.callback:
             self.callback(message)
-        else:
+        elif not self.events.has_subscribers(STATUS):
             print(f"[RobloxLauncher] {message}")
+
+    def _report_error(self, account_name: Optional[str], message: str, error: Optional[Exception] = None) -> None:
+        """Publish a typed error event and log the message as status text."""
+        self.events.publish(ERROR, account_name, message, error=str(error) if error else None)
+        errors = _launch_errors.get()
+        if errors is not None:
+            errors.append(str(error) if error else message)
+        self._log_status(message)
+    
+    def _space_unpaced_launch(self) -> None:
+        """Wait until unpaced_launch_spacing has passed since the last launch not paced by the HTTP session."""
+        if self.unpaced_launch_spacing <= 0:
+            return
+        with self._spacing_lock:
+            wait = self._last_unpaced_launch + self.unpaced_launch_spacing - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_unpaced_launch = time.monotonic()
     
     def _count_roblox_processes(self) -> int:
         """Count running Roblox processes with better error handling."""
@@ -111,33 +172,29 @@ class RobloxLauncher:
             self._log_status(f"⚠ Too many Roblox processes ({current_count}), waiting 5 seconds...")
             time.sleep(5)
 
+    @property
+    def preferred_browser(self) -> str:
+        """Preferred automation browser; waits for background detection on first use."""
+        if not self._preferred_browser:
+            self._preferred_browser = self._detect_default_browser()
+        return self._preferred_browser
+
+    @preferred_browser.setter
+    def preferred_browser(self, browser: str) -> None:
+        self._preferred_browser = browser
+
     def _detect_default_browser(self):
-        """Detect the default browser for automation."""
-        browsers_to_check = ['chrome', 'edge', 'firefox']
-        for browser in browsers_to_check:
-            if self._is_browser_available(browser):
-                return browser
-        return 'firefox'  # Fallback
-
-    def _is_browser_available(self, browser_type):
-        """Check if a specific browser is available."""
-        try:
-            if browser_type == 'chrome':
-                ChromeDriverManager().install()
-                return True
-            elif browser_type == 'edge':
-                EdgeChromiumDriverManager().install()
-                return True
-            elif browser_type == 'firefox':
-                GeckoDriverManager().install()
-                return True
-        except:
-            return False
-        return False
+        """Detect the default browser for automation (cached, see runtime.BrowserDetector)."""
+        return get_browser_detector().get()
 
-    def _setup_firefox_driver(self):
-        """Set up Firefox webdriver with proper options."""
+    def _setup_firefox_driver(self, cookie: Optional[str] = None, persistent_profile: Optional[str] = None):
+        """Set up Firefox webdriver with proper options, optionally with a pre-seeded cookie store."""
+        profile_dir = None
         try:
+            from selenium import webdriver
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            from webdriver_manager.firefox import GeckoDriverManager
             options = FirefoxOptions()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
@@ -169,18 +226,46 @@ class RobloxLauncher:
             options.set_preference("dom.webnotifications.enabled", False)
             options.set_preference("dom.push.enabled", False)
             
+            if self.lean_mode:
+                from page_load import apply_lean_firefox_options
+                apply_lean_firefox_options(options)
+            
+            if persistent_profile:
+                from page_load import undo_lean_proxy_prefs
+                undo_lean_proxy_prefs(options, persistent_profile)
+                if cookie:
+                    from cookie_seeding import write_firefox_cookie_store
+                    write_firefox_cookie_store(persistent_profile, cookie)
+                options.add_argument("-profile")
+                options.add_argument(persistent_profile)
+            elif cookie:
+                from cookie_seeding import build_firefox_cookie_profile
+                profile_dir = build_firefox_cookie_profile(cookie)
+                options.add_argument("-profile")
+                options.add_argument(profile_dir)
+            
             service = FirefoxService(GeckoDriverManager().install())
             driver = webdriver.Firefox(service=service, options=options)
-            driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(self._page_load_timeout())
             self.active_drivers.append(driver)
+            if profile_dir:
+                self._driver_profiles[driver] = profile_dir
+            if cookie:
+                self.cookie_seeded_drivers.add(driver)
             return driver
         except Exception as e:
             self._log_status(f"Failed to setup Firefox driver: {str(e)}")
+            if profile_dir:
+                shutil.rmtree(profile_dir, ignore_errors=True)
             return None
 
-    def _setup_chrome_driver(self):
-        """Set up Chrome webdriver with proper options."""
+    def _setup_chrome_driver(self, cookie: Optional[str] = None, persistent_profile: Optional[str] = None):
+        """Set up Chrome webdriver with proper options, optionally seeding the cookie over CDP."""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            from webdriver_manager.chrome import ChromeDriverManager
             options = ChromeOptions()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
@@ -193,19 +278,32 @@ class RobloxLauncher:
             options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            if self.lean_mode:
+                from page_load import apply_lean_chromium_options
+                apply_lean_chromium_options(options)
+            if persistent_profile:
+                options.add_argument(f"--user-data-dir={persistent_profile}")
             
             service = ChromeService(ChromeDriverManager().install())
             driver = webdriver.Chrome(service=service, options=options)
-            driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(self._page_load_timeout())
             self.active_drivers.append(driver)
+            self._seed_cookie_before_navigation(driver, cookie)
+            if self.lean_mode:
+                from page_load import enable_cdp_url_blocking
+                enable_cdp_url_blocking(driver)
             return driver
         except Exception as e:
             self._log_status(f"Failed to setup Chrome driver: {str(e)}")
             return None
 
-    def _setup_edge_driver(self):
-        """Set up Edge webdriver with proper options."""
+    def _setup_edge_driver(self, cookie: Optional[str] = None, persistent_profile: Optional[str] = None):
+        """Set up Edge webdriver with proper options, optionally seeding the cookie over CDP."""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.edge.options import Options as EdgeOptions
+            from selenium.webdriver.edge.service import Service as EdgeService
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
             options = EdgeOptions()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
@@ -218,43 +316,202 @@ class RobloxLauncher:
             options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
+            if self.lean_mode:
+                from page_load import apply_lean_chromium_options
+                apply_lean_chromium_options(options)
+            if persistent_profile:
+                options.add_argument(f"--user-data-dir={persistent_profile}")
             
             service = EdgeService(EdgeChromiumDriverManager().install())
             driver = webdriver.Edge(service=service, options=options)
-            driver.set_page_load_timeout(30)
+            driver.set_page_load_timeout(self._page_load_timeout())
             self.active_drivers.append(driver)
+            self._seed_cookie_before_navigation(driver, cookie)
+            if self.lean_mode:
+                from page_load import enable_cdp_url_blocking
+                enable_cdp_url_blocking(driver)
             return driver
         except Exception as e:
             self._log_status(f"Failed to setup Edge driver: {str(e)}")
             return None
 
-    def _setup_browser_driver(self, browser_type=None):
-        """Set up browser driver with fallback options."""
-        browser_type = browser_type or self.preferred_browser
-        
+    def _page_load_timeout(self) -> int:
+        from page_load import LEAN_PAGE_LOAD_TIMEOUT, DEFAULT_PAGE_LOAD_TIMEOUT
+        return LEAN_PAGE_LOAD_TIMEOUT if self.lean_mode else DEFAULT_PAGE_LOAD_TIMEOUT
+
+    def _seed_cookie_before_navigation(self, driver, cookie: Optional[str]) -> None:
+        """Seed .ROBLOSECURITY over CDP so no warm-up page load is needed."""
+        if not cookie:
+            return
+        from cookie_seeding import seed_cookie_cdp
+        if seed_cookie_cdp(driver, cookie):
+            self.cookie_seeded_drivers.add(driver)
+
+    def _persistent_profile_for(self, account_name: Optional[str], browser_type: str) -> Optional[str]:
+        """Persistent profile directory for the account, or None when profiles are off."""
+        if not self.persistent_profiles or not account_name:
+            return None
+        return str(self.storage_manager.get_browser_profile_dir(account_name, browser_type))
+
+    @property
+    def engine_stats(self):
+        """Lazily loaded per-engine startup statistics."""
+        if self._engine_stats is None:
+            from engine_stats import EngineStats
+            self._engine_stats = EngineStats()
+        return self._engine_stats
+
+    def _setup_engine(self, browser_type: str, cookie: Optional[str], account_name: Optional[str]):
+        """Start one specific engine, wiring in the account's persistent profile if enabled."""
+        profile = self._persistent_profile_for(account_name, browser_type)
+        started_at = time.monotonic()
         if browser_type == 'firefox':
-            return self._setup_firefox_driver()
+            driver = self._setup_firefox_driver(cookie, profile)
         elif browser_type == 'chrome':
-            return self._setup_chrome_driver()
+            driver = self._setup_chrome_driver(cookie, profile)
         elif browser_type == 'edge':
-            return self._setup_edge_driver()
+            driver = self._setup_edge_driver(cookie, profile)
+        else:
+            return None
+        self.engine_stats.record(browser_type, time.monotonic() - started_at, driver is not None)
+        if driver and profile:
+            self._driver_accounts[driver] = account_name
+        if driver:
+            self.process_reaper.register_driver(self._reaper_key(driver), driver, self._driver_owner())
+        return driver
+
+    def _reaper_key(self, driver) -> str:
+        return f"driver-{id(driver)}"
+
+    def _driver_owner(self):
+        """
+        owner_alive for the process reaper: the launch running in this context,
+        or the calling thread when there is none (e.g. a hedge thread).
+        Launches run on pooled threads that never exit, so thread liveness alone
+        would never let the reaper reclaim a driver a failed launch left behind.
+        """
+        done = _launch_done.get()
+        if done is None:
+            return threading.current_thread().is_alive
+        return lambda: not done.is_set()
+
+    def _setup_browser_driver_hedged(self, cookie: Optional[str] = None, account_name: Optional[str] = None):
+        """
+        Start engines in order of recorded startup cost, racing the next one whenever
+        the current leader misses its latency budget. The first driver to come up
+        wins; any engine that finishes later is released as soon as it does.
+        """
+        engines = self.engine_stats.ordered(['chrome', 'edge', 'firefox'], preferred=self.preferred_browser)
+        results = queue.Queue()
+        state = {'winner': None}
+        state_lock = threading.Lock()
+        
+        def start_engine(engine):
+            driver = self._setup_engine(engine, cookie, account_name)
+            with state_lock:
+                is_loser = driver is not None and state['winner'] is not None
+                if not is_loser:
+                    results.put((engine, driver))
+            if is_loser:
+                self._log_status(f"Releasing slower {engine} driver")
+                self._release_driver(driver)
+        
+        def launch_next():
+            engine = engines[len(started)]
+            started.append(engine)
+            threading.Thread(target=start_engine, args=(engine,), daemon=True,
+                             name=f"hedge-{engine}").start()
+            return engine
+        
+        started = []
+        leader = launch_next()
+        deadline = time.monotonic() + self.hedge_timeout_seconds
+        finished = 0
+        while finished < len(engines) and time.monotonic() < deadline:
+            budget = self.hedge_budget_seconds or self.engine_stats.hedge_budget(leader)
+            wait = min(budget, deadline - time.monotonic()) if len(started) < len(engines) else deadline - time.monotonic()
+            try:
+                engine, driver = results.get(timeout=max(0.0, wait))
+            except queue.Empty:
+                if len(started) < len(engines):
+                    leader = launch_next()
+                    self._log_status(f"Browser startup slow, also starting {leader}")
+                continue
+            finished += 1
+            if driver is not None:
+                with state_lock:
+                    state['winner'] = driver
+                # The hedge thread exits now; the calling launch owns the driver from here on
+                self.process_reaper.set_owner(self._reaper_key(driver), self._driver_owner())
+                self._log_status(f"{engine} driver ready first")
+                # Drivers that finished in the meantime are losers too
+                while True:
+                    try:
+                        _, late_driver = results.get_nowait()
+                    except queue.Empty:
+                        break
+                    if late_driver is not None:
+                        self._release_driver(late_driver)
+                return driver
+            if len(started) < len(engines):
+                leader = launch_next()
+        with state_lock:
+            state['winner'] = False  # Anything still starting is released when it finishes
+        self._log_status("All browser engines failed to start")
+        return None
+
+    def _setup_browser_driver(self, browser_type=None, cookie: Optional[str] = None, account_name: Optional[str] = None):
+        """
+        Set up browser driver with fallback options.
+        Args:
+            browser_type: Browser to use; defaults to the preferred browser
+            cookie: Optional clean .ROBLOSECURITY value to seed before the first navigation
+            account_name: Account being launched; selects its persistent profile if enabled
+        """
+        if self.hedged_startup and browser_type is None:
+            return self._setup_browser_driver_hedged(cookie, account_name)
+        browser_type = browser_type or self.preferred_browser
+        
+        if browser_type in ('firefox', 'chrome', 'edge'):
+            return self._setup_engine(browser_type, cookie, account_name)
         else:
             # Try fallback browsers
             for fallback in ['firefox', 'chrome', 'edge']:
                 if fallback != browser_type:
                     self._log_status(f"Trying fallback browser: {fallback}")
-                    if fallback == 'firefox':
-                        driver = self._setup_firefox_driver()
-                    elif fallback == 'chrome':
-                        driver = self._setup_chrome_driver()
-                    elif fallback == 'edge':
-                        driver = self._setup_edge_driver()
-                    
+                    driver = self._setup_engine(fallback, cookie, account_name)
                     if driver:
                         return driver
         
         return None
 
+    def _release_driver(self, driver) -> None:
+        """Quit a driver and drop all bookkeeping for it, including any temporary profile."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        if driver in self.active_drivers:
+            self.active_drivers.remove(driver)
+        self.cookie_seeded_drivers.discard(driver)
+        profile_dir = self._driver_profiles.pop(driver, None)
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        self.process_reaper.release(self._reaper_key(driver))
+        account_name = self._driver_accounts.pop(driver, None)
+        if account_name:
+            self.storage_manager.enforce_browser_profile_cap(account_name, self.profile_size_cap_mb * 1024 * 1024)
+
+    def reset_browser_profile(self, account_name: str) -> bool:
+        """Delete an account's persistent browser profile so the next launch starts clean."""
+        if account_name in self._driver_accounts.values():
+            self._log_status(f"Can't reset browser profile for {account_name} while its browser is running")
+            return False
+        success = self.storage_manager.reset_browser_profile(account_name)
+        if success:
+            self._log_status(f"Browser profile reset for {account_name}")
+        return success
+
     def _inject_cookie(self, driver, roblosecurity_cookie: str) -> bool:
         """
         Inject .ROBLOSECURITY cookie into the browser session.
@@ -264,6 +521,9 @@ class RobloxLauncher:
         Returns:
             True if injection was successful, False otherwise
         """
+        if driver in self.cookie_seeded_drivers:
+            self._log_status("Cookie was seeded before navigation, skipping warm-up page load")
+            return True
         try:
             self._log_status("Navigating to Roblox for cookie injection...")
             driver.get("https://www.roblox.com")
@@ -301,23 +561,193 @@ class RobloxLauncher:
         Returns:
             Place ID string or special marker for private servers
         """
+        from link_resolver import parse_roblox_link
         try:
-            # Handle private server URLs
-            if 'roblox.com/share' in url.lower() and 'code=' in url.lower():
-                return "PRIVATE_SERVER"  # Special marker for private server URLs
-            
-            # Extract from regular game URLs
-            if 'roblox.com/games/' in url.lower():
-                parts = url.split('/games/')
-                if len(parts) > 1:
-                    place_id = parts[1].split('/')[0].split('?')[0]
-                    if place_id.isdigit():
-                        return place_id
+            parsed = parse_roblox_link(url)
+            if parsed['share_code']:
+                return "PRIVATE_SERVER"  # Special marker for share links; see _extract_place_and_link_code
+            return parsed['place_id']
         except Exception as e:
             self._log_status(f"Error extracting place ID: {e}")
-        
         return None
 
+    @property
+    def link_resolver(self):
+        """Lazily created LinkResolver shared by every launch in this process."""
+        if self._link_resolver is None:
+            from link_resolver import LinkResolver
+            self._link_resolver = LinkResolver(endpoints=self.endpoints)
+        return self._link_resolver
+
+    def _extract_place_and_link_code(self, url: str, cookie: Optional[str] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Resolve a link to its place ID and private server link code.
+        Share links are resolved once and served from the link cache afterwards.
+        Args:
+            url: Roblox game, deep link or share link
+            cookie: .ROBLOSECURITY value used if a share link must be resolved
+        Returns:
+            Tuple of (place_id, link_code); either may be None
+        """
+        clean_cookie = _clean_roblosecurity_cookie(cookie) if cookie else None
+        resolved = self.link_resolver.resolve(url, cookie=clean_cookie)
+        if not resolved:
+            return None, None
+        return resolved['place_id'], resolved.get('link_code')
+
+    @property
+    def launch_queue(self):
+        """Durable record of batch progress (see launch_queue.py)."""
+        return get_launch_queue()
+
+    def resume_batch(self, batch_id: int, accounts_data: dict):
+        """
+        Launch the accounts a previous run left pending in an improved-method batch.
+        Args:
+            batch_id: Batch from launch_queue.unfinished_batches()
+            accounts_data: Vault contents {account_name: cookie}
+        Returns:
+            Future resolving to the number of accounts launched
+        """
+        batch = next((b for b in self.launch_queue.unfinished_batches() if b['id'] == batch_id), None)
+        if not batch:
+            raise ValueError(f"Batch {batch_id} has nothing left to launch")
+        missing = [name for name in batch['remaining'] if name not in accounts_data]
+        for name in missing:
+            if self.launch_queue.claim(batch_id, name):
+                self.launch_queue.mark(batch_id, name, FAILED, 'account removed')
+        remaining = [(name, accounts_data[name]) for name in batch['remaining'] if name in accounts_data]
+        self._log_status(f"Resuming batch {batch_id}: {len(remaining)} account(s) left")
+        return self.launch_multiple_accounts_improved(remaining, batch['server_link'], batch_id=batch_id)
+
+    @property
+    def launch_history(self):
+        """Per-account record of past launches (see launch_history.py)."""
+        return get_launch_history()
+
+    def order_by_history(self, accounts_data: list, method: Optional[str] = None) -> list:
+        """
+        Reorder a batch so accounts most likely to launch, and to launch fast, go first.
+        Args:
+            accounts_data: List of (account_name, cookie)
+            method: Only use past launches made with this method
+        Returns:
+            The same (account_name, cookie) pairs, reordered; unchanged when history_ordering is off
+        """
+        if not self.history_ordering or len(accounts_data) < 2:
+            return list(accounts_data)
+        try:
+            order = self.launch_history.rank([name for name, _ in accounts_data], method=method)
+        except Exception as e:
+            self._log_status(f"Launch history unavailable, keeping selection order: {e}")
+            return list(accounts_data)
+        cookies = dict(accounts_data)
+        if order != [name for name, _ in accounts_data]:
+            self._log_status("Ordered batch by launch history: most reliable accounts first")
+        return [(name, cookies[name]) for name in order]
+
+    @property
+    def ticket_client(self):
+        """Lazily created AuthTicketClient on the shared HTTP session."""
+        if self._ticket_client is None:
+            from auth_ticket import AuthTicketClient
+            self._ticket_client = AuthTicketClient(endpoints=self.endpoints)
+        return self._ticket_client
+
+    @property
+    def cookie_validator(self):
+        """Lazily created CookieValidator on the shared HTTP session."""
+        if self._cookie_validator is None:
+            from cookie_validator import CookieValidator
+            self._cookie_validator = CookieValidator(endpoints=self.endpoints)
+        return self._cookie_validator
+
+    def filter_valid_accounts(self, accounts_data: list) -> list:
+        """
+        Drop accounts whose cookie is rejected, checking all cookies concurrently.
+        Accounts whose check fails for network reasons are kept.
+        Args:
+            accounts_data: List of (account_name, cookie)
+        Returns:
+            List of (account_name, cookie) that may still launch
+        """
+        if not accounts_data:
+            return []
+        self._log_status(f"Checking {len(accounts_data)} cookie(s) before launch...")
+        cleaned = [(name, _clean_roblosecurity_cookie(cookie)) for name, cookie in accounts_data]
+        try:
+            results = self.cookie_validator.check_many(cleaned)
+        except Exception as e:
+            self._log_status(f"Cookie pre-check unavailable, launching all accounts: {e}")
+            return list(accounts_data)
+        invalid = [name for name, _ in accounts_data if results.get(name) is False]
+        unknown = [name for name, _ in accounts_data if results.get(name) is None]
+        if invalid:
+            self._log_status(f"✗ Skipping {len(invalid)} account(s) with expired cookies: {', '.join(invalid)}")
+        if unknown:
+            self._log_status(f"⚠ Could not verify {len(unknown)} cookie(s); launching them anyway")
+        return [(name, cookie) for name, cookie in accounts_data if results.get(name) is not False]
+
+    def _open_protocol_uri(self, uri: str) -> None:
+        """Hand a roblox-player: URI to the registered protocol handler."""
+        if hasattr(os, 'startfile'):
+            os.startfile(uri)
+        else:
+            webbrowser.open(uri)
+
+    def _wait_for_new_process(self, initial_processes: int, max_wait_time: int = 25, check_interval: int = 2) -> bool:
+        """Poll until the Roblox process count rises above initial_processes."""
+        for elapsed in range(0, max_wait_time, check_interval):
+            time.sleep(check_interval)
+            if self._count_roblox_processes() > initial_processes:
+                return True
+        return False
+
+    def _launch_with_auth_ticket(self, account_name: str, cookie: str, server_link: str) -> Optional[bool]:
+        """
+        Launch without a browser by exchanging the cookie for an authentication ticket.
+        Returns:
+            True/False for a launch attempt, or None if the link can't be launched this way
+        """
+        from auth_ticket import AuthTicketError, build_launch_uri
+        with start_span('link_resolution', account_name) as span:
+            place_id, link_code = self._extract_place_and_link_code(server_link, cookie)
+            span.end(ok=place_id is not None)
+        if not place_id:
+            return None
+        span = start_span('auth_ticket', account_name)
+        try:
+            self._log_status(f"Requesting authentication ticket for {account_name}...")
+            ticket = self.ticket_client.fetch_auth_ticket(_clean_roblosecurity_cookie(cookie))
+            span.end()
+        except AuthTicketError as e:
+            span.end(ok=False, error=str(e))
+            self._report_error(account_name, f"✗ Authentication ticket failed for {account_name}: {e}", e)
+            return False
+        except Exception as e:
+            span.end(ok=False, error=str(e))
+            self._report_error(account_name, f"Authentication ticket request error for {account_name}: {e}", e)
+            return None
+        launch_uri = build_launch_uri(ticket, place_id, link_code=link_code,
+                                      endpoints=self.ticket_client.endpoints)
+        initial_processes = self._count_roblox_processes()
+        self._log_status(f"Launching place {place_id} for {account_name} without a browser...")
+        try:
+            with start_span('protocol_trigger', account_name, method='auth_ticket'):
+                self._open_protocol_uri(launch_uri)
+        except Exception as e:
+            self._report_error(account_name, f"Failed to open roblox-player protocol for {account_name}: {e}", e)
+            return False
+        with start_span('pid_detection', account_name) as span:
+            detected = self._wait_for_new_process(initial_processes)
+            span.end(ok=detected)
+        if detected:
+            self.events.publish(PID_BOUND, account_name)
+            self._log_status(f"✓ New Roblox process detected for {account_name}")
+            return True
+        self._log_status(f"⚠ No new Roblox process detected for {account_name}")
+        return False
+
     def _create_isolation_with_retry(self, account_name: str) -> Tuple[bool, Optional[Path]]:
         """Create storage isolation with retry logic for Windows symlink limitations."""
         max_retries = 3
@@ -346,58 +776,65 @@ class RobloxLauncher:
             except Exception as e:
                 self._log_status(f"Isolation attempt {attempt + 1} failed for {account_name}: {e}")
         
-        self._log_status(f"✗ All isolation attempts failed for {account_name}")
+        self._report_error(account_name, f"✗ All isolation attempts failed for {account_name}")
         return False, None
 
     def _launch_with_process_verification(self, account_name: str, cookie: str, server_link: str) -> bool:
         """Launch account with actual process verification instead of just thread completion."""
         driver = None
         try:
+            clean_cookie = _clean_roblosecurity_cookie(cookie)
             self._log_status(f"Setting up browser driver for {account_name}...")
-            driver = self._setup_browser_driver()
+            with start_span('driver_setup', account_name) as span:
+                driver = self._setup_browser_driver(cookie=clean_cookie, account_name=account_name)
+                span.end(ok=driver is not None)
             if not driver:
                 raise Exception("Failed to setup browser driver")
             
-            # Navigate and inject cookie
-            self._log_status("Navigating to Roblox.com...")
-            driver.get("https://www.roblox.com")
-            time.sleep(2)
-            
-            driver.delete_all_cookies()
-            
-            # Clean cookie
-            clean_cookie = _clean_roblosecurity_cookie(cookie)
-            
-            self._log_status("Adding authentication cookie...")
-            driver.add_cookie({
-                'name': '.ROBLOSECURITY',
-                'value': clean_cookie,
-                'domain': '.roblox.com',
-                'path': '/',
-                'secure': True,
-                'httpOnly': True
-            })
-            
-            # Verify cookie injection
-            cookies = driver.get_cookies()
-            cookie_present = any(c['name'] == '.ROBLOSECURITY' for c in cookies)
-            self._log_status(f".ROBLOSECURITY present after injection: {cookie_present}")
-            
-            if not cookie_present:
-                raise Exception("Cookie injection failed")
+            if driver in self.cookie_seeded_drivers:
+                self._log_status("Authentication cookie seeded before navigation")
+            else:
+                injection_span = start_span('cookie_injection', account_name)
+                # Navigate and inject cookie
+                self._log_status("Navigating to Roblox.com...")
+                driver.get("https://www.roblox.com")
+                time.sleep(2)
+                
+                driver.delete_all_cookies()
+                
+                self._log_status("Adding authentication cookie...")
+                driver.add_cookie({
+                    'name': '.ROBLOSECURITY',
+                    'value': clean_cookie,
+                    'domain': '.roblox.com',
+                    'path': '/',
+                    'secure': True,
+                    'httpOnly': True
+                })
+                
+                # Verify cookie injection
+                cookies = driver.get_cookies()
+                cookie_present = any(c['name'] == '.ROBLOSECURITY' for c in cookies)
+                self._log_status(f".ROBLOSECURITY present after injection: {cookie_present}")
+                injection_span.end(ok=cookie_present)
+                
+                if not cookie_present:
+                    raise Exception("Cookie injection failed")
             
             # Load the private server link and trigger protocol
             self._log_status(f"Loading private server link for {account_name}...")
             initial_processes = self._count_roblox_processes()
             self._log_status(f"Roblox processes before launch: {initial_processes}")
             
-            driver.get(server_link)
+            with start_span('navigation', account_name):
+                driver.get(server_link)
             self._log_status(f"Waiting for Roblox protocol to trigger for {account_name}...")
             
             # Better process detection with incremental checks
             max_wait_time = 25
             check_interval = 2
             new_process_detected = False
+            detection_span = start_span('pid_detection', account_name)
             
             for elapsed in range(0, max_wait_time, check_interval):
                 time.sleep(check_interval)
@@ -425,7 +862,7 @@ class RobloxLauncher:
                 # Final attempt with direct protocol
                 try:
                     roblox_protocol = f"roblox-player:1+launchmode:play+gameinfo:{server_link}"
-                    subprocess.run(['cmd', '/c', 'start', '', roblox_protocol], shell=True)
+                    self._open_protocol_uri(roblox_protocol)
                     time.sleep(5)
                     final_check = self._count_roblox_processes()
                     if final_check > initial_processes:
@@ -433,6 +870,9 @@ class RobloxLauncher:
                         self._log_status(f"✓ Direct protocol launch worked for {account_name}")
                 except:
                     pass
+            detection_span.end(ok=new_process_detected)
+            if new_process_detected:
+                self.events.publish(PID_BOUND, account_name)
             
             # Additional wait for Roblox to fully initialize
             if new_process_detected:
@@ -445,16 +885,23 @@ class RobloxLauncher:
             return new_process_detected
             
         except Exception as e:
-            self._log_status(f"Launch verification failed for {account_name}: {str(e)}")
+            self._report_error(account_name, f"Launch verification failed for {account_name}: {str(e)}", e)
             return False
         finally:
             if driver:
-                try:
-                    driver.quit()
-                    if driver in self.active_drivers:
-                        self.active_drivers.remove(driver)
-                except:
-                    pass
+                self._release_driver(driver)
+
+    def _track_launch(self, account_name: str, server_url: str, method: str) -> None:
+        """Record a launch in active_launches, dropping entries past the retention window."""
+        now = time.time()
+        for name, info in list(self.active_launches.items()):
+            if now - info.get('launched_at', 0) > self.launch_retention_seconds:
+                self.active_launches.pop(name, None)
+        self.active_launches[account_name] = {
+            'server_url': server_url,
+            'launched_at': now,
+            'method': method
+        }
 
     def launch_account_direct_protocol(self, account_name: str, roblosecurity_cookie: str, server_link: str):
         """Launch account using direct protocol method (for improved launcher compatibility)."""
@@ -469,100 +916,162 @@ class RobloxLauncher:
                     return False
                 
                 if place_id == "PRIVATE_SERVER":
-                    launch_url = server_link
-                    self._log_status(f"Launching private server URL directly for {account_name}: {server_link}")
+                    with start_span('link_resolution', account_name) as span:
+                        resolved_place, link_code = self._extract_place_and_link_code(server_link, roblosecurity_cookie)
+                        span.end(ok=resolved_place is not None)
+                    if resolved_place and link_code:
+                        launch_url = f"roblox://experiences/start?placeId={resolved_place}&linkCode={link_code}"
+                        self._log_status(f"Launching resolved private server {resolved_place} for {account_name}")
+                    else:
+                        launch_url = server_link
+                        self._log_status(f"Launching private server URL directly for {account_name}: {server_link}")
                 else:
                     launch_url = f"roblox://placeID={place_id}"
                     self._log_status(f"Launching place ID {place_id} for {account_name} via protocol")
                 
                 # Launch via protocol
-                process = subprocess.Popen(
-                    ['cmd', '/c', 'start', '', launch_url],
-                    shell=True,
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL
-                )
+                self._space_unpaced_launch()
+                with start_span('protocol_trigger', account_name, method='direct_protocol'):
+                    self._open_protocol_uri(launch_url)
                 
-                self.active_launches[account_name] = {
-                    'process': process,
-                    'server_url': server_link,
-                    'launched_at': time.time(),
-                    'method': 'direct_protocol'
-                }
+                self._track_launch(account_name, server_link, 'direct_protocol')
                 
                 self._log_status(f"Direct protocol launch initiated for {account_name}")
                 return True
                 
             except Exception as e:
-                self._log_status(f"Direct protocol launch failed for {account_name}: {e}")
+                self._report_error(account_name, f"Direct protocol launch failed for {account_name}: {e}", e)
                 return False
         
-        thread = threading.Thread(target=launch_thread, daemon=True)
-        thread.start()
-        self.launch_threads.append(thread)
-        return thread
+        return self.launch_executor.submit(account_name, 'direct_protocol',
+                                           self._timed_launch, 'direct_protocol', account_name, launch_thread)
 
     def launch_account(self, account_name: str, roblosecurity_cookie: str, server_link: str):
         """Launch account using browser automation method."""
         def launch_thread():
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import TimeoutException
+            driver = None
             try:
                 self._log_status(f"Starting browser automation launch for {account_name}...")
-                driver = self._setup_browser_driver()
+                self._space_unpaced_launch()
+                with start_span('driver_setup', account_name) as span:
+                    driver = self._setup_browser_driver(cookie=_clean_roblosecurity_cookie(roblosecurity_cookie),
+                                                        account_name=account_name)
+                    span.end(ok=driver is not None)
                 if not driver:
                     raise Exception("Failed to setup browser driver")
                 
                 # Inject cookie and navigate
-                if not self._inject_cookie(driver, roblosecurity_cookie):
+                with start_span('cookie_injection', account_name) as span:
+                    injected = self._inject_cookie(driver, roblosecurity_cookie)
+                    span.end(ok=injected)
+                if not injected:
                     raise Exception("Failed to inject authentication cookie")
                 
                 self._log_status(f"Navigating to game page for {account_name}...")
-                driver.get(server_link)
+                with start_span('navigation', account_name):
+                    driver.get(server_link)
                 time.sleep(3)
                 
                 # Try to click play button if it exists
-                try:
-                    play_button = WebDriverWait(driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary-md') or contains(text(), 'Play')]"))
-                    )
-                    play_button.click()
-                    self._log_status(f"Play button clicked for {account_name}")
-                except TimeoutException:
-                    self._log_status(f"No play button found for {account_name}, protocol should auto-trigger")
+                with start_span('protocol_trigger', account_name, method='play_button') as span:
+                    try:
+                        play_button = WebDriverWait(driver, 10).until(
+                            EC.element_to_be_clickable((By.XPATH, "//button[contains(@class, 'btn-primary-md') or contains(text(), 'Play')]"))
+                        )
+                        play_button.click()
+                        self._log_status(f"Play button clicked for {account_name}")
+                    except TimeoutException:
+                        span.attrs['play_button'] = False
+                        self._log_status(f"No play button found for {account_name}, protocol should auto-trigger")
                 
                 time.sleep(5)  # Wait for Roblox to launch
                 
-                self.active_launches[account_name] = {
-                    'process': None,
-                    'server_url': server_link,
-                    'launched_at': time.time(),
-                    'method': 'browser_automation'
-                }
+                self._track_launch(account_name, server_link, 'browser_automation')
                 
                 self._log_status(f"Browser automation launch completed for {account_name}")
                 return True
                 
             except Exception as e:
-                self._log_status(f"Browser automation launch failed for {account_name}: {e}")
+                self._report_error(account_name, f"Browser automation launch failed for {account_name}: {e}", e)
                 return False
             finally:
                 if driver:
-                    try:
-                        driver.quit()
-                        if driver in self.active_drivers:
-                            self.active_drivers.remove(driver)
-                    except:
-                        pass
+                    self._release_driver(driver)
         
-        thread = threading.Thread(target=launch_thread, daemon=True)
-        thread.start()
-        self.launch_threads.append(thread)
-        return thread
+        return self.launch_executor.submit(account_name, 'browser_automation',
+                                           self._timed_launch, 'browser_automation', account_name, launch_thread)
 
-    def launch_account_improved(self, account_name: str, cookie: str, server_link: str) -> bool:
-        """Launch account with improved process verification and isolation."""
+    def _timed_launch(self, method: str, account_name: str, launch_fn):
+        """
+        Run launch_fn under an end-to-end 'launch' span, bracketed by launch started/finished events.
+        The launch, its phases and any failure reason are written to the launch history.
+        """
+        started_event = self.events.publish(LAUNCH_STARTED, account_name, method=method)
+        outcome = 'error'
+        started = time.perf_counter()
+        done = threading.Event()
+        done_token = _launch_done.set(done)
+        phases, errors = [], []
+        errors_token = _launch_errors.set(errors)
+        try:
+            with collect_phases(phases), start_span('launch', account_name, method=method) as span:
+                result = launch_fn()
+                outcome = 'success' if result else 'failure'
+                span.end(ok=bool(result))
+                return result
+        except Exception as e:
+            self._report_error(account_name, f"Launch crashed for {account_name}: {e}", e)
+            raise
+        finally:
+            done.set()
+            _launch_done.reset(done_token)
+            _launch_errors.reset(errors_token)
+            duration_ms = round((time.perf_counter() - started) * 1000, 1)
+            self._record_launch(started_event.time, method, account_name, outcome, duration_ms, phases, errors)
+            self.events.publish(LAUNCH_FINISHED, account_name, method=method, outcome=outcome,
+                                ok=outcome == 'success', duration_ms=duration_ms)
+
+    def _record_launch(self, started_at: float, method: str, account_name: str, outcome: str,
+                       duration_ms: float, phases: list, errors: list) -> None:
+        """
+        Write a finished launch to the history.
+        Args:
+            phases: Span fields collected for this launch (see telemetry.collect_phases)
+            errors: Error texts reported during the launch; the last one is the failure reason
+        """
+        reason = errors[-1] if errors else None
+        batch = None
+        rows = []
+        for phase in phases:
+            if phase['phase'] == 'launch':
+                batch = phase.get('batch')
+                continue
+            rows.append((phase['phase'], phase['duration_ms'], phase['ok']))
+            if reason is None and not phase['ok']:
+                reason = phase.get('error') or f"{phase['phase']} failed"
+        if outcome == 'success':
+            reason = None
+        try:
+            self.launch_history.record(account_name, method, started_at, duration_ms, outcome,
+                                       reason=reason, phases=rows, batch=batch)
+        except Exception as e:
+            print(f"Failed to record launch history for {account_name}: {e}")
+
+    def launch_account_improved(self, account_name: str, cookie: str, server_link: str,
+                                wait_for_limit: bool = True) -> bool:
+        """
+        Launch account with improved process verification and isolation.
+        Args:
+            wait_for_limit: Wait here for the Roblox process limit; False when the caller already has
+        """
         try:
             # Wait for process limit
-            self._wait_for_process_limit()
+            if wait_for_limit:
+                self._wait_for_process_limit()
             
             # Create isolation with retry
             isolation_success, backup_path = self._create_isolation_with_retry(account_name)
@@ -570,15 +1079,22 @@ class RobloxLauncher:
                 self._log_status(f"Failed to create isolation for {account_name}")
                 return False
             
-            # Launch with process verification
-            success = self._launch_with_process_verification(account_name, cookie, server_link)
+            # Launch without a browser when possible, otherwise with process verification
+            success = None
+            if self.browserless_launch:
+                success = self._launch_with_auth_ticket(account_name, cookie, server_link)
+            if success is None:
+                # Browser fallback: nothing paces it but the launch spacing
+                self._space_unpaced_launch()
+                success = self._launch_with_process_verification(account_name, cookie, server_link)
             
             if success:
                 self._log_status(f"✓ {account_name} launched successfully with process verification")
                 
                 # Wait for Roblox to initialize and cache session
                 self._log_status(f"Waiting for Roblox to initialize for {account_name}...")
-                time.sleep(10)
+                with start_span('init_wait', account_name):
+                    time.sleep(10)
                 
                 # Remove isolation after launch
                 self._log_status(f"Removing temporary isolation for {account_name}...")
@@ -593,36 +1109,70 @@ class RobloxLauncher:
                 return False
                 
         except Exception as e:
-            self._log_status(f"Improved launch failed for {account_name}: {str(e)}")
+            self._report_error(account_name, f"Improved launch failed for {account_name}: {str(e)}", e)
             return False
 
-    def launch_multiple_accounts_improved(self, accounts_data: list, server_link: str) -> None:
-        """Launch multiple accounts using the improved method with better rate limiting."""
+    def launch_multiple_accounts_improved(self, accounts_data: list, server_link: str, batch_id: Optional[int] = None):
+        """
+        Launch multiple accounts using the improved method with better rate limiting.
+        Args:
+            accounts_data: List of (account_name, cookie)
+            server_link: Game or private-server link
+            batch_id: Durable queue batch to resume; a new batch is recorded when omitted
+        Returns:
+            Future resolving to the number of accounts launched
+        """
+        launch_queue = self.launch_queue
+        if batch_id is None:
+            batch_id = launch_queue.create_batch([name for name, _ in accounts_data], server_link, 'improved')
+        
         def batch_launch():
+            set_batch(batch_id)
             self._log_status(f"Starting improved batch launch for {len(accounts_data)} accounts...")
             success_count = 0
+            total_accounts = len(accounts_data)
+            valid_accounts = self.filter_valid_accounts(accounts_data)
+            valid_names = {name for name, _ in valid_accounts}
+            for account_name, _ in accounts_data:
+                if account_name not in valid_names and launch_queue.claim(batch_id, account_name):
+                    launch_queue.mark(batch_id, account_name, FAILED, 'invalid cookie')
+            valid_accounts = self.order_by_history(valid_accounts, method='improved')
+            
+            # Resolve share links once for the whole batch; later lookups hit the link cache
+            if valid_accounts and self._extract_place_id(server_link) == "PRIVATE_SERVER":
+                place_id, link_code = self._extract_place_and_link_code(server_link, valid_accounts[0][1])
+                if place_id:
+                    self._log_status(f"Resolved share link to place {place_id} (link code cached for this batch)")
+                else:
+                    self._log_status("⚠ Could not resolve share link; falling back to browser launches")
             
-            for i, (account_name, cookie) in enumerate(accounts_data):
-                self._log_status(f"Launching account {i+1}/{len(accounts_data)}: {account_name}")
+            for i, (account_name, cookie) in enumerate(valid_accounts):
+                if self.launch_executor.cancel_requested:
+                    self._log_status(f"Batch launch cancelled after {i}/{len(valid_accounts)} accounts")
+                    launch_queue.discard_batch(batch_id)
+                    break
+                if not launch_queue.claim(batch_id, account_name):
+                    self._log_status(f"Skipping {account_name}: already handled in batch {batch_id}")
+                    continue
+                self._log_status(f"Launching account {i+1}/{len(valid_accounts)}: {account_name}")
                 
-                success = self.launch_account_improved(account_name, cookie, server_link)
+                success = self._timed_launch('improved', account_name,
+                                             lambda: self.launch_account_improved(account_name, cookie, server_link))
+                launch_queue.mark(batch_id, account_name, LAUNCHED if success else FAILED)
                 if success:
                     success_count += 1
                     self._log_status(f"✓ {account_name} launched successfully")
                 else:
                     self._log_status(f"✗ {account_name} launch failed")
                 
-                # Delay between launches
-                if i < len(accounts_data) - 1:
-                    delay = 3 + random.uniform(1, 3)  # 3-6 second random delay
-                    self._log_status(f"Waiting {delay:.1f} seconds before next launch...")
-                    time.sleep(delay)
+                # No blind delay between launches: ticket launches are paced per host by the
+                # shared HTTP session, browser fallbacks by unpaced_launch_spacing
             
-            self._log_status(f"Batch launch completed: {success_count}/{len(accounts_data)} successful")
+            launch_queue.finish_batch(batch_id)
+            self._log_status(f"Batch launch completed: {success_count}/{total_accounts} successful")
+            return success_count
         
-        thread = threading.Thread(target=batch_launch, daemon=True)
-        thread.start()
-        self.launch_threads.append(thread)
+        return self.launch_executor.submit(f"batch of {len(accounts_data)}", 'batch_improved', batch_launch)
 
     def launch_account_with_temporary_isolation(self, account_name: str, roblosecurity_cookie: str, server_url: str) -> bool:
         """
@@ -638,18 +1188,17 @@ class RobloxLauncher:
             
             self._log_status(f"Launching Roblox with browser automation for {account_name}...")
             self._log_status(f"Detected browser: {self.preferred_browser}")
-            launch_thread = self.launch_account(account_name, roblosecurity_cookie, server_url)
-            if not launch_thread:
-                raise Exception("Failed to start browser automation (no supported browser found)")
-            
-            # Wait for the launch thread to complete and check if it was successful
-            launch_thread.join(timeout=60)  # Wait up to 60 seconds for launch to complete
+            launch_future = self.launch_account(account_name, roblosecurity_cookie, server_url)
             
-            # Check if any drivers were actually created (indicates success)
-            if not self.active_drivers:
-                raise Exception("Browser automation failed - no active browser sessions created")
+            # Wait for the launch to complete and check if it was successful
+            try:
+                launched = launch_future.result(timeout=60)
+            except FutureTimeoutError:
+                raise Exception("Browser automation did not finish within 60 seconds")
+            if not launched:
+                raise Exception("Browser automation failed")
                 
-            self._log_status(f"Launch thread completed for {account_name}")
+            self._log_status(f"Launch completed for {account_name}")
             self._log_status(f"Waiting for Roblox to initialize for {account_name}...")
             time.sleep(10)  # Give Roblox time to start and cache the session
             
@@ -689,22 +1238,21 @@ class RobloxLauncher:
         
         # Stop all active drivers
         for driver in self.active_drivers.copy():
-            try:
-                driver.quit()
-                stopped_count += 1
-            except:
-                pass
+            self._release_driver(driver)
+            stopped_count += 1
         self.active_drivers.clear()
         
-        # Clean up launch threads
-        for thread in self.launch_threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
-        self.launch_threads.clear()
+        # Cancel queued launches and give running ones a moment to notice
+        cancelled = self.launch_executor.cancel_all(timeout=5)
+        if cancelled:
+            self._log_status(f"Cancelled {cancelled} queued launches")
         
         # Clean up active launches
         self.active_launches.clear()
         
+        # Anything a dead launch left running
+        self.process_reaper.reap()
+        
         self._log_status(f"Stopped {stopped_count} instances")
         return stopped_count
 
@@ -731,7 +1279,9 @@ class RobloxLauncher:
             **symlink_status,
             'active_launches': len(self.active_launches),
             'active_browser_sessions': len(self.active_sessions),
-            'active_launch_threads': len([t for t in self.launch_threads if t.is_alive()]),
+            'active_launch_threads': self.launch_executor.running_count,
+            'queued_launches': self.launch_executor.active_count - self.launch_executor.running_count,
+            'recent_launches': [record.to_dict() for record in self.launch_executor.history(limit=20)],
             'launches': launches
         }
 
@@ -766,7 +1316,7 @@ class RobloxLauncher:
     def get_status(self):
         """Get current launcher status."""
         active_count = len([d for d in self.active_drivers if d])
-        thread_count = len([t for t in self.launch_threads if t.is_alive()])
+        thread_count = self.launch_executor.running_count
         return f"Active browsers: {active_count}, Running threads: {thread_count}"
 
 
@@ -0,0 +1,178 @@
+"""
+Share-link and place-URL resolution with a persistent TTL cache.
+Turns any supported Roblox link into a place ID and (for private servers) a
+link code. Share links need one authenticated API call; the answer is
+memoized and persisted to link_cache.json next to saved_links.json, so a
+whole batch pays for a single resolution.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse, parse_qs
+
+from auth_ticket import load_endpoints
+from http_client import get_session
+
+LINK_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'link_cache.json')
+LINK_CACHE_TTL = 12 * 3600
+
+
+def parse_roblox_link(url: str) -> dict:
+    """
+    Parse a Roblox link without any network access.
+    Recognizes /games/<id>[/name][?privateServerLinkCode=], /games/start?placeId=,
+    roblox://...placeId= deep links and /share?code=...&type= links.
+    Args:
+        url: Link as pasted by the user
+    Returns:
+        Dictionary with place_id, link_code, share_code and share_type (None when absent)
+    """
+    result = {'place_id': None, 'link_code': None, 'share_code': None, 'share_type': None}
+    try:
+        parsed = urlparse(url.strip())
+        query = {key.lower(): values[0] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path.lower()
+        if path.rstrip('/').endswith('/share') and 'code' in query:
+            result['share_code'] = query['code']
+            result['share_type'] = query.get('type', 'Server')
+            return result
+        place_id = query.get('placeid')
+        if not place_id and '/games/' in path:
+            segment = parsed.path.split('/games/', 1)[1].split('/')[0]
+            if segment.isdigit():
+                place_id = segment
+        if not place_id and parsed.scheme == 'roblox':
+            # roblox://placeID=123 style deep links
+            for part in (parsed.netloc + parsed.path).replace('&', '/').split('/'):
+                key, _, value = part.partition('=')
+                if key.lower() == 'placeid':
+                    place_id = value
+        if place_id and place_id.isdigit():
+            result['place_id'] = place_id
+        result['link_code'] = query.get('privateserverlinkcode') or query.get('linkcode')
+    except Exception as e:
+        print(f"Failed to parse Roblox link: {e}")
+    return result
+
+
+class LinkResolver:
+    """
+    Resolves links to (place_id, link_code) with an in-memory and on-disk cache.
+    Concurrent resolutions of the same share link wait for a single request.
+    """
+
+    def __init__(self, session=None, endpoints: Optional[dict] = None,
+                 cache_file: str = LINK_CACHE_FILE, ttl_seconds: int = LINK_CACHE_TTL):
+        self.session = session or get_session()
+        self.endpoints = load_endpoints(endpoints)
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self._cache = {}  # {share_key: {'place_id', 'link_code', 'resolved_at'}}
+        self._inflight = {}  # {share_key: threading.Lock}
+        self._lock = threading.Lock()
+        self._load_cache()
+
+    def _share_key(self, share_code: str, share_type: str) -> str:
+        return f"{share_type.lower()}:{share_code}"
+
+    def _load_cache(self) -> None:
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    self._cache = json.load(f)
+        except Exception as e:
+            print(f"Failed to load link cache: {e}")
+            self._cache = {}
+
+    def _save_cache(self) -> None:
+        """Write the cache atomically."""
+        try:
+            now = time.time()
+            with self._lock:
+                fresh = {key: entry for key, entry in self._cache.items()
+                         if now - entry.get('resolved_at', 0) < self.ttl_seconds}
+            tmp_path = f"{self.cache_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(fresh, f, indent=2)
+            os.replace(tmp_path, self.cache_file)
+        except Exception as e:
+            print(f"Failed to save link cache: {e}")
+
+    def _cached(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry and time.time() - entry.get('resolved_at', 0) < self.ttl_seconds:
+            return entry
+        return None
+
+    def _resolve_share_link(self, share_code: str, share_type: str, cookie: str) -> Optional[dict]:
+        """Call the share-link API, handling the CSRF handshake."""
+        body = {'linkId': share_code, 'linkType': share_type}
+        headers = {'Referer': self.endpoints['referer']}
+        response = self.session.post(self.endpoints['resolve_share_link'], cookie=cookie,
+                                     headers=headers, json_body=body)
+        if response.status_code == 403 and response.headers.get('x-csrf-token'):
+            headers['X-CSRF-TOKEN'] = response.headers['x-csrf-token']
+            response = self.session.post(self.endpoints['resolve_share_link'], cookie=cookie,
+                                         headers=headers, json_body=body)
+        if response.status_code != 200:
+            print(f"Share link resolution failed (HTTP {response.status_code})")
+            return None
+        data = response.json()
+        invite = data.get('privateServerInviteData') or data.get('experienceInviteData') \
+            or data.get('experienceDetailsInviteData') or {}
+        place_id = invite.get('placeId')
+        if not place_id:
+            return None
+        return {'place_id': str(place_id), 'link_code': invite.get('linkCode')}
+
+    def resolve(self, url: str, cookie: Optional[str] = None) -> Optional[dict]:
+        """
+        Resolve a link to its place ID and private server link code.
+        Args:
+            url: Game, deep link or share link
+            cookie: Clean .ROBLOSECURITY value, needed only for uncached share links
+        Returns:
+            Dictionary with place_id and link_code, or None if it can't be resolved
+        """
+        parsed = parse_roblox_link(url)
+        if parsed['place_id']:
+            return {'place_id': parsed['place_id'], 'link_code': parsed['link_code']}
+        if not parsed['share_code']:
+            return None
+        key = self._share_key(parsed['share_code'], parsed['share_type'])
+        entry = self._cached(key)
+        if entry:
+            return {'place_id': entry['place_id'], 'link_code': entry.get('link_code')}
+        if not cookie:
+            return None
+        with self._lock:
+            inflight = self._inflight.setdefault(key, threading.Lock())
+        with inflight:
+            # Another thread may have resolved it while we waited
+            entry = self._cached(key)
+            if entry:
+                return {'place_id': entry['place_id'], 'link_code': entry.get('link_code')}
+            try:
+                resolved = self._resolve_share_link(parsed['share_code'], parsed['share_type'], cookie)
+            except Exception as e:
+                print(f"Share link resolution error: {e}")
+                resolved = None
+            if resolved:
+                with self._lock:
+                    self._cache[key] = {**resolved, 'resolved_at': time.time()}
+                self._save_cache()
+            with self._lock:
+                self._inflight.pop(key, None)
+            return resolved
+
+    def invalidate(self, url: str) -> None:
+        """Drop the cached resolution for a share link (e.g. after a failed join)."""
+        parsed = parse_roblox_link(url)
+        if parsed['share_code']:
+            with self._lock:
+                self._cache.pop(self._share_key(parsed['share_code'], parsed['share_type']), None)
+            self._save_cache()
@@ -0,0 +1,248 @@
+"""
+Saved game / private-server links.
+Links live in .data/saved_links.db (sqlite) with optional tags and usage
+stats. Every change is a single-row statement instead of a whole-file
+rewrite, and lookups go through indexes:
+- type-ahead on the name (indexed prefix range, then substring of name/url)
+- "#tag" terms in the query narrow to links carrying every such tag
+- results are ordered by last use, most recent first
+
+The old src/saved_links.json is imported the first time the store is opened.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from runtime import DATA_DIR
+
+SAVED_LINKS_DB = os.path.join(DATA_DIR, "saved_links.db")
+LEGACY_LINKS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saved_links.json")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    name TEXT PRIMARY KEY,
+    name_lower TEXT NOT NULL,
+    url TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL,
+    use_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS links_name_lower ON links(name_lower);
+CREATE INDEX IF NOT EXISTS links_last_used ON links(last_used_at DESC);
+CREATE TABLE IF NOT EXISTS link_tags (
+    name TEXT NOT NULL REFERENCES links(name) ON DELETE CASCADE ON UPDATE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (name, tag)
+);
+CREATE INDEX IF NOT EXISTS link_tags_tag ON link_tags(tag);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Most recently used first; never-used links by creation time
+_ORDER = "ORDER BY COALESCE(l.last_used_at, l.created_at) DESC, l.name_lower"
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> List[str]:
+    """Lowercase, strip '#' and whitespace, drop empties and duplicates (order kept)."""
+    seen = []
+    for tag in tags or ():
+        tag = tag.strip().lstrip('#').strip().lower()
+        if tag and tag not in seen:
+            seen.append(tag)
+    return seen
+
+
+def parse_tags(text: str) -> List[str]:
+    """Tags typed as 'event, private #vip' -> ['event', 'private', 'vip']."""
+    return normalize_tags(text.replace('#', ' ').replace(',', ' ').split())
+
+
+class SavedLinkStore:
+    """sqlite-backed saved links, safe to share between threads."""
+
+    def __init__(self, db_path: str = SAVED_LINKS_DB, legacy_file: Optional[str] = LEGACY_LINKS_FILE):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(_SCHEMA)
+        if legacy_file and self._meta('legacy_imported') is None:
+            if os.path.exists(legacy_file):
+                imported = self.import_json(legacy_file)
+                print(f"Imported {imported} saved link(s) from {os.path.basename(legacy_file)}")
+            self._set_meta('legacy_imported', str(time.time()))
+
+    def _execute(self, sql: str, params: tuple = ()):
+        with self._lock:
+            return self._conn.execute(sql, params)
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def save(self, name: str, url: str, tags: Optional[Iterable[str]] = None) -> None:
+        """
+        Add a link or update its URL (usage stats are kept).
+        Args:
+            name: Display name, unique
+            url: Game or private-server link
+            tags: Replace the link's tags when given
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT INTO links (name, name_lower, url, created_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET url = excluded.url",
+                    (name, name.lower(), url, now))
+                if tags is not None:
+                    self._replace_tags(name, tags)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _replace_tags(self, name: str, tags: Iterable[str]) -> None:
+        """Caller holds the lock and an open transaction."""
+        self._conn.execute("DELETE FROM link_tags WHERE name = ?", (name,))
+        self._conn.executemany("INSERT INTO link_tags (name, tag) VALUES (?, ?)",
+                               [(name, tag) for tag in normalize_tags(tags)])
+
+    def set_tags(self, name: str, tags: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._replace_tags(name, tags)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, name: str) -> bool:
+        return self._execute("DELETE FROM links WHERE name = ?", (name,)).rowcount == 1
+
+    def rename(self, old_name: str, new_name: str) -> bool:
+        cursor = self._execute("UPDATE links SET name = ?, name_lower = ? WHERE name = ?",
+                               (new_name, new_name.lower(), old_name))
+        return cursor.rowcount == 1
+
+    def touch(self, name: str) -> None:
+        """Record that a link was used (moves it to the top of the list)."""
+        self._execute("UPDATE links SET last_used_at = ?, use_count = use_count + 1 WHERE name = ?",
+                      (time.time(), name))
+
+    def get(self, name: str) -> Optional[dict]:
+        """
+        Returns:
+            {'name', 'url', 'tags', 'created_at', 'last_used_at', 'use_count'} or None
+        """
+        row = self._execute("SELECT name, url, created_at, last_used_at, use_count FROM links WHERE name = ?",
+                            (name,)).fetchone()
+        if not row:
+            return None
+        return {'name': row[0], 'url': row[1], 'tags': self.tags(name), 'created_at': row[2],
+                'last_used_at': row[3], 'use_count': row[4]}
+
+    def url(self, name: str) -> Optional[str]:
+        row = self._execute("SELECT url FROM links WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def tags(self, name: str) -> List[str]:
+        rows = self._execute("SELECT tag FROM link_tags WHERE name = ? ORDER BY tag", (name,)).fetchall()
+        return [row[0] for row in rows]
+
+    def all_tags(self) -> List[tuple]:
+        """[(tag, link count)] most used first."""
+        return self._execute("SELECT tag, COUNT(*) FROM link_tags GROUP BY tag ORDER BY COUNT(*) DESC, tag").fetchall()
+
+    def __contains__(self, name: str) -> bool:
+        return self._execute("SELECT 1 FROM links WHERE name = ?", (name,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._execute("SELECT COUNT(*) FROM links").fetchone()[0]
+
+    def search(self, query: str = "", limit: int = 50) -> List[str]:
+        """
+        Type-ahead lookup.
+        Args:
+            query: Free text plus optional '#tag' terms, e.g. "winter #private"
+            limit: Maximum names returned
+        Returns:
+            Matching names: name-prefix matches first, then substring matches on
+            name or URL; each group most recently used first
+        """
+        terms = query.strip().lower().split()
+        tags = normalize_tags(term for term in terms if term.startswith('#'))
+        text = " ".join(term for term in terms if not term.startswith('#'))
+        tag_filter, tag_params = "", ()
+        if tags:
+            tag_filter = (f" AND l.name IN (SELECT name FROM link_tags WHERE tag IN ({','.join('?' * len(tags))}) "
+                          f"GROUP BY name HAVING COUNT(*) = {len(tags)})")
+            tag_params = tuple(tags)
+        if not text:
+            rows = self._execute(f"SELECT l.name FROM links l WHERE 1 = 1{tag_filter} {_ORDER} LIMIT ?",
+                                 tag_params + (limit,)).fetchall()
+            return [row[0] for row in rows]
+        prefix = self._execute(
+            f"SELECT l.name FROM links l WHERE l.name_lower >= ? AND l.name_lower < ?{tag_filter} {_ORDER} LIMIT ?",
+            (text, text + '\uffff') + tag_params + (limit,)).fetchall()
+        names = [row[0] for row in prefix]
+        if len(names) < limit:
+            rest = self._execute(
+                f"SELECT l.name FROM links l WHERE NOT (l.name_lower >= ? AND l.name_lower < ?) "
+                f"AND (instr(l.name_lower, ?) > 0 OR instr(lower(l.url), ?) > 0){tag_filter} {_ORDER} LIMIT ?",
+                (text, text + '\uffff', text, text) + tag_params + (limit - len(names),)).fetchall()
+            names += [row[0] for row in rest]
+        return names
+
+    def import_json(self, path: str, overwrite: bool = False) -> int:
+        """
+        Import links from a saved_links.json-style file ({name: url}, or {name: {"url", "tags"}}).
+        Args:
+            path: JSON file
+            overwrite: Replace URLs of links that already exist
+        Returns:
+            Number of links added or updated
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        now = time.time()
+        count = 0
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for name, value in data.items():
+                    url, tags = (value.get('url'), value.get('tags')) if isinstance(value, dict) else (value, None)
+                    if not url:
+                        continue
+                    conflict = "DO UPDATE SET url = excluded.url" if overwrite else "DO NOTHING"
+                    cursor = self._conn.execute(
+                        f"INSERT INTO links (name, name_lower, url, created_at) VALUES (?, ?, ?, ?) "
+                        f"ON CONFLICT(name) {conflict}", (name, name.lower(), url, now))
+                    if cursor.rowcount:
+                        count += 1
+                        if tags:
+                            self._replace_tags(name, tags)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
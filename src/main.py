@@ -1,17 +1,23 @@
+import time
+_STARTUP_T0 = time.perf_counter()
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import threading
-import time
 import sys
 import os
-import json
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
+from concurrent.futures import TimeoutError as FutureTimeoutError
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from encryption import EncryptionManager
-from launcher import RobloxLauncher
+from runtime import get_launcher, get_browser_detector
+from http_client import TokenBucket
+from telemetry import set_batch
+from events import get_event_bus, attach_jsonl_sink, STATUS, LAUNCH_FINISHED
+from status_log import StatusLogView
+from account_list import AccountListView
+from ui_dispatch import UIDispatcher
+# Cold-start budget: process start to a fully built main window
+STARTUP_BUDGET_MS = 1500
+SAVED_LINKS_SHOWN = 50  # Dropdown entries; typing searches the rest
 # Legacy compatibility - improved launcher is now unified
 try:
     from launcher import ImprovedRobloxLauncher
@@ -22,13 +28,19 @@ class AccountManager:
     def __init__(self):
         self.root = tk.Tk()
         self.security_manager = EncryptionManager()
-        self.roblox_launcher = RobloxLauncher(callback=self.update_status)
+        self.roblox_launcher = get_launcher()
         self.accounts_data = {}
-        self.saved_links = {}  # Store loaded links
+        self.link_store = None  # SavedLinkStore, opened in load_saved_links
         self.master_password = None
         self._last_save_time = 0
         self._save_delay = 1.0  # Delay saves to batch them
         self.setup_ui()
+        # Launcher progress reaches the status log (and the event log file) through the event bus
+        get_event_bus().subscribe(lambda event: self.update_status(event.message), kinds=(STATUS,), name='ui-status')
+        get_event_bus().subscribe(lambda event: self.refresh_launch_stats([event.account]),
+                                  kinds=(LAUNCH_FINISHED,), name='ui-launch-stats')
+        attach_jsonl_sink()
+        self.start_metrics_endpoint()
         self.authenticate()
         
     def launch_with_improved_method(self):
@@ -59,8 +71,11 @@ class AccountManager:
         if not server_link or server_link == "Enter game/private server link...":
             messagebox.showwarning("Missing Link", "Please enter a valid server link.")
             return
-              # Initialize improved launcher
-        improved_launcher = RobloxLauncher(callback=self.update_status)
+        if self.use_daemon_var.get():
+            self.launch_via_daemon([name for name, _ in selected_accounts], server_link)
+            return
+        # Reuse the shared launcher instead of building a new one per click
+        improved_launcher = self.roblox_launcher
         
         # Disable launch button
         self.launch_button.config(state='disabled')
@@ -70,17 +85,45 @@ class AccountManager:
                 self.update_status("🚀 Starting IMPROVED launch method with enhanced success detection...")
                 self.update_status("✨ This fixes: False success reports, Process detection, Isolation failures, Firefox conflicts")
                   # Use improved launcher
-                improved_launcher.launch_multiple_accounts_improved(selected_accounts, server_link)
+                improved_launcher.launch_multiple_accounts_improved(selected_accounts, server_link).result()
                 
             except Exception as e:
                 self.update_status(f"Improved launch error: {e}")
             finally:
-                self.launch_button.config(state='normal')
+                self.ui.post(self.launch_button.config, key='launch_button', state='normal')
                 
         threading.Thread(target=launch_wrapper, daemon=True).start()
 
+    def launch_via_daemon(self, account_names, server_link):
+        """Queue a launch job on the headless daemon and mirror its progress in the status pane."""
+        from daemon import DaemonClient
+        client = DaemonClient.discover()
+        if not client:
+            messagebox.showerror("Daemon", "No launcher daemon is running.\nStart one with: python daemon.py serve")
+            return
+        self.launch_button.config(state='disabled')
+        def follow_job():
+            try:
+                job = client.launch(account_names, server_link)
+                self.update_status(f"Daemon job {job['id']} queued for {len(account_names)} account(s)")
+                for event in client.events():
+                    if event.get('job_id') != job['id']:
+                        continue
+                    if event['type'] == 'status':
+                        self.update_status(f"[daemon] {event['message']}")
+                    elif event['type'] == 'job_finished':
+                        self.update_status(f"Daemon job {job['id']} {event['state']}: {event.get('result') or event.get('error')}")
+                        break
+            except Exception as e:
+                self.update_status(f"Daemon launch error: {e}")
+            finally:
+                self.ui.post(self.launch_button.config, key='launch_button', state='normal')
+        threading.Thread(target=follow_job, daemon=True).start()
     def setup_ui(self):
         """Setup the main UI interface."""
+        # Worker threads hand widget updates to this queue; the main loop drains it every frame
+        self.ui = UIDispatcher(self.root)
+        self.ui.start()
         self.root.title("Roblox Multi-Account Manager")
         self.root.geometry("750x650")  # More compact size
         self.root.minsize(700, 600)    # Smaller minimum size
@@ -114,6 +157,10 @@ class AccountManager:
         accounts_header = ttk.Frame(accounts_section, style='Card.TFrame')
         accounts_header.pack(fill=tk.X, padx=8, pady=(8, 6))
         ttk.Label(accounts_header, text="Accounts", style='Header.TLabel').pack(side=tk.LEFT)
+        self.account_filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(accounts_header, textvariable=self.account_filter_var, width=16, font=('Segoe UI', 9))
+        filter_entry.pack(side=tk.LEFT, padx=(8, 0))
+        ttk.Label(accounts_header, text="filter", style='Body.TLabel').pack(side=tk.LEFT, padx=(2, 0))
         
         controls_frame = ttk.Frame(accounts_header, style='Card.TFrame')
         controls_frame.pack(side=tk.RIGHT)
@@ -128,16 +175,21 @@ class AccountManager:
         list_frame = ttk.Frame(accounts_section, style='Card.TFrame')
         list_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=(0, 8))
         
-        self.accounts_tree = ttk.Treeview(list_frame, columns=('cookie',), show='tree headings',
+        self.accounts_tree = ttk.Treeview(list_frame, columns=('cookie', 'success'), show='tree headings',
                                          height=8, selectmode='extended')  # Increased height
         self.accounts_tree.heading('#0', text='Account Name')
         self.accounts_tree.heading('cookie', text='Cookie')
+        self.accounts_tree.heading('success', text='Launch success')
         self.accounts_tree.column('#0', width=200, minwidth=150)  # Adjusted width
         self.accounts_tree.column('cookie', width=150, minwidth=100)
+        self.accounts_tree.column('success', width=100, minwidth=80, anchor=tk.CENTER)
         self.accounts_tree.bind('<<TreeviewSelect>>', self.toggle_account_selection)
         self.accounts_tree.bind('<Double-1>', self.on_account_double_click)
         accounts_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.accounts_tree.yview)
-        self.accounts_tree.configure(yscrollcommand=accounts_scrollbar.set)
+        # Rows are synced by diff and materialized a page at a time (see account_list.py)
+        self.account_list = AccountListView(self.accounts_tree)
+        self.account_list.attach_scrollbar(accounts_scrollbar)
+        self.account_filter_var.trace_add('write', lambda *args: self.account_list.set_query(self.account_filter_var.get()))
         self.accounts_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         accounts_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         select_frame = ttk.Frame(accounts_section, style='Card.TFrame')
@@ -155,14 +207,21 @@ class AccountManager:
         link_row1.pack(fill=tk.X, pady=(0, 6))
         ttk.Label(link_row1, text="Saved Links:", style='Body.TLabel').pack(side=tk.LEFT, padx=(0, 6))
         self.saved_links_var = tk.StringVar(value="Select saved link...")
+        # Editable for type-ahead: typing filters by name/URL, "#tag" narrows by tag
         self.saved_links_combo = ttk.Combobox(link_row1, textvariable=self.saved_links_var, 
-                                             font=('Segoe UI', 9), state='readonly', width=25)
+                                             font=('Segoe UI', 9), width=25)
         self.saved_links_combo.pack(side=tk.LEFT, padx=(0, 6))
         self.saved_links_combo.bind('<<ComboboxSelected>>', self.on_saved_link_selected)
+        self.saved_links_combo.bind('<KeyRelease>', self.filter_saved_links)
+        self.saved_links_combo.bind('<Return>', self.on_saved_link_selected)
         button_frame1 = ttk.Frame(link_row1, style='Card.TFrame')
         button_frame1.pack(side=tk.LEFT)
         ttk.Button(button_frame1, text="Save", command=self.save_current_link,
                   style='Small.TButton').pack(side=tk.LEFT, padx=(2, 2))
+        ttk.Button(button_frame1, text="Tags", command=self.edit_saved_link_tags,
+                  style='Small.TButton').pack(side=tk.LEFT, padx=(2, 2))
+        ttk.Button(button_frame1, text="Import", command=self.import_saved_links,
+                  style='Small.TButton').pack(side=tk.LEFT, padx=(2, 2))
         ttk.Button(button_frame1, text="Delete", command=self.delete_saved_link,
                   style='Small.TButton').pack(side=tk.LEFT, padx=(2, 0))
         link_row2 = ttk.Frame(server_inner, style='Card.TFrame')
@@ -217,6 +276,18 @@ class AccountManager:
                   style='Small.TButton').pack(side=tk.LEFT, padx=(0, 4))
         ttk.Button(secondary_row, text="Cleanup", command=self.cleanup_old_instances,
                   style='Small.TButton').pack(side=tk.LEFT, padx=(0, 4))
+        ttk.Button(secondary_row, text="Reset Profile", command=self.reset_selected_profiles,
+                  style='Small.TButton').pack(side=tk.LEFT, padx=(0, 4))
+        self.persistent_profiles_var = tk.BooleanVar(value=self.roblox_launcher.persistent_profiles)
+        ttk.Checkbutton(secondary_row, text="Keep browser profiles", variable=self.persistent_profiles_var,
+                        command=self.toggle_persistent_profiles).pack(side=tk.LEFT, padx=(4, 0))
+        self.use_daemon_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(secondary_row, text="Use daemon", variable=self.use_daemon_var).pack(side=tk.LEFT, padx=(4, 0))
+        self.profile_batch_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(secondary_row, text="Profile batch", variable=self.profile_batch_var).pack(side=tk.LEFT, padx=(4, 0))
+        self.history_ordering_var = tk.BooleanVar(value=self.roblox_launcher.history_ordering)
+        ttk.Checkbutton(secondary_row, text="Reliable first", variable=self.history_ordering_var,
+                        command=self.toggle_history_ordering).pack(side=tk.LEFT, padx=(4, 0))
         status_section = ttk.Frame(main_frame, style='Card.TFrame')
         status_section.pack(fill=tk.BOTH, expand=False, pady=(0, 0))
         
@@ -236,10 +307,28 @@ class AccountManager:
         status_scrollbar = ttk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.status_text.yview)
         self.status_text.configure(yscrollcommand=status_scrollbar.set)
         self.status_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.status_log = StatusLogView(self.ui, self.status_text)
         status_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.accounts_tree.bind('<Double-1>', self.toggle_account_selection)
         self.server_entry.bind('<FocusIn>', self.clear_placeholder)
-        self.update_status(f"Ready to manage accounts - Using {self.roblox_launcher.preferred_browser} browser (supports Chrome, Edge, Firefox, Brave, Opera)")
+        self.update_status("Ready to manage accounts - detecting browser in the background (supports Chrome, Edge, Firefox, Brave, Opera)")
+        get_browser_detector().add_listener(
+            lambda browser: self.update_status(f"Using {browser} browser for automation"))
+        self.root.update_idletasks()
+        self._report_startup_time()
+    def start_metrics_endpoint(self):
+        """Serve launcher metrics on loopback when RMAM_METRICS_PORT is set."""
+        from metrics import start_metrics_server
+        server = start_metrics_server()
+        if server:
+            self.update_status(f"Metrics endpoint: {server.url}")
+    def _report_startup_time(self):
+        """Log the measured cold-start time against STARTUP_BUDGET_MS."""
+        elapsed_ms = (time.perf_counter() - _STARTUP_T0) * 1000
+        if elapsed_ms > STARTUP_BUDGET_MS:
+            self.update_status(f"⚠ Startup took {elapsed_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+        else:
+            self.update_status(f"Window ready in {elapsed_ms:.0f} ms")
     def clear_placeholder(self, event):
         """Clear placeholder text when entry is focused."""
         if self.server_entry.get() == "Enter game/private server link...":
@@ -258,6 +347,7 @@ class AccountManager:
                     self.master_password = password
                     self.refresh_accounts_list()
                     self.update_status("Authentication successful. Data loaded.")
+                    self.offer_resume_batches()
                     break
                 else:
                     messagebox.showerror("Error", "Invalid password. Please try again.")
@@ -319,6 +409,7 @@ class AccountManager:
                 # Remove old entry and add new one
                 if old_name in self.accounts_data:
                     del self.accounts_data[old_name]
+                self.roblox_launcher.launch_history.rename_account(old_name, new_name)
                     
             self.accounts_data[new_name] = new_cookie
             self.save_data_debounced()
@@ -344,6 +435,7 @@ class AccountManager:
             cookie = self.accounts_data[old_name]
             del self.accounts_data[old_name]
             self.accounts_data[new_name] = cookie
+            self.roblox_launcher.launch_history.rename_account(old_name, new_name)
             self.save_data_debounced()
             self.refresh_accounts_list()
             self.update_status(f"Account renamed from '{old_name}' to '{new_name}'.")
@@ -368,9 +460,8 @@ class AccountManager:
             self.refresh_accounts_list()
             self.update_status(f"Removed {len(account_names)} account(s).")    
     def select_all_accounts(self):
-        """Select all accounts in the list."""
-        all_items = self.accounts_tree.get_children()
-        self.accounts_tree.selection_set(all_items)
+        """Select all accounts matching the filter (loading any rows not shown yet)."""
+        self.accounts_tree.selection_set(self.account_list.show_all_matches())
 
     def deselect_all_accounts(self):
         """Deselect all accounts in the list."""
@@ -387,45 +478,83 @@ class AccountManager:
                 pass
 
     def refresh_accounts_list(self):
-        """Refresh the accounts display list with masked cookies."""
-        # Clear existing items
-        for item in self.accounts_tree.get_children():
-            self.accounts_tree.delete(item)        
-        for account_name in sorted(self.accounts_data.keys()):
-            # Show masked cookie for security
-            masked_cookie = "****"
-            item = self.accounts_tree.insert('', 'end', text=account_name, values=(masked_cookie,))
+        """Sync the accounts list with accounts_data, touching only rows that changed (cookies stay masked)."""
+        self.account_list.set_accounts(self.accounts_data.keys())
+        unseen = [name for name in self.accounts_data if not self.account_list.has_success_label(name)]
+        if unseen:
+            self.refresh_launch_stats(unseen)
 
-    def launch_selected_accounts(self):
-        """Launch Roblox for all selected accounts with instance isolation and correct method."""
-        selected_items = self.accounts_tree.selection()
-        selected_accounts = []
-        for item in selected_items:
-            account_name = self.accounts_tree.item(item, 'text')
-            if account_name in self.accounts_data:
-                cookie = self.accounts_data[account_name]
-                selected_accounts.append((account_name, cookie))
-        if not selected_accounts:
-            messagebox.showinfo("No Selection", "Please select accounts to launch.")
+    def refresh_launch_stats(self, account_names):
+        """Show the recent launch success rate of these accounts (safe to call from any thread)."""
+        from launch_history import success_label
+        try:
+            stats = self.roblox_launcher.launch_history.account_stats(account_names)
+        except Exception as e:
+            print(f"Failed to read launch history: {e}")
             return
-        server_link = self.server_entry.get().strip()
-        if not server_link or server_link == "Enter game/private server link...":
-            messagebox.showwarning("Missing Link", "Please enter a valid server link.")
+        labels = {name: success_label(stats.get(name)) for name in account_names}
+        self.ui.post(self.account_list.set_success, labels)
+
+    def offer_resume_batches(self):
+        """Offer to finish the most recent launch batch a previous run left incomplete."""
+        launch_queue = self.roblox_launcher.launch_queue
+        batches = launch_queue.unfinished_batches()
+        if not batches:
             return
-        if not any(x in server_link.lower() for x in ['roblox.com/games/', 'roblox.com/share']):
-            if not messagebox.askyesno("Confirm", 
-                                     "Server link doesn't appear to be a valid Roblox game URL. Continue anyway?"):                return
+        batch = batches[-1]
+        started = time.strftime('%Y-%m-%d %H:%M', time.localtime(batch['created_at']))
+        names = ', '.join(batch['remaining'][:10]) + (' ...' if len(batch['remaining']) > 10 else '')
+        if not messagebox.askyesno("Resume Launch",
+                                   f"A launch started {started} did not finish.\n"
+                                   f"{len(batch['remaining'])} account(s) were never launched:\n{names}\n\n"
+                                   f"Launch them now?"):
+            launch_queue.discard_batch(batch['id'])
+            self.update_status(f"Discarded unfinished launch batch {batch['id']}")
+            return
+        if batch['method'] == 'improved':
+            self.roblox_launcher.resume_batch(batch['id'], self.accounts_data)
+        else:
+            self.launch_selected_accounts(resume_batch=batch)
+    def launch_selected_accounts(self, resume_batch=None):
+        """
+        Launch Roblox for all selected accounts with instance isolation and correct method.
+        Args:
+            resume_batch: Unfinished launch-queue batch to continue instead of the current selection
+        """
+        if resume_batch:
+            selected_accounts = [(name, self.accounts_data[name]) for name in resume_batch['remaining']
+                                 if name in self.accounts_data]
+            server_link = resume_batch['server_link']
+        else:
+            selected_items = self.accounts_tree.selection()
+            selected_accounts = []
+            for item in selected_items:
+                account_name = self.accounts_tree.item(item, 'text')
+                if account_name in self.accounts_data:
+                    cookie = self.accounts_data[account_name]
+                    selected_accounts.append((account_name, cookie))
+            if not selected_accounts:
+                messagebox.showinfo("No Selection", "Please select accounts to launch.")
+                return
+            server_link = self.server_entry.get().strip()
+            if not server_link or server_link == "Enter game/private server link...":
+                messagebox.showwarning("Missing Link", "Please enter a valid server link.")
+                return
+            if not any(x in server_link.lower() for x in ['roblox.com/games/', 'roblox.com/share']):
+                if not messagebox.askyesno("Confirm", 
+                                         "Server link doesn't appear to be a valid Roblox game URL. Continue anyway?"):                return
         try:
-            delay = max(8, int(self.delay_var.get()))  # Minimum 8 seconds for Direct Join stability
+            delay = max(0, int(self.delay_var.get()))
         except ValueError:
-            delay = 12  # Default to 12 seconds for better protocol handler stability
+            delay = 3
+        # Delay is the minimum spacing between launch starts, so time already spent
+        # launching counts toward it; HTTP calls are rate limited per host separately
+        pacer = TokenBucket(rate=1.0 / delay, capacity=1) if delay > 0 else None
         self.launch_button.config(state='disabled')
         self.update_status(f"Starting LocalStorage isolated launch sequence for {len(selected_accounts)} account(s)...")
         is_private_server = 'roblox.com/share' in server_link.lower() and 'code=' in server_link.lower()
         launch_method = "Direct Join" if is_private_server else "Browser + Play Button"
         self.update_status(f"Auto-selected launch method: {launch_method}")
-        if launch_method == "Direct Join":
-            self.update_status("Note: Direct Join uses longer delays between accounts to ensure proper protocol handling")
         if not hasattr(self, 'active_account_launches'):
             self.active_account_launches = set()
         launching_accounts = [name for name, _ in selected_accounts if name in self.active_account_launches]
@@ -435,69 +564,115 @@ class AccountManager:
         if not selected_accounts:
             self.launch_button.config(state='normal')
             return
+        # Durable per-account progress so a crash mid-batch can resume without double launches
+        launch_queue = self.roblox_launcher.launch_queue
+        if resume_batch:
+            batch_id = resume_batch['id']
+        else:
+            batch_id = launch_queue.create_batch([name for name, _ in selected_accounts], server_link, 'selected')
+        profile = self.profile_batch_var.get()
         def launch_thread():
+            from profiling import profile_batch
             try:
-                for account_name, _ in selected_accounts:
-                    self.active_account_launches.add(account_name)
-                if launch_method == "Direct Join":
-                    self.update_status(f"Using Direct Join method for {len(selected_accounts)} PS links...")
-                    for i, (account_name, cookie) in enumerate(selected_accounts):
-                        self.update_status(f"Direct joining {account_name} ({i+1}/{len(selected_accounts)})...")
-                        isolation_success, backup_path = self.roblox_launcher.storage_manager.create_storage_isolation(account_name)
-                        if isolation_success:
-                            self.update_status(f"Temporary isolation created for {account_name}")                            # Use the RobloxLauncher's direct protocol method (no Play button click)
-                            launch_thread = self.roblox_launcher.launch_account_direct_protocol(
-                                account_name, cookie, server_link
-                            )
-                            if launch_thread:
-                                launch_thread.join(timeout=30)  # Reduced timeout to prevent hanging
-                                if launch_thread.is_alive():
-                                    self.update_status(f"Warning: Launch thread for {account_name} is still running")
-                                else:
-                                    self.update_status(f"Direct protocol launch thread completed for {account_name}")# Wait longer for Roblox to initialize and fully load
-                            self.update_status(f"Waiting for Roblox to initialize for {account_name}...")
-                            time.sleep(20)  # Increased from 15 to 20 seconds for better stability
-                            self.roblox_launcher.storage_manager.remove_storage_isolation(
-                                account_name, restore_backup=True, backup_path=backup_path
-                            )
-                            self.update_status(f"Temporary isolation removed for {account_name}")
-                            success = True
-                        else:
-                            self.update_status(f"Failed to create isolation for {account_name}")
-                            success = False
-                        if success:
-                            self.update_status(f"✓ {account_name} launched directly via protocol")
-                        else:
-                            self.update_status(f"✗ {account_name} direct launch failed")
-                        if i < len(selected_accounts) - 1:
-                            self.update_status(f"Waiting {delay + 5} seconds before next Direct Join launch...")
-                            time.sleep(delay + 5)  # Extra time for protocol handler stability
-                    self.update_status(f"Direct join completed for {len(selected_accounts)} accounts")
-                else:
-                    self.update_status(f"Using Browser + Play Button method for {len(selected_accounts)} accounts...")
-                    success_count = 0
-                    for i, (account_name, cookie) in enumerate(selected_accounts):
-                        self.update_status(f"Launching {account_name} with browser method ({i+1}/{len(selected_accounts)})...")
-                        success = self.roblox_launcher.launch_account_with_temporary_isolation(
-                            account_name, cookie, server_link
-                        )
-                        if success:
-                            self.update_status(f"✓ {account_name} launched successfully with browser automation")
-                            success_count += 1
-                        else:
-                            self.update_status(f"✗ {account_name} launch failed - check browser support")
-                        if i < len(selected_accounts) - 1:
-                            self.update_status(f"Waiting {delay} seconds before next launch...")
-                            time.sleep(delay)
-                    self.update_status(f"Browser method completed: {success_count}/{len(selected_accounts)} successful")
-            except Exception as e:
-                self.update_status(f"Launch error: {str(e)}")
+                with profile_batch(profile, f"batch-{batch_id}") as profiler:
+                    self.run_launch_sequence(selected_accounts, server_link, launch_method, pacer, batch_id)
+                if profiler:
+                    self.update_status("Batch profile saved:")
+                    self.add_status_link(f"  {os.path.basename(profiler.report_path)}", profiler.report_path)
+                    self.add_status_link(f"  {os.path.basename(profiler.stats_path)}", profiler.stats_path)
             finally:
-                time.sleep(1)
-                for account_name, _ in selected_accounts:
-                    self.active_account_launches.discard(account_name)
-                self.root.after(0, lambda: self.launch_button.config(state='normal'))
+                self.ui.post(self.launch_button.config, key='launch_button', state='normal')
         threading.Thread(target=launch_thread, daemon=True).start()
+    def run_launch_sequence(self, selected_accounts, server_link, launch_method, pacer=None, batch_id=None):
+        """
+        Launch accounts one after another with temporary isolation (no Tk calls, usable headless).
+        Args:
+            selected_accounts: List of (account_name, cookie); invalid cookies are dropped in place
+            server_link: Game or private-server link
+            launch_method: "Direct Join" or "Browser + Play Button"
+            pacer: Optional TokenBucket spacing launch starts
+            batch_id: Launch-queue batch; a new one is recorded when omitted
+        """
+        launch_queue = self.roblox_launcher.launch_queue
+        if batch_id is None:
+            batch_id = launch_queue.create_batch([name for name, _ in selected_accounts], server_link, 'selected')
+        if not hasattr(self, 'active_account_launches'):
+            self.active_account_launches = set()
+        set_batch(batch_id)
+        try:
+            for account_name, _ in selected_accounts:
+                self.active_account_launches.add(account_name)
+            # Drop expired cookies before any isolation or browser work starts
+            valid_names = {name for name, _ in self.roblox_launcher.filter_valid_accounts(selected_accounts)}
+            for account_name, _ in selected_accounts:
+                if account_name not in valid_names:
+                    self.active_account_launches.discard(account_name)
+                    if launch_queue.claim(batch_id, account_name):
+                        launch_queue.mark(batch_id, account_name, 'failed', 'invalid cookie')
+            selected_accounts[:] = [(name, cookie) for name, cookie in selected_accounts if name in valid_names]
+            history_method = 'direct_protocol' if launch_method == "Direct Join" else 'browser_automation'
+            selected_accounts[:] = self.roblox_launcher.order_by_history(selected_accounts, method=history_method)
+            if launch_method == "Direct Join":
+                self.update_status(f"Using Direct Join method for {len(selected_accounts)} PS links...")
+                for i, (account_name, cookie) in enumerate(selected_accounts):
+                    if not launch_queue.claim(batch_id, account_name):
+                        continue
+                    if pacer:
+                        pacer.acquire()
+                    self.update_status(f"Direct joining {account_name} ({i+1}/{len(selected_accounts)})...")
+                    isolation_success, backup_path = self.roblox_launcher.storage_manager.create_storage_isolation(account_name)
+                    if isolation_success:
+                        self.update_status(f"Temporary isolation created for {account_name}")                            # Use the RobloxLauncher's direct protocol method (no Play button click)
+                        launch_future = self.roblox_launcher.launch_account_direct_protocol(
+                            account_name, cookie, server_link
+                        )
+                        try:
+                            launch_future.result(timeout=30)  # Reduced timeout to prevent hanging
+                            self.update_status(f"Direct protocol launch completed for {account_name}")
+                        except FutureTimeoutError:
+                            self.update_status(f"Warning: Launch for {account_name} is still running")# Wait longer for Roblox to initialize and fully load
+                        self.update_status(f"Waiting for Roblox to initialize for {account_name}...")
+                        time.sleep(20)  # Increased from 15 to 20 seconds for better stability
+                        self.roblox_launcher.storage_manager.remove_storage_isolation(
+                            account_name, restore_backup=True, backup_path=backup_path
+                        )
+                        self.update_status(f"Temporary isolation removed for {account_name}")
+                        success = True
+                    else:
+                        self.update_status(f"Failed to create isolation for {account_name}")
+                        success = False
+                    launch_queue.mark(batch_id, account_name, 'launched' if success else 'failed')
+                    if success:
+                        self.update_status(f"✓ {account_name} launched directly via protocol")
+                    else:
+                        self.update_status(f"✗ {account_name} direct launch failed")
+                self.update_status(f"Direct join completed for {len(selected_accounts)} accounts")
+            else:
+                self.update_status(f"Using Browser + Play Button method for {len(selected_accounts)} accounts...")
+                success_count = 0
+                for i, (account_name, cookie) in enumerate(selected_accounts):
+                    if not launch_queue.claim(batch_id, account_name):
+                        continue
+                    if pacer:
+                        pacer.acquire()
+                    self.update_status(f"Launching {account_name} with browser method ({i+1}/{len(selected_accounts)})...")
+                    success = self.roblox_launcher.launch_account_with_temporary_isolation(
+                        account_name, cookie, server_link
+                    )
+                    launch_queue.mark(batch_id, account_name, 'launched' if success else 'failed')
+                    if success:
+                        self.update_status(f"✓ {account_name} launched successfully with browser automation")
+                        success_count += 1
+                    else:
+                        self.update_status(f"✗ {account_name} launch failed - check browser support")
+                self.update_status(f"Browser method completed: {success_count}/{len(selected_accounts)} successful")
+            launch_queue.finish_batch(batch_id)
+        except Exception as e:
+            self.update_status(f"Launch error: {str(e)}")
+        finally:
+            time.sleep(1)
+            for account_name, _ in selected_accounts:
+                self.active_account_launches.discard(account_name)
 
     def stop_all_sessions(self):
         """Stop all active Roblox instances and clean up LocalStorage isolations."""
@@ -524,6 +699,11 @@ class AccountManager:
             
             # Also use the launcher's cleanup
             launcher_stopped = self.roblox_launcher.stop_all_instances()
+            if self.use_daemon_var.get():
+                from daemon import DaemonClient
+                client = DaemonClient.discover()
+                if client:
+                    launcher_stopped += client.stop()['result']['stopped']
             
             self.update_status(f"🛑 Stopped {stopped_count} Roblox processes and cleaned up {launcher_stopped} launcher instances")
             
@@ -545,6 +725,28 @@ class AccountManager:
                 self.update_status("🧹 No old data to clean up")
         except Exception as e:
             self.update_status(f"Cleanup error: {e}")
+    def toggle_persistent_profiles(self):
+        """Switch per-account persistent browser profiles on or off."""
+        enabled = self.persistent_profiles_var.get()
+        self.roblox_launcher.persistent_profiles = enabled
+        self.update_status(f"Persistent browser profiles {'enabled' if enabled else 'disabled'}")
+    def toggle_history_ordering(self):
+        """Switch ordering batches by launch history on or off."""
+        enabled = self.history_ordering_var.get()
+        self.roblox_launcher.history_ordering = enabled
+        self.update_status(f"Launch order: {'most reliable accounts first' if enabled else 'as selected'}")
+    def reset_selected_profiles(self):
+        """Delete the persistent browser profile of every selected account."""
+        selected_items = self.accounts_tree.selection()
+        account_names = [self.accounts_tree.item(item, 'text') for item in selected_items]
+        if not account_names:
+            messagebox.showinfo("No Selection", "Please select accounts whose browser profile should be reset.")
+            return
+        if not messagebox.askyesno("Reset Profile",
+                                   f"Delete the saved browser profile of {len(account_names)} account(s)?"):
+            return
+        reset_count = sum(1 for name in account_names if self.roblox_launcher.reset_browser_profile(name))
+        self.update_status(f"🧹 Reset {reset_count}/{len(account_names)} browser profile(s)")
     def show_instance_status(self):
         """Show detailed instance and isolation status in a dialog."""
         try:
@@ -606,25 +808,37 @@ Active Isolations:
                       command=status_dialog.destroy).pack(pady=10)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to get status: {e}")
-    def load_saved_links(self):
-        """Load saved links from saved_links.json and update dropdown."""
-        path = os.path.join(os.path.dirname(__file__), 'saved_links.json')
-        try:
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    self.saved_links = json.load(f)
-            else:
-                self.saved_links = {}
-        except Exception as e:
-            self.saved_links = {}
-            self.update_status(f"Failed to load saved links: {e}")
-        self.saved_links_combo['values'] = list(self.saved_links.keys())
-        if self.saved_links:
-            self.saved_links_var.set(list(self.saved_links.keys())[0])
+    def load_saved_links(self, select=None):
+        """
+        Fill the saved-links dropdown with the most recently used links.
+        Args:
+            select: Name to show in the box (defaults to the most recently used link)
+        """
+        if self.link_store is None:
+            try:
+                from link_store import SavedLinkStore
+                self.link_store = SavedLinkStore()
+            except Exception as e:
+                self.update_status(f"Failed to open saved links: {e}")
+                return
+        names = self.link_store.search(limit=SAVED_LINKS_SHOWN)
+        self.saved_links_combo['values'] = names
+        if select or names:
+            self.saved_links_var.set(select or names[0])
         else:
             self.saved_links_var.set('Select saved link...')
+    def filter_saved_links(self, event=None):
+        """Type-ahead: narrow the dropdown to links matching what has been typed."""
+        if event is not None and event.keysym in ('Return', 'Up', 'Down', 'Escape', 'Tab'):
+            return
+        if self.link_store is None:
+            return
+        query = self.saved_links_var.get()
+        if query == 'Select saved link...':
+            query = ''
+        self.saved_links_combo['values'] = self.link_store.search(query, limit=SAVED_LINKS_SHOWN)
     def save_current_link(self):
-        """Save the current link with a name to saved_links.json."""
+        """Save the current link under a name, with optional tags."""
         link = self.server_entry.get().strip()
         if not link or link == "Enter game/private server link...":
             messagebox.showwarning("Missing Link", "Please enter a valid server link to save.")
@@ -632,40 +846,62 @@ Active Isolations:
         name = simpledialog.askstring("Save Link", "Enter a name for this link:")
         if not name:
             return
-        if name in self.saved_links and not messagebox.askyesno("Overwrite?", f"Link '{name}' already exists. Overwrite?"):
+        if name in self.link_store and not messagebox.askyesno("Overwrite?", f"Link '{name}' already exists. Overwrite?"):
             return
-        self.saved_links[name] = link
-        self._write_saved_links()
-        self.load_saved_links()
-        self.saved_links_var.set(name)
+        tags = simpledialog.askstring("Save Link", "Tags (optional, comma separated):",
+                                      initialvalue=", ".join(self.link_store.tags(name)))
+        from link_store import parse_tags
+        self.link_store.save(name, link, parse_tags(tags) if tags is not None else None)
+        self.load_saved_links(select=name)
         self.update_status(f"Saved link '{name}'.")
+    def edit_saved_link_tags(self):
+        """Edit the tags of the selected saved link."""
+        name = self.saved_links_var.get()
+        if name not in self.link_store:
+            messagebox.showinfo("Link Tags", "No saved link selected.")
+            return
+        tags = simpledialog.askstring("Link Tags", f"Tags for '{name}' (comma separated):",
+                                      initialvalue=", ".join(self.link_store.tags(name)))
+        if tags is None:
+            return
+        from link_store import parse_tags
+        self.link_store.set_tags(name, parse_tags(tags))
+        self.update_status(f"Tags for '{name}': {', '.join(self.link_store.tags(name)) or 'none'}")
+    def import_saved_links(self):
+        """Import links from a saved_links.json-style file."""
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Import saved links", filetypes=[("JSON files", "*.json")])
+        if not path:
+            return
+        try:
+            count = self.link_store.import_json(path)
+        except Exception as e:
+            messagebox.showerror("Import Failed", f"Could not import links: {e}")
+            return
+        self.load_saved_links()
+        self.update_status(f"Imported {count} saved link(s) from {os.path.basename(path)}")
     def delete_saved_link(self):
         """Delete the selected saved link."""
         name = self.saved_links_var.get()
-        if name not in self.saved_links:
+        if name not in self.link_store:
             messagebox.showinfo("Delete Link", "No saved link selected.")
             return
         if not messagebox.askyesno("Delete Link", f"Delete saved link '{name}'?"):
             return
-        del self.saved_links[name]
-        self._write_saved_links()
+        self.link_store.delete(name)
         self.load_saved_links()
         self.server_entry.delete(0, tk.END)
         self.update_status(f"Deleted link '{name}'.")
     def on_saved_link_selected(self, event=None):
-        """Update the server entry when a saved link is selected."""
+        """Put the selected saved link in the server entry and mark it as used."""
         name = self.saved_links_var.get()
-        link = self.saved_links.get(name, "")
+        link = self.link_store.url(name) if self.link_store else None
+        if link is None:
+            return
         self.server_entry.delete(0, tk.END)
         self.server_entry.insert(0, link)
-    def _write_saved_links(self):
-        """Write the saved links to saved_links.json."""
-        path = os.path.join(os.path.dirname(__file__), 'saved_links.json')
-        try:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(self.saved_links, f, indent=2)
-        except Exception as e:
-            self.update_status(f"Failed to save links: {e}")
+        self.link_store.touch(name)
+        self.load_saved_links(select=name)
     def save_data_debounced(self):
         """Save data with debouncing to avoid excessive saves."""
         current_time = time.time()
@@ -682,16 +918,20 @@ Active Isolations:
             if not success:
                 messagebox.showerror("Error", "Failed to save account data.")
     def update_status(self, message):
-        """Update status text area."""
-        def update():
-            self.status_text.config(state=tk.NORMAL)
-            self.status_text.insert(tk.END, f"{message}\n")
-            self.status_text.see(tk.END)
-            self.status_text.config(state=tk.DISABLED)
-        if threading.current_thread() == threading.main_thread():
-            update()
-        else:
-            self.root.after(0, update)
+        """Queue a line for the status area; lines are flushed once per frame from any thread."""
+        self.status_log.append(message)
+    def add_status_link(self, text, path):
+        """Append a clickable line to the status area that opens path."""
+        def open_path():
+            try:
+                if hasattr(os, 'startfile'):
+                    os.startfile(path)
+                else:
+                    import webbrowser
+                    webbrowser.open(f"file://{os.path.abspath(path)}")
+            except Exception as e:
+                self.update_status(f"Could not open {path}: {e}")
+        self.status_log.append(text, on_click=open_path)
     def _launch_direct_join(self, account_name: str, roblosecurity_cookie: str, server_link: str) -> bool:
         """
         Launch account using Direct Join method (for PS links).
@@ -700,6 +940,8 @@ Active Isolations:
         driver = None
         try:
             self.update_status(f"Setting up headless browser for {account_name}...")
+            from selenium import webdriver
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
             options = FirefoxOptions()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
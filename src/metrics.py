@@ -0,0 +1,342 @@
+"""
+In-process metrics registry.
+Counters, gauges and histograms for the launcher, storage and vault, served
+in Prometheus text format on a loopback-only endpoint for fleet dashboards.
+
+Recording a value is a dict lookup and an add under a per-metric lock, so it
+is cheap enough for the launch hot path; nothing is formatted until a scrape.
+Launch outcomes, in-flight launches and phase latencies are fed from the
+launch event stream (events.py) off the launch thread.
+
+The endpoint is off by default. Enable it with RMAM_METRICS_PORT=<port> for
+the Tk app, or `python daemon.py serve --metrics-port <port>`, then scrape
+http://127.0.0.1:<port>/metrics.
+"""
+
+import bisect
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional, Sequence, Tuple
+
+METRICS_PORT_ENV = "RMAM_METRICS_PORT"
+# Seconds; covers sub-millisecond phases up to the multi-minute launch waits
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+
+def _format_labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    """Base for labelled metrics; values are keyed by the tuple of label values."""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def _samples(self):
+        """Yield (suffix, label_values, extra_label, value) for the exposition."""
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield '', key, '', value
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, key, extra, value in self._samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(self.labelnames, key, extra)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape time."""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._functions = {}
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, fn: Callable[[], float], **labels) -> None:
+        """Read the value from fn() on every scrape instead of storing it."""
+        with self._lock:
+            self._functions[self._key(labels)] = fn
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        with self._lock:
+            fn = self._functions.get(key)
+            if fn is None:
+                return self._values.get(key, 0)
+        return fn()
+
+    def _samples(self):
+        yield from super()._samples()
+        with self._lock:
+            functions = list(self._functions.items())
+        for key, fn in functions:
+            try:
+                value = fn()
+            except Exception as e:
+                print(f"Metric {self.name} callback failed: {e}")
+                continue
+            yield '', key, '', value
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed cumulative buckets."""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket (non-cumulative) counts plus +Inf, then sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def time(self, **labels) -> "_HistogramTimer":
+        """Context manager observing the elapsed seconds of its block."""
+        return _HistogramTimer(self, labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return sum(state[0]) if state else 0
+
+    def _samples(self):
+        with self._lock:
+            items = [(key, list(state[0]), state[1]) for key, state in self._values.items()]
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                yield '_bucket', key, f'le="{_format_value(bound)}"', cumulative
+            yield '_sum', key, '', total
+            yield '_count', key, '', cumulative
+
+
+class _HistogramTimer:
+    __slots__ = ('histogram', 'labels', '_t0')
+
+    def __init__(self, histogram: Histogram, labels: dict):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self._t0, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Named metrics for one process.
+    counter()/gauge()/histogram() return the existing metric when the name is
+    already registered, so every component can declare what it uses.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, labelnames: Sequence[str], **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def get(self, name: str):
+        with self._lock:
+            return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+class MetricsServer:
+    """Serves a registry at http://127.0.0.1:<port>/metrics."""
+
+    def __init__(self, registry: MetricsRegistry, port: int = 0):
+        self.registry = registry
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/metrics"
+
+    def _make_handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def start(self) -> "MetricsServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name="metrics-http")
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+_registry = MetricsRegistry()
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    return _registry
+
+
+def subscribe_launch_metrics(bus, registry: Optional[MetricsRegistry] = None):
+    """
+    Feed launch counters and phase histograms from an EventBus, once per bus and registry.
+    Returns:
+        The events.Subscription doing the recording
+    """
+    from events import LAUNCH_STARTED, LAUNCH_FINISHED, PHASE_COMPLETED
+    registry = registry or _registry
+    launches_total = registry.counter('rmam_launches_total', 'Finished launches by method and outcome',
+                                      ('method', 'outcome'))
+    in_flight = registry.gauge('rmam_launches_in_flight', 'Launches currently running')
+    phase_seconds = registry.histogram('rmam_launch_phase_seconds', 'Launch phase latency', ('phase',))
+
+    def record(event) -> None:
+        if event.kind == PHASE_COMPLETED:
+            phase_seconds.observe(event.data['duration_ms'] / 1000, phase=event.data['phase'])
+        elif event.kind == LAUNCH_STARTED:
+            in_flight.inc()
+        elif event.kind == LAUNCH_FINISHED:
+            in_flight.dec()
+            launches_total.inc(method=event.data.get('method'), outcome=event.data.get('outcome'))
+
+    return bus.subscribe(record, kinds=(LAUNCH_STARTED, LAUNCH_FINISHED, PHASE_COMPLETED),
+                         maxsize=10000, name=f"metrics-{id(registry)}")
+
+
+def start_metrics_server(port: Optional[int] = None) -> Optional[MetricsServer]:
+    """
+    Start the shared metrics endpoint once per process.
+    Args:
+        port: Port to listen on; None reads RMAM_METRICS_PORT and does nothing when it is unset
+    Returns:
+        The running MetricsServer, or None when disabled or the port is unavailable
+    """
+    global _server
+    if port is None:
+        configured = os.environ.get(METRICS_PORT_ENV)
+        if not configured:
+            return None
+        try:
+            port = int(configured)
+        except ValueError:
+            print(f"Ignoring invalid {METRICS_PORT_ENV}: {configured}")
+            return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = MetricsServer(_registry, port).start()
+            except OSError as e:
+                print(f"Failed to start metrics endpoint on port {port}: {e}")
+                return None
+        return _server
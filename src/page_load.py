@@ -0,0 +1,178 @@
+"""
+Lean page-load mode for the headless automation browsers.
+The launcher only needs roblox.com's scripts to run far enough to fire the
+roblox-player protocol, so lean mode uses an eager page-load strategy, blocks
+images, media, fonts and third-party trackers, and shrinks the window.
+
+Lean mode is off by default (RobloxLauncher.lean_mode) because no
+before/after numbers have been recorded for it yet. Measure it with:
+    python page_load.py <url> [chrome|edge|firefox] [runs]
+which prints the median load time and driver memory with lean mode off and on.
+"""
+
+import os
+import statistics
+import sys
+import time
+from typing import Optional
+
+LEAN_PAGE_LOAD_STRATEGY = 'eager'
+LEAN_PAGE_LOAD_TIMEOUT = 15
+DEFAULT_PAGE_LOAD_TIMEOUT = 30
+LEAN_WINDOW_SIZE = (800, 600)
+# Proxy autoconfig URL that lean mode used to write into Firefox profiles
+LEGACY_PAC_PREFIX = "data:application/x-ns-proxy-autoconfig,"
+
+# Third-party hosts roblox.com pulls in that play no part in a launch
+LEAN_BLOCKED_HOSTS = [
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'facebook.net',
+    'hotjar.com',
+    'adsrvr.org',
+    'criteo.com',
+]
+LEAN_BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm', '*.mp3', '*.ogg',
+] + [f"*{host}*" for host in LEAN_BLOCKED_HOSTS]
+
+
+def apply_lean_chromium_options(options, window_size: tuple = LEAN_WINDOW_SIZE) -> None:
+    """Apply lean settings to Chrome/Edge options (before the driver starts)."""
+    options.page_load_strategy = LEAN_PAGE_LOAD_STRATEGY
+    options.add_argument(f"--window-size={window_size[0]},{window_size[1]}")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--mute-audio")
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.media_stream': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+
+
+def enable_cdp_url_blocking(driver) -> bool:
+    """Block images, media, fonts and tracker hosts for a Chrome/Edge session."""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': LEAN_BLOCKED_URL_PATTERNS})
+        return True
+    except Exception as e:
+        print(f"CDP URL blocking failed: {e}")
+        return False
+
+
+def _blocked_host_names() -> str:
+    """Tracker hosts and their www. names, comma-separated for network.dns.localDomains."""
+    return ",".join(name for host in LEAN_BLOCKED_HOSTS for name in (host, f"www.{host}"))
+
+
+def apply_lean_firefox_options(options, window_size: tuple = LEAN_WINDOW_SIZE) -> None:
+    """
+    Apply lean settings to Firefox options (preferences take the place of CDP).
+    Trackers are blocked by Firefox's own tracking protection, and the listed
+    hosts resolve to loopback; proxy settings are left alone.
+    """
+    options.page_load_strategy = LEAN_PAGE_LOAD_STRATEGY
+    options.add_argument(f"--width={window_size[0]}")
+    options.add_argument(f"--height={window_size[1]}")
+    options.set_preference("permissions.default.image", 2)
+    options.set_preference("media.autoplay.default", 5)
+    options.set_preference("media.autoplay.blocking_policy", 2)
+    options.set_preference("browser.display.use_document_fonts", 0)
+    options.set_preference("gfx.downloadable_fonts.enabled", False)
+    options.set_preference("privacy.trackingprotection.enabled", True)
+    options.set_preference("network.dns.localDomains", _blocked_host_names())
+
+
+def undo_lean_proxy_prefs(options, profile_dir: str) -> bool:
+    """
+    Put back the default proxy settings in a persistent Firefox profile that
+    older lean mode builds pointed at a tracker-blocking PAC script.
+    Returns:
+        True if the profile had the PAC script
+    """
+    try:
+        with open(os.path.join(profile_dir, "prefs.js"), 'r', encoding='utf-8', errors='replace') as f:
+            prefs = f.read()
+    except OSError:
+        return False
+    if LEGACY_PAC_PREFIX not in prefs:
+        return False
+    options.set_preference("network.proxy.type", 5)  # Firefox default: use system proxy settings
+    options.set_preference("network.proxy.autoconfig_url", "")
+    return True
+
+
+def driver_memory_mb(driver) -> Optional[float]:
+    """Resident memory of the driver process and every browser process under it."""
+    try:
+        import psutil
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        total = 0
+        for proc in processes:
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / (1024 * 1024)
+    except Exception:
+        return None
+
+
+def measure_page_load(driver, url: str) -> dict:
+    """
+    Load url once and report how long it took and how much memory the driver uses.
+    Returns:
+        Dictionary with load_seconds and memory_mb
+    """
+    start = time.perf_counter()
+    driver.get(url)
+    return {'load_seconds': time.perf_counter() - start, 'memory_mb': driver_memory_mb(driver)}
+
+
+def compare_modes(url: str, browser: str = 'chrome', runs: int = 3) -> dict:
+    """
+    Measure page-load time and driver memory with lean mode on and off.
+    Returns:
+        {'lean': {...}, 'default': {...}} with median load time and memory
+    """
+    from launcher import RobloxLauncher
+    report = {}
+    for label, lean in (('default', False), ('lean', True)):
+        launcher = RobloxLauncher(preferred_browser=browser)
+        launcher.lean_mode = lean
+        loads, memory = [], []
+        for _ in range(runs):
+            driver = launcher._setup_browser_driver(browser)
+            if not driver:
+                raise RuntimeError(f"Could not start {browser}")
+            try:
+                result = measure_page_load(driver, url)
+                loads.append(result['load_seconds'])
+                if result['memory_mb'] is not None:
+                    memory.append(result['memory_mb'])
+            finally:
+                launcher._release_driver(driver)
+        report[label] = {
+            'load_seconds': statistics.median(loads),
+            'memory_mb': statistics.median(memory) if memory else None,
+        }
+    return report
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    target_url = sys.argv[1]
+    browser_name = sys.argv[2] if len(sys.argv) > 2 else 'chrome'
+    run_count = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    results = compare_modes(target_url, browser_name, run_count)
+    for mode, values in results.items():
+        memory_text = f"{values['memory_mb']:.0f} MB" if values['memory_mb'] is not None else "n/a"
+        print(f"{mode:>8}: load {values['load_seconds']:.2f}s, memory {memory_text}")
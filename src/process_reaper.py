@@ -0,0 +1,235 @@
+"""
+Orphaned driver/browser process reaper.
+Records the PID of every chromedriver/geckodriver and the browser processes
+under it, persists them to .data/spawned_processes.json, and kills any whose
+owning launch is gone: periodically for the current run, and once at startup
+for whatever a crashed previous run left behind.
+"""
+
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from runtime import DATA_DIR
+
+REAPER_STATE_FILE = os.path.join(DATA_DIR, "spawned_processes.json")
+REAP_INTERVAL = 30
+TERMINATE_GRACE = 3
+
+
+def _process_identity(pid: int) -> Optional[dict]:
+    """pid, name and create_time of a live process, or None."""
+    import psutil
+    try:
+        proc = psutil.Process(pid)
+        return {'pid': pid, 'name': proc.name(), 'create_time': proc.create_time()}
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
+
+def _matching_process(record: dict):
+    """Return the psutil.Process for record if it is still the same process (guards PID reuse)."""
+    import psutil
+    try:
+        proc = psutil.Process(record['pid'])
+        if proc.name() == record['name'] and abs(proc.create_time() - record['create_time']) < 1.0:
+            return proc
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        pass
+    return None
+
+
+def _kill_processes(records: List[dict]) -> int:
+    """Terminate (then kill) every still-running recorded process; returns how many were stopped."""
+    import psutil
+    processes = [proc for proc in (_matching_process(record) for record in records) if proc]
+    for proc in processes:
+        try:
+            proc.terminate()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    _, alive = psutil.wait_procs(processes, timeout=TERMINATE_GRACE)
+    for proc in alive:
+        try:
+            proc.kill()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return len(processes)
+
+
+class ProcessReaper:
+    """
+    Tracks spawned driver process trees by key and kills orphans.
+    Each key has an owner_alive callable; once it returns False while the
+    key is still registered, the processes are treated as leaked.
+    """
+
+    def __init__(self, state_file: str = REAPER_STATE_FILE, interval: float = REAP_INTERVAL):
+        self.state_file = state_file
+        self.interval = interval
+        self._records = {}  # {key: [process records]}
+        self._owners = {}  # {key: owner_alive callable}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._run = _process_identity(os.getpid())
+
+    def _load_state(self) -> dict:
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to read reaper state: {e}")
+        return {}
+
+    def _save_state(self) -> None:
+        """Merge this run's records into the state file, keeping other live runs' entries."""
+        try:
+            state = self._load_state()
+            run_key = str(self._run['pid'])
+            with self._lock:
+                records = {key: list(value) for key, value in self._records.items()}
+            if records:
+                state[run_key] = {'run': self._run, 'processes': records}
+            else:
+                state.pop(run_key, None)
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            tmp_path = f"{self.state_file}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except Exception as e:
+            print(f"Failed to save reaper state: {e}")
+
+    def register_driver(self, key: str, driver, owner_alive: Callable[[], bool]) -> None:
+        """
+        Record a driver's service process and its browser children.
+        Args:
+            key: Unique key for the driver
+            driver: Selenium WebDriver
+            owner_alive: Returns False once the owning launch is gone
+        """
+        try:
+            import psutil
+            root = psutil.Process(driver.service.process.pid)
+            pids = [root.pid] + [child.pid for child in root.children(recursive=True)]
+        except Exception:
+            return
+        records = [record for record in (_process_identity(pid) for pid in pids) if record]
+        with self._lock:
+            self._records[key] = records
+            self._owners[key] = owner_alive
+        self._save_state()
+
+    def set_owner(self, key: str, owner_alive: Callable[[], bool]) -> None:
+        """Hand a registered driver to a different owner."""
+        with self._lock:
+            if key in self._records:
+                self._owners[key] = owner_alive
+
+    def release(self, key: str) -> int:
+        """
+        Forget a driver after a normal quit, killing anything that survived it.
+        Returns:
+            Number of leftover processes killed
+        """
+        with self._lock:
+            records = self._records.pop(key, None)
+            self._owners.pop(key, None)
+        if not records:
+            return 0
+        killed = _kill_processes(records)
+        self._save_state()
+        return killed
+
+    def reap(self) -> int:
+        """
+        Kill processes of drivers whose owner is gone.
+        Returns:
+            Number of processes killed
+        """
+        with self._lock:
+            orphaned = []
+            for key, owner_alive in list(self._owners.items()):
+                try:
+                    alive = owner_alive()
+                except Exception:
+                    alive = False
+                if not alive:
+                    orphaned.append(key)
+        killed = 0
+        for key in orphaned:
+            killed += self.release(key)
+        if killed:
+            print(f"Reaped {killed} orphaned driver/browser process(es)")
+        return killed
+
+    def cleanup_previous_runs(self) -> int:
+        """
+        Kill processes recorded by earlier runs that are no longer running.
+        Returns:
+            Number of processes killed
+        """
+        state = self._load_state()
+        killed = 0
+        for run_key, entry in list(state.items()):
+            run = entry.get('run') or {}
+            if run_key == str(self._run['pid']) and run.get('create_time') == self._run['create_time']:
+                continue
+            if run and _matching_process(run):
+                continue  # Another instance of the app is still alive and owns these
+            for records in entry.get('processes', {}).values():
+                killed += _kill_processes(records)
+            state.pop(run_key, None)
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2)
+        except Exception as e:
+            print(f"Failed to update reaper state: {e}")
+        if killed:
+            print(f"Cleaned up {killed} leftover process(es) from a previous run")
+        return killed
+
+    def _loop(self) -> None:
+        try:
+            self.cleanup_previous_runs()
+        except Exception as e:
+            print(f"Startup process cleanup failed: {e}")
+        while not self._stop.wait(self.interval):
+            try:
+                self.reap()
+            except Exception as e:
+                print(f"Process reaping failed: {e}")
+
+    def start(self) -> None:
+        """Clean up previous runs and start periodic reaping in the background."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, daemon=True, name="process-reaper")
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    @property
+    def tracked(self) -> Dict[str, List[dict]]:
+        with self._lock:
+            return {key: list(value) for key, value in self._records.items()}
+
+
+_reaper = None
+_reaper_lock = threading.Lock()
+
+
+def get_reaper() -> ProcessReaper:
+    """Return the process-wide reaper, starting it on first use."""
+    global _reaper
+    with _reaper_lock:
+        if _reaper is None:
+            _reaper = ProcessReaper()
+            _reaper.start()
+        return _reaper
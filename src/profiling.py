@@ -0,0 +1,155 @@
+"""
+Opt-in profiling for a launch batch.
+Wraps the batch in cProfile and tracemalloc and writes, next to the launch
+span log in .data/profiles/:
+- <label>-<timestamp>.pstats          (open with `python -m pstats` or snakeviz)
+- <label>-<timestamp>-allocations.txt (top allocation sites grown during the batch)
+
+cProfile only sees the thread it is enabled in, so work handed to the
+LaunchExecutor while a profile is active is profiled on its worker thread
+and merged into the same .pstats file.
+
+When profiling is off, profile_batch() returns a nullcontext and
+profile_in_worker() is one context variable lookup.
+"""
+
+import contextvars
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from typing import Callable, List, Optional
+
+from runtime import DATA_DIR
+
+PROFILE_DIR = os.path.join(DATA_DIR, "profiles")
+TRACEMALLOC_FRAMES = 10
+TOP_ALLOCATIONS = 30
+TOP_FUNCTIONS = 40
+
+_active_profiler = contextvars.ContextVar('batch_profiler', default=None)
+
+
+class BatchProfiler:
+    """Context manager profiling CPU time and allocations of everything run inside it."""
+
+    def __init__(self, label: str = "batch", out_dir: str = PROFILE_DIR):
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.out_dir = out_dir
+        self.stats_path = os.path.join(out_dir, f"{label}-{stamp}.pstats")
+        self.report_path = os.path.join(out_dir, f"{label}-{stamp}-allocations.txt")
+        self._profiles: List[cProfile.Profile] = []
+        self._main_profile = None
+        self._lock = threading.Lock()
+        self._owner = None
+        self._token = None
+        self._started_tracemalloc = False
+        self._baseline = None
+        self._t0 = None
+
+    def _new_profile(self) -> cProfile.Profile:
+        profile = cProfile.Profile()
+        with self._lock:
+            self._profiles.append(profile)
+        return profile
+
+    def run_in_worker(self, fn: Callable, *args, **kwargs):
+        """Run fn with a profile of its own when called from a thread other than the owner."""
+        if threading.get_ident() == self._owner:
+            return fn(*args, **kwargs)
+        profile = self._new_profile()
+        profile.enable()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profile.disable()
+
+    def __enter__(self):
+        self._owner = threading.get_ident()
+        self._t0 = time.perf_counter()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            self._started_tracemalloc = True
+        self._baseline = tracemalloc.take_snapshot()
+        self._token = _active_profiler.set(self)
+        self._main_profile = self._new_profile()
+        self._main_profile.enable()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._main_profile.disable()
+        _active_profiler.reset(self._token)
+        elapsed = time.perf_counter() - self._t0
+        try:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        try:
+            os.makedirs(self.out_dir, exist_ok=True)
+            self._write_stats()
+            self._write_allocations(snapshot, peak, elapsed)
+        except Exception as e:
+            print(f"Failed to write profile: {e}")
+        return False
+
+    def _merged_stats(self, stream=None) -> Optional[pstats.Stats]:
+        with self._lock:
+            profiles = [profile for profile in self._profiles if profile.getstats()]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0], stream=stream)
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def _write_stats(self) -> None:
+        stats = self._merged_stats()
+        if stats is not None:
+            stats.dump_stats(self.stats_path)
+
+    def _write_allocations(self, snapshot, peak: int, elapsed: float) -> None:
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+        snapshot = snapshot.filter_traces(filters)
+        baseline = self._baseline.filter_traces(filters)
+        lines = [
+            f"Batch wall time: {elapsed:.2f} s",
+            f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB",
+            "",
+            f"Top {TOP_ALLOCATIONS} allocation sites grown during the batch:",
+        ]
+        for stat in snapshot.compare_to(baseline, 'lineno')[:TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+        lines += ["", f"Top {TOP_ALLOCATIONS} allocation sites still held at the end:"]
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+        cumulative = io.StringIO()
+        stats = self._merged_stats(stream=cumulative)
+        if stats is not None:
+            stats.sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+            lines += ["", f"Top {TOP_FUNCTIONS} functions by cumulative time (all profiled threads):",
+                      cumulative.getvalue()]
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+
+
+def profile_batch(enabled: bool, label: str = "batch"):
+    """
+    Profiler for a batch when enabled, otherwise a no-op context.
+    Returns:
+        BatchProfiler (with stats_path/report_path) or nullcontext(None)
+    """
+    return BatchProfiler(label) if enabled else nullcontext()
+
+
+def profile_in_worker(fn: Callable) -> Callable:
+    """Bind fn to the batch profile active in the caller's context, if any."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return fn
+    return lambda *args, **kwargs: profiler.run_in_worker(fn, *args, **kwargs)
@@ -0,0 +1,208 @@
+"""
+Shared launcher runtime.
+Keeps one lazily constructed RobloxLauncher per process and detects the default
+automation browser on a background thread, caching the result on disk so later
+startups never wait on webdriver-manager.
+
+Run this module to check that the shared launcher builds without a window:
+    python runtime.py
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".data")
+BROWSER_CACHE_FILE = os.path.join(DATA_DIR, "browser_cache.json")
+BROWSER_CACHE_TTL = 7 * 24 * 3600  # Re-detect once a week
+DETECTION_ORDER = ['chrome', 'edge', 'firefox']
+FALLBACK_BROWSER = 'firefox'
+
+
+def _is_browser_available(browser_type: str) -> bool:
+    """Check if a specific browser driver can be installed."""
+    try:
+        if browser_type == 'chrome':
+            from webdriver_manager.chrome import ChromeDriverManager
+            ChromeDriverManager().install()
+            return True
+        elif browser_type == 'edge':
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager
+            EdgeChromiumDriverManager().install()
+            return True
+        elif browser_type == 'firefox':
+            from webdriver_manager.firefox import GeckoDriverManager
+            GeckoDriverManager().install()
+            return True
+    except Exception:
+        return False
+    return False
+
+
+class BrowserDetector:
+    """
+    Detects the default automation browser in the background.
+    The first detection result is written to BROWSER_CACHE_FILE and reused until
+    it is older than the TTL, so only the very first startup pays for the probe.
+    """
+
+    def __init__(self, cache_file: str = BROWSER_CACHE_FILE, ttl_seconds: int = BROWSER_CACHE_TTL):
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self._result = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._listeners = []
+
+    def _load_cache(self) -> Optional[str]:
+        """Return the cached browser if the cache is fresh."""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if time.time() - cached.get('detected_at', 0) < self.ttl_seconds:
+                browser = cached.get('browser')
+                if browser in DETECTION_ORDER:
+                    return browser
+        except Exception:
+            pass
+        return None
+
+    def _save_cache(self, browser: str) -> None:
+        """Persist the detection result."""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump({'browser': browser, 'detected_at': time.time()}, f)
+        except Exception as e:
+            print(f"Failed to cache browser detection: {e}")
+
+    def _detect(self) -> None:
+        """Probe browsers in order and publish the result."""
+        browser = FALLBACK_BROWSER
+        for candidate in DETECTION_ORDER:
+            if _is_browser_available(candidate):
+                browser = candidate
+                break
+        self._save_cache(browser)
+        self._finish(browser)
+
+    def _finish(self, browser: str) -> None:
+        with self._lock:
+            self._result = browser
+            listeners = list(self._listeners)
+            self._listeners.clear()
+        self._done.set()
+        for listener in listeners:
+            try:
+                listener(browser)
+            except Exception as e:
+                print(f"Browser detection listener failed: {e}")
+
+    def start(self) -> None:
+        """Start detection unless it already ran or is running."""
+        with self._lock:
+            if self._thread is not None or self._done.is_set():
+                return
+            cached = self._load_cache()
+            if cached is None:
+                self._thread = threading.Thread(target=self._detect, daemon=True, name="browser-detect")
+                self._thread.start()
+                return
+        self._finish(cached)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """Call listener(browser) once detection is done (immediately if it already is)."""
+        with self._lock:
+            if not self._done.is_set():
+                self._listeners.append(listener)
+                return
+            browser = self._result
+        listener(browser)
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def get(self, timeout: Optional[float] = None) -> str:
+        """
+        Get the detected browser, waiting for the background probe if needed.
+        Args:
+            timeout: Maximum seconds to wait; None waits indefinitely
+        Returns:
+            Browser name, or the fallback browser if detection has not finished
+        """
+        self.start()
+        self._done.wait(timeout)
+        return self._result or FALLBACK_BROWSER
+
+
+_detector = None
+_launcher = None
+# Separate locks: RobloxLauncher.__init__ asks for the detector while the launcher lock is held
+_detector_lock = threading.Lock()
+_launcher_lock = threading.Lock()
+
+
+def get_browser_detector() -> BrowserDetector:
+    """Return the process-wide browser detector, starting it on first use."""
+    global _detector
+    with _detector_lock:
+        if _detector is None:
+            _detector = BrowserDetector()
+    _detector.start()
+    return _detector
+
+
+def get_launcher(callback=None):
+    """
+    Return the shared RobloxLauncher, constructing it on first use.
+    Args:
+        callback: Status callback; replaces the current one when given
+    Returns:
+        The process-wide RobloxLauncher instance
+    """
+    global _launcher
+    with _launcher_lock:
+        if _launcher is None:
+            from launcher import RobloxLauncher
+            _launcher = RobloxLauncher(callback=callback)
+        elif callback is not None:
+            _launcher.callback = callback
+        return _launcher
+
+
+def check_startup(timeout: float = 30.0) -> int:
+    """
+    Build the shared launcher on a worker thread and report how long it took.
+    Returns:
+        0 when get_launcher() returned within timeout, 1 when it hung or failed
+    """
+    result = {}
+
+    def build():
+        try:
+            started = time.perf_counter()
+            get_launcher(callback=lambda message: None)
+            result['ms'] = (time.perf_counter() - started) * 1000
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=build, daemon=True, name="startup-check")
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        print(f"get_launcher() did not return within {timeout:.0f}s")
+        return 1
+    if 'error' in result:
+        print(f"get_launcher() failed: {result['error']}")
+        return 1
+    print(f"get_launcher() returned in {result['ms']:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(check_startup())
@@ -0,0 +1,191 @@
+"""
+Local stand-in for the Roblox web endpoints the launcher talks to.
+Runs a loopback HTTP server that mimics the CSRF handshake, the
+authentication-ticket exchange, share-link resolution and the
+authenticated-user check, so browserless launches and cookie validation can
+be exercised without touching roblox.com.
+
+Usage:
+    python standin_server.py [port] [valid_cookie ...]
+"""
+
+import hashlib
+import json
+import secrets
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterable, Optional
+
+
+class StandInRobloxServer:
+    """
+    Loopback server implementing the subset of Roblox endpoints used by the
+    launcher. Cookies in valid_cookies are accepted; everything else gets 401.
+    Use as a context manager or call start()/stop().
+    """
+
+    def __init__(self, valid_cookies: Optional[Iterable[str]] = None, port: int = 0,
+                 share_links: Optional[dict] = None):
+        self.valid_cookies = set(valid_cookies or [])
+        self.share_links = dict(share_links or {})  # {share_code: (place_id, link_code)}
+        self.csrf_token = secrets.token_hex(8)
+        self.request_counts = {}  # {path: count}
+        self.issued_tickets = []
+        self._throttle_remaining = 0
+        self._throttle_retry_after = 1
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def endpoints(self) -> dict:
+        """Endpoint table to pass to AuthTicketClient / load_endpoints."""
+        return {
+            'auth_ticket': f"{self.base_url}/v1/authentication-ticket",
+            'place_launcher': f"{self.base_url}/Game/PlaceLauncher.ashx",
+            'resolve_share_link': f"{self.base_url}/sharelinks/v1/resolve-link",
+            'authenticated_user': f"{self.base_url}/v1/users/authenticated",
+            'referer': f"{self.base_url}/",
+        }
+
+    def _count(self, path: str) -> None:
+        with self._lock:
+            self.request_counts[path] = self.request_counts.get(path, 0) + 1
+
+    def throttle_next(self, count: int, retry_after: float = 1) -> None:
+        """Answer the next count requests with 429 and the given Retry-After."""
+        with self._lock:
+            self._throttle_remaining = count
+            self._throttle_retry_after = retry_after
+
+    def _take_throttle(self) -> Optional[float]:
+        with self._lock:
+            if self._throttle_remaining <= 0:
+                return None
+            self._throttle_remaining -= 1
+            return self._throttle_retry_after
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _cookie(self) -> Optional[str]:
+                for part in self.headers.get('Cookie', '').split(';'):
+                    name, _, value = part.strip().partition('=')
+                    if name == '.ROBLOSECURITY':
+                        return value
+                return None
+
+            def _send(self, status: int, body=None, headers: Optional[dict] = None) -> None:
+                payload = json.dumps(body if body is not None else {}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_body(self) -> dict:
+                length = int(self.headers.get('Content-Length') or 0)
+                if not length:
+                    return {}
+                try:
+                    return json.loads(self.rfile.read(length))
+                except ValueError:
+                    return {}
+
+            def do_POST(self):
+                path = self.path.split('?')[0]
+                server._count(path)
+                body = self._read_body()
+                retry_after = server._take_throttle()
+                if retry_after is not None:
+                    self._send(429, {'errors': [{'code': 0, 'message': 'Too many requests'}]},
+                               {'Retry-After': str(retry_after)})
+                    return
+                if path == '/sharelinks/v1/resolve-link':
+                    if self.headers.get('X-CSRF-TOKEN') != server.csrf_token:
+                        self._send(403, {'errors': [{'code': 0, 'message': 'Token Validation Failed'}]},
+                                   {'x-csrf-token': server.csrf_token})
+                        return
+                    if self._cookie() not in server.valid_cookies:
+                        self._send(401, {'errors': [{'code': 0, 'message': 'Authorization has been denied'}]})
+                        return
+                    share = server.share_links.get(body.get('linkId'))
+                    if not share:
+                        self._send(400, {'errors': [{'code': 1, 'message': 'Invalid link'}]})
+                        return
+                    place_id, link_code = share
+                    self._send(200, {'privateServerInviteData': {
+                        'placeId': int(place_id), 'linkCode': link_code, 'status': 'Valid'}})
+                    return
+                if path == '/v1/authentication-ticket':
+                    if self.headers.get('X-CSRF-TOKEN') != server.csrf_token:
+                        self._send(403, {'errors': [{'code': 0, 'message': 'Token Validation Failed'}]},
+                                   {'x-csrf-token': server.csrf_token})
+                        return
+                    if self._cookie() not in server.valid_cookies:
+                        self._send(401, {'errors': [{'code': 0, 'message': 'Authorization has been denied'}]})
+                        return
+                    ticket = secrets.token_hex(32)
+                    with server._lock:
+                        server.issued_tickets.append(ticket)
+                    self._send(200, {}, {'rbx-authentication-ticket': ticket})
+                    return
+                self._send(404, {'errors': [{'code': 0, 'message': 'NotFound'}]})
+
+            def do_GET(self):
+                path = self.path.split('?')[0]
+                server._count(path)
+                if path == '/v1/users/authenticated':
+                    cookie = self._cookie()
+                    if cookie not in server.valid_cookies:
+                        self._send(401, {'errors': [{'code': 0, 'message': 'Authorization has been denied'}]})
+                        return
+                    user_id = int(hashlib.sha256(cookie.encode()).hexdigest()[:8], 16)
+                    self._send(200, {'id': user_id, 'name': f"user{user_id}", 'displayName': f"user{user_id}"})
+                    return
+                self._send(404, {'errors': [{'code': 0, 'message': 'NotFound'}]})
+
+        return Handler
+
+    def start(self) -> "StandInRobloxServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True,
+                                        name="standin-roblox")
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    server = StandInRobloxServer(valid_cookies=sys.argv[2:], port=port).start()
+    print(f"Stand-in Roblox endpoints on {server.base_url}")
+    for name, url in server.endpoints.items():
+        print(f"  RMAM_{name.upper()}_URL={url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
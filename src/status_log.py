@@ -0,0 +1,122 @@
+"""
+Bounded, batched status log for a Tk Text widget.
+Messages from any thread go into a ring buffer; a flush coalesced through
+the UI dispatcher (ui_dispatch.py) drains it once per tick and inserts
+everything queued in a single widget update, and the widget is trimmed to
+max_lines. The full history is written to a rotating
+file (.data/logs/status.log) by a background listener, so neither the UI
+thread nor launch threads wait on disk.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import tkinter as tk
+from collections import deque
+from typing import Callable, Optional
+
+from runtime import DATA_DIR
+
+STATUS_LOG_FILE = os.path.join(DATA_DIR, "logs", "status.log")
+DEFAULT_MAX_LINES = 1000
+LOG_FILE_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+
+class StatusLogView:
+    """
+    Ring-buffered log view.
+    append() is thread-safe and never touches Tk; flushing and trimming
+    happen on the Tk thread, at most once per dispatcher tick.
+    """
+
+    def __init__(self, dispatcher, text_widget: tk.Text, max_lines: int = DEFAULT_MAX_LINES,
+                 log_file: Optional[str] = STATUS_LOG_FILE):
+        self.dispatcher = dispatcher
+        self.text = text_widget
+        self.max_lines = max_lines
+        # Anything older than what the widget can show is dropped before it reaches Tk
+        self._pending = deque(maxlen=max_lines)
+        self._lock = threading.Lock()
+        self._flush_key = ('status_log', id(self))
+        self._line_count = 0
+        self._link_ids = 0
+        self._file_logger, self._listener = self._open_log_file(log_file) if log_file else (None, None)
+
+    def _open_log_file(self, log_file: str):
+        """Rotating history file written by a QueueListener thread."""
+        try:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=LOG_FILE_BYTES,
+                                                           backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
+        except OSError as e:
+            print(f"Status log file unavailable: {e}")
+            return None, None
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        records = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(records, handler)
+        listener.start()
+        atexit.register(self.close)
+        logger = logging.getLogger(f"rmam.status.{id(self)}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(records))
+        return logger, listener
+
+    def append(self, message: str, on_click: Optional[Callable[[], None]] = None) -> None:
+        """
+        Queue a line for the view (and the history file).
+        Args:
+            message: Line of text
+            on_click: Makes the line a link calling this on the Tk thread when clicked
+        """
+        if self._file_logger:
+            self._file_logger.info(message)
+        with self._lock:
+            self._pending.append((message, on_click))
+        self.dispatcher.post(self._flush, key=self._flush_key)
+
+    def _flush(self) -> None:
+        with self._lock:
+            items = list(self._pending)
+            self._pending.clear()
+        if not items:
+            return
+        self.text.config(state=tk.NORMAL)
+        plain = []
+        for message, on_click in items:
+            if on_click is None:
+                plain.append(f"{message}\n")
+                continue
+            if plain:
+                self.text.insert(tk.END, "".join(plain))
+                plain = []
+            self._insert_link(message, on_click)
+        if plain:
+            self.text.insert(tk.END, "".join(plain))
+        self._line_count += sum(message.count('\n') + 1 for message, _ in items)
+        excess = self._line_count - self.max_lines
+        if excess > 0:
+            self.text.delete('1.0', f'{excess + 1}.0')
+            self._line_count -= excess
+        self.text.see(tk.END)
+        self.text.config(state=tk.DISABLED)
+
+    def _insert_link(self, message: str, on_click: Callable[[], None]) -> None:
+        self._link_ids += 1
+        tag = f"link-{self._link_ids}"
+        self.text.insert(tk.END, message, (tag,))
+        self.text.insert(tk.END, "\n")
+        self.text.tag_config(tag, foreground='#0d6efd', underline=True)
+        self.text.tag_bind(tag, '<Button-1>', lambda event: on_click())
+        self.text.tag_bind(tag, '<Enter>', lambda event: self.text.config(cursor='hand2'))
+        self.text.tag_bind(tag, '<Leave>', lambda event: self.text.config(cursor=''))
+
+    def close(self) -> None:
+        """Flush the history file."""
+        if self._listener:
+            self._listener.stop()
+            self._listener = None
@@ -6,18 +6,30 @@ import time
 from pathlib import Path
 from typing import Optional, Tuple
 import platform
+from telemetry import traced
+from metrics import get_registry
+from events import get_event_bus, ISOLATION_SWAPPED
+INSTANCES_DIR = Path(__file__).parent.parent / "roblox_instances"
+# Cache directories that can be deleted from a browser profile without logging the account out
+BROWSER_CACHE_DIR_NAMES = {
+    'Cache', 'Code Cache', 'GPUCache', 'GrShaderCache', 'ShaderCache', 'DawnCache',
+    'CacheStorage', 'ScriptCache', 'cache2', 'startupCache', 'thumbnails',
+}
 class StorageManager:
     """
     Manages symbolic link creation and cleanup for Roblox LocalStorage isolation.
     Provides safe symlink operations with proper error handling and rollback.
     """
-    def __init__(self):
+    def __init__(self, metrics=None, events=None):
         self.base_dir = Path(__file__).parent.parent
-        self.instances_dir = self.base_dir / "roblox_instances"
+        self.instances_dir = INSTANCES_DIR
         self.instances_dir.mkdir(exist_ok=True)
         self.roblox_localappdata = Path(os.environ.get('LOCALAPPDATA', '')) / "Roblox"
         self.roblox_localstorage = self.roblox_localappdata / "LocalStorage"
         self.active_symlinks = {}  # {account_name: original_path}
+        self._isolation_swaps = (metrics or get_registry()).counter(
+            'rmam_isolation_swaps_total', 'LocalStorage isolation setups and teardowns', ('action', 'outcome'))
+        self.events = events or get_event_bus()
     def _is_windows(self) -> bool:
         """Check if running on Windows."""
         return platform.system().lower() == 'windows'
@@ -103,6 +115,11 @@ class StorageManager:
         except Exception as e:
             print(f"Unexpected error creating Unix symlink: {e}")
             return False
+    def _record_swap(self, account_name: str, action: str, ok: bool) -> None:
+        """Count an isolation setup/teardown and publish it as an isolation_swapped event."""
+        self._isolation_swaps.inc(action=action, outcome='success' if ok else 'failure')
+        self.events.publish(ISOLATION_SWAPPED, account_name, action=action, ok=ok)
+    @traced('isolation_setup', outcome=lambda result: result[0])
     def create_storage_isolation(self, account_name: str) -> Tuple[bool, Optional[Path]]:
         """
         Create LocalStorage isolation for a specific account using symbolic links.
@@ -132,6 +149,7 @@ class StorageManager:
                     print(f"🗑️ Removed existing LocalStorage")
                 except Exception as e:
                     print(f"Failed to remove existing LocalStorage: {e}")
+                    self._record_swap(account_name, 'setup', False)
                     return False, backup_path
             self.roblox_localstorage.parent.mkdir(parents=True, exist_ok=True)
             success = False
@@ -143,6 +161,7 @@ class StorageManager:
                 self.active_symlinks[account_name] = str(isolated_localstorage)
                 print(f"Symlink created successfully")
                 print(f"   {self.roblox_localstorage} → {isolated_localstorage}")
+                self._record_swap(account_name, 'setup', True)
                 return True, backup_path
             else:
                 print(f"Failed to create symlink")
@@ -152,10 +171,13 @@ class StorageManager:
                         print(f"🔄 Restored backup from: {backup_path}")
                     except Exception as e:
                         print(f"Warning: Could not restore backup: {e}")
+                self._record_swap(account_name, 'setup', False)
                 return False, backup_path
         except Exception as e:
             print(f"Storage isolation failed for {account_name}: {e}")
+            self._record_swap(account_name, 'setup', False)
             return False, None
+    @traced('isolation_teardown', outcome=bool)
     def remove_storage_isolation(self, account_name: str, restore_backup: bool = False, backup_path: Optional[Path] = None) -> bool:
         """
         Remove LocalStorage isolation by removing the symlink.
@@ -180,9 +202,11 @@ class StorageManager:
                 except Exception as e:
                     print(f"Warning: Could not restore backup: {e}")
             print(f"Storage isolation cleanup completed for {account_name}")
+            self._record_swap(account_name, 'teardown', True)
             return True
         except Exception as e:
             print(f"Cleanup failed for {account_name}: {e}")
+            self._record_swap(account_name, 'teardown', False)
             return False
     def cleanup_all_isolations(self) -> int:
         """
@@ -239,6 +263,84 @@ class StorageManager:
             Path to the Roblox LocalStorage directory
         """
         return self.roblox_localstorage
+    def get_browser_profile_dir(self, account_name: str, browser_type: str) -> Path:
+        """
+        Get (and create) the persistent browser profile directory for an account.
+        Profiles live under roblox_instances/<account>/browser/<browser_type>,
+        since Chromium and Firefox profiles aren't interchangeable.
+        Args:
+            account_name: Name of the account
+            browser_type: Browser engine the profile belongs to
+        Returns:
+            Path to the profile directory
+        """
+        profile_dir = self.instances_dir / self._sanitize_account_name(account_name) / "browser" / browser_type
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        return profile_dir
+    def _directory_size(self, path: Path) -> int:
+        """Total size in bytes of all files under path."""
+        total = 0
+        for root, _, files in os.walk(path):
+            for name in files:
+                try:
+                    total += os.path.getsize(os.path.join(root, name))
+                except OSError:
+                    continue
+        return total
+    def get_browser_profile_size(self, account_name: str) -> int:
+        """
+        Get the size of all persistent browser profiles for an account.
+        Args:
+            account_name: Name of the account
+        Returns:
+            Size in bytes (0 if there is no profile)
+        """
+        browser_dir = self.instances_dir / self._sanitize_account_name(account_name) / "browser"
+        if not browser_dir.exists():
+            return 0
+        return self._directory_size(browser_dir)
+    def enforce_browser_profile_cap(self, account_name: str, max_bytes: int) -> int:
+        """
+        Keep an account's browser profiles under max_bytes.
+        Cache directories are pruned first; if that is not enough the whole
+        profile is reset.
+        Args:
+            account_name: Name of the account
+            max_bytes: Size cap in bytes
+        Returns:
+            Profile size in bytes after enforcement
+        """
+        size = self.get_browser_profile_size(account_name)
+        if size <= max_bytes:
+            return size
+        browser_dir = self.instances_dir / self._sanitize_account_name(account_name) / "browser"
+        print(f"Browser profile for {account_name} is {size // (1024 * 1024)} MB, pruning caches")
+        for root, dirs, _ in os.walk(browser_dir):
+            for name in [d for d in dirs if d in BROWSER_CACHE_DIR_NAMES]:
+                shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+                dirs.remove(name)
+        size = self.get_browser_profile_size(account_name)
+        if size > max_bytes:
+            self.reset_browser_profile(account_name)
+            size = 0
+        return size
+    def reset_browser_profile(self, account_name: str) -> bool:
+        """
+        Delete all persistent browser profiles for an account.
+        Args:
+            account_name: Name of the account
+        Returns:
+            True if the profile is gone, False otherwise
+        """
+        browser_dir = self.instances_dir / self._sanitize_account_name(account_name) / "browser"
+        try:
+            if browser_dir.exists():
+                shutil.rmtree(browser_dir)
+                print(f"Reset browser profile for {account_name}")
+            return True
+        except Exception as e:
+            print(f"Failed to reset browser profile for {account_name}: {e}")
+            return False
     def get_isolation_info(self, account_name: str) -> dict:
         """
         Get detailed information about an account's isolation.
@@ -0,0 +1,237 @@
+"""
+Per-phase launch timeline.
+Each launch phase (driver setup, cookie injection, navigation, protocol
+trigger, PID detection, isolation setup/teardown, ...) is recorded as a span
+with account, batch, duration and outcome, appended as one JSON line to
+.data/launch_spans.jsonl.
+
+Summarize with:
+    python telemetry.py [--batch N] [--hours H] [--file PATH]
+"""
+
+import argparse
+import contextlib
+import contextvars
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+from runtime import DATA_DIR
+from events import PHASE_COMPLETED, get_event_bus
+
+SPANS_FILE = os.path.join(DATA_DIR, "launch_spans.jsonl")
+MAX_SPANS_FILE_BYTES = 20 * 1024 * 1024  # Rotated to .1 above this size
+
+_current_batch = contextvars.ContextVar('launch_batch', default=None)
+_phase_sink = contextvars.ContextVar('launch_phases', default=None)
+# Span fields that attributes can't overwrite (account/kind/message are Event fields)
+_RESERVED_ATTRS = frozenset({'phase', 'account', 'batch', 'start', 'duration_ms', 'ok', 'kind', 'message'})
+
+
+def set_batch(batch_id) -> None:
+    """Tag spans recorded from this context (and work submitted from it) with a batch id."""
+    _current_batch.set(batch_id)
+
+
+@contextlib.contextmanager
+def collect_phases(sink: list):
+    """
+    Also append the fields of every span ended in this context (including work
+    it submits to the launch executor) to sink, as dicts with phase, batch,
+    duration_ms, ok and the span's attributes.
+    """
+    token = _phase_sink.set(sink)
+    try:
+        yield sink
+    finally:
+        _phase_sink.reset(token)
+
+
+class Span:
+    """One timed phase; end() it or use it as a context manager."""
+
+    __slots__ = ('recorder', 'phase', 'account', 'attrs', 'started_at', '_t0', 'ended')
+
+    def __init__(self, recorder: "SpanRecorder", phase: str, account: Optional[str], attrs: dict):
+        self.recorder = recorder
+        self.phase = phase
+        self.account = account
+        self.attrs = attrs
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self.ended = False
+
+    def end(self, ok: bool = True, **attrs) -> float:
+        """
+        Finish the span and write it; later calls are ignored.
+        Returns:
+            Duration in milliseconds
+        """
+        duration_ms = (time.perf_counter() - self._t0) * 1000
+        if self.ended:
+            return duration_ms
+        self.ended = True
+        batch = _current_batch.get()
+        # End attrs override start attrs; neither may override the span's own fields
+        extra = {key: value for key, value in {**self.attrs, **attrs}.items() if key not in _RESERVED_ATTRS}
+        fields = {
+            'phase': self.phase,
+            'batch': batch,
+            'duration_ms': round(duration_ms, 1),
+            'ok': bool(ok),
+            **extra,
+        }
+        self.recorder.write({'account': self.account, 'start': round(self.started_at, 3), **fields})
+        sink = _phase_sink.get()
+        if sink is not None:
+            sink.append(fields)
+        self.recorder.events.publish(PHASE_COMPLETED, self.account, **fields)
+        return duration_ms
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.end()
+        else:
+            self.end(ok=False, error=str(exc))
+        return False
+
+
+class SpanRecorder:
+    """Appends spans to a JSONL file from any thread and publishes them as phase_completed events."""
+
+    def __init__(self, path: str = SPANS_FILE, max_bytes: int = MAX_SPANS_FILE_BYTES, events=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = True
+        self.events = events or get_event_bus()
+        self._lock = threading.Lock()
+
+    def start(self, phase: str, account: Optional[str] = None, **attrs) -> Span:
+        return Span(self, phase, account, attrs)
+
+    def write(self, record: dict) -> None:
+        if not self.enabled:
+            return
+        line = json.dumps(record, default=str) + "\n"
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                    os.replace(self.path, f"{self.path}.1")
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+        except Exception as e:
+            print(f"Failed to write launch span: {e}")
+
+
+_recorder = SpanRecorder()
+
+
+def get_recorder() -> SpanRecorder:
+    return _recorder
+
+
+def start_span(phase: str, account: Optional[str] = None, **attrs) -> Span:
+    """Start a span on the shared recorder."""
+    return _recorder.start(phase, account, **attrs)
+
+
+def traced(phase: str, outcome: Optional[Callable] = None):
+    """
+    Decorator recording a method call as a span.
+    The account is taken from the account_name argument; outcome maps the
+    return value to ok/failed (exceptions always count as failed).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            account = kwargs.get('account_name', args[0] if args else None)
+            with start_span(phase, account) as span:
+                result = fn(self, *args, **kwargs)
+                span.end(ok=outcome(result) if outcome else True)
+                return result
+        return wrapper
+    return decorator
+
+
+def load_spans(path: str = SPANS_FILE, batch=None, since: Optional[float] = None) -> List[dict]:
+    """Read spans (including the rotated file), optionally filtered by batch and start time."""
+    spans = []
+    for file_path in (f"{path}.1", path):
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if batch is not None and str(record.get('batch')) != str(batch):
+                    continue
+                if since is not None and record.get('start', 0) < since:
+                    continue
+                spans.append(record)
+    return spans
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(ordered) - 1, int(-(-fraction * len(ordered) // 1)) - 1))
+    return ordered[index]
+
+
+def summarize(spans: List[dict]) -> dict:
+    """
+    Aggregate durations per phase.
+    Returns:
+        {phase: {'count', 'failures', 'p50', 'p95', 'p99', 'total_ms'}}
+    """
+    by_phase = {}
+    for record in spans:
+        by_phase.setdefault(record['phase'], []).append(record)
+    summary = {}
+    for phase, records in by_phase.items():
+        durations = sorted(record['duration_ms'] for record in records)
+        summary[phase] = {
+            'count': len(records),
+            'failures': sum(1 for record in records if not record.get('ok', True)),
+            'p50': _percentile(durations, 0.50),
+            'p95': _percentile(durations, 0.95),
+            'p99': _percentile(durations, 0.99),
+            'total_ms': sum(durations),
+        }
+    return summary
+
+
+def format_summary(summary: dict) -> str:
+    lines = [f"{'phase':<22}{'count':>7}{'fail':>6}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}"]
+    for phase, stats in sorted(summary.items(), key=lambda item: -item[1]['total_ms']):
+        lines.append(f"{phase:<22}{stats['count']:>7}{stats['failures']:>6}"
+                     f"{stats['p50']:>11.0f}{stats['p95']:>11.0f}{stats['p99']:>11.0f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Summarize launch phase timings")
+    parser.add_argument('--file', default=SPANS_FILE)
+    parser.add_argument('--batch', help='only spans from this launch-queue batch id')
+    parser.add_argument('--hours', type=float, help='only spans from the last N hours')
+    args = parser.parse_args(argv)
+    since = time.time() - args.hours * 3600 if args.hours else None
+    spans = load_spans(args.file, batch=args.batch, since=since)
+    if not spans:
+        print("No launch spans recorded yet")
+        return 1
+    print(format_summary(summarize(spans)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Thread-safe UI dispatch queue.
+Worker threads post callables instead of calling root.after() themselves;
+the Tk main loop drains the queue on a fixed tick. Posts made with a key are
+coalesced so only the latest one per key runs in a tick (button states,
+flushing the status log), and plain posts are capped per tick, so the UI
+work done per frame stays bounded however many workers are reporting.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Hashable, Optional
+
+TICK_MS = 16  # ~60 fps
+MAX_CALLS_PER_TICK = 200  # Unkeyed calls beyond this wait for the next tick
+
+
+class UIDispatcher:
+    """Runs posted callables on the Tk thread, a bounded batch per tick (keyed calls after plain ones)."""
+
+    def __init__(self, root, tick_ms: int = TICK_MS, max_calls_per_tick: int = MAX_CALLS_PER_TICK):
+        self.root = root
+        self.tick_ms = tick_ms
+        self.max_calls_per_tick = max_calls_per_tick
+        self._calls = deque()
+        self._keyed = OrderedDict()  # {key: (fn, args, kwargs)}; re-posting a key replaces it in place
+        self._lock = threading.Lock()
+        self._running = False
+        self.coalesced = 0  # Keyed posts superseded before they ran
+
+    def post(self, fn: Callable, *args, key: Optional[Hashable] = None, **kwargs) -> None:
+        """
+        Queue fn(*args, **kwargs) for the next tick; safe from any thread.
+        Args:
+            fn: Callable that touches Tk widgets
+            key: Posts sharing a key are coalesced; only the latest runs in a tick
+        """
+        with self._lock:
+            if key is None:
+                self._calls.append((fn, args, kwargs))
+            else:
+                if key in self._keyed:
+                    self.coalesced += 1
+                self._keyed[key] = (fn, args, kwargs)
+
+    def start(self) -> None:
+        """Begin draining on the Tk thread (call from the main thread)."""
+        if not self._running:
+            self._running = True
+            self.root.after(self.tick_ms, self._tick)
+
+    def stop(self) -> None:
+        self._running = False
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._keyed)
+
+    def _tick(self) -> None:
+        if not self._running:
+            return
+        try:
+            self.drain()
+        finally:
+            self.root.after(self.tick_ms, self._tick)
+
+    def drain(self) -> int:
+        """
+        Run one tick's worth of queued calls on the calling (Tk) thread.
+        Returns:
+            Number of calls run
+        """
+        with self._lock:
+            count = min(len(self._calls), self.max_calls_per_tick)
+            calls = [self._calls.popleft() for _ in range(count)]
+            keyed = list(self._keyed.values())
+            self._keyed.clear()
+        for fn, args, kwargs in calls + keyed:
+            try:
+                fn(*args, **kwargs)
+            except Exception as e:
+                print(f"UI callback failed: {e}")
+        return len(calls) + len(keyed)